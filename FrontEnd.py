@@ -46,11 +46,7 @@ from pyVHDLParser.Functions          import Console, Exit
 
 Console.init()
 
-for block in MetaBlock.BLOCKS:
-	try:
-		block.__cls_init__()
-	except AttributeError:
-		pass
+MetaBlock.Initialize()
 
 rootDirectory = Path(".")
 vhdlDirectory = rootDirectory / "vhdl"
@@ -75,10 +71,10 @@ with file.open('r') as fileHandle:
 
 # ==============================================================================
 if (mode & 6 == 2):
-	from pyVHDLParser.Token.Parser  import Tokenizer
+	from pyVHDLParser.Token.Parser  import TableDrivenTokenizer
 
 	print("{RED}{line}{NOCOLOR}".format(line="="*160, **Console.Foreground))
-	vhdlTokenStream = Tokenizer.GetVHDLTokenizer(content)
+	vhdlTokenStream = TableDrivenTokenizer.GetVHDLTokenizer(content)
 
 	try:
 		for vhdlToken in vhdlTokenStream:
@@ -101,7 +97,7 @@ if (mode & 6 == 2):
 
 	if (mode & 1 == 1):
 		print("{RED}{line}{NOCOLOR}".format(line="=" * 160, **Console.Foreground))
-		vhdlTokenStream = Tokenizer.GetVHDLTokenizer(content)
+		vhdlTokenStream = TableDrivenTokenizer.GetVHDLTokenizer(content)
 
 		try:
 			tokenIterator = iter(vhdlTokenStream)
@@ -161,11 +157,11 @@ if (mode & 6 == 2):
 
 # ==============================================================================
 if (mode & 6 == 4):
-	from pyVHDLParser.Token.Parser  import Tokenizer
+	from pyVHDLParser.Token.Parser  import TableDrivenTokenizer
 	from pyVHDLParser.Blocks import TokenToBlockParser
 
 	print("{RED}{line}{NOCOLOR}".format(line="="*160, **Console.Foreground))
-	vhdlTokenStream = Tokenizer.GetVHDLTokenizer(content)
+	vhdlTokenStream = TableDrivenTokenizer.GetVHDLTokenizer(content)
 	vhdlBlockStream = TokenToBlockParser.Transform(vhdlTokenStream, debug=(mode & 1 == 1))
 
 	try:
@@ -191,11 +187,11 @@ if (mode & 6 == 4):
 		print("{RED}NotImplementedError: {0!s}{NOCOLOR}".format(ex, **Console.Foreground))
 
 if (mode & 6 == 6):
-	from pyVHDLParser.Token.Parser  import Tokenizer
+	from pyVHDLParser.Token.Parser  import TableDrivenTokenizer
 	from pyVHDLParser.Blocks import TokenToBlockParser
 
 	print("{RED}{line}{NOCOLOR}".format(line="="*160, **Console.Foreground))
-	vhdlTokenStream = Tokenizer.GetVHDLTokenizer(content)
+	vhdlTokenStream = TableDrivenTokenizer.GetVHDLTokenizer(content)
 	vhdlBlockStream = TokenToBlockParser.Transform(vhdlTokenStream, debug=(mode & 1 == 1))
 
 	try:
@@ -264,7 +260,7 @@ if (mode & 6 == 6):
 
 # ==============================================================================
 	print("{RED}{line}{NOCOLOR}".format(line="="*160, **Console.Foreground))
-	vhdlTokenStream = Tokenizer.GetVHDLTokenizer(content)
+	vhdlTokenStream = TableDrivenTokenizer.GetVHDLTokenizer(content)
 	vhdlBlockStream = TokenToBlockParser.Transform(vhdlTokenStream, debug=(mode & 1 == 1))
 
 	try:
@@ -292,13 +288,13 @@ if (mode & 6 == 6):
 
 # ==============================================================================
 if (mode & 8 == 8):
-	from pyVHDLParser.Token.Parser  import Tokenizer
+	from pyVHDLParser.Token.Parser  import TableDrivenTokenizer
 	from pyVHDLParser.Blocks        import TokenToBlockParser
 	from pyVHDLParser.Groups import BlockToGroupParser, StartOfDocumentGroup, EndOfDocumentGroup, Group
 
 	print("{RED}{line}{NOCOLOR}".format(line="="*160, **Console.Foreground))
 	try:
-		vhdlTokenStream = [token for token in Tokenizer.GetVHDLTokenizer(content)]
+		vhdlTokenStream = [token for token in TableDrivenTokenizer.GetVHDLTokenizer(content)]
 		vhdlBlockStream = [block for block in TokenToBlockParser.Transform(vhdlTokenStream)]
 	except ParserException as ex:
 		print("{RED}ERROR: {0!s}{NOCOLOR}".format(ex, **Console.Foreground))
@@ -329,13 +325,13 @@ if (mode & 8 == 8):
 
 # ==============================================================================
 if (mode & 16 == 16):
-	from pyVHDLParser.Token.Parser  import Tokenizer
+	from pyVHDLParser.Token.Parser  import TableDrivenTokenizer
 	from pyVHDLParser.Blocks        import TokenToBlockParser
 	from pyVHDLParser.Groups        import BlockToGroupParser, StartOfDocumentGroup, EndOfDocumentGroup, Group
 
 	print("{RED}{line}{NOCOLOR}".format(line="="*160, **Console.Foreground))
 
-	vhdlTokenStream = Tokenizer.GetVHDLTokenizer(content)
+	vhdlTokenStream = TableDrivenTokenizer.GetVHDLTokenizer(content)
 	vhdlBlockStream = TokenToBlockParser.Transform(vhdlTokenStream)
 	vhdlGroupStream = BlockToGroupParser.Transform(vhdlBlockStream)
 	groups =          [group for group in vhdlGroupStream]
@@ -0,0 +1,126 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+#
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   Parse many VHDL files in parallel.
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+from concurrent.futures import ProcessPoolExecutor
+from functools          import partial
+from os                 import cpu_count
+from pathlib            import Path
+
+
+class FileResult:
+	"""Picklable summary of a parsed file: the names of its design units and references, or the error, which stopped parsing."""
+
+	def __init__(self, path):
+		self.Path =           path
+		self.Error =          None
+		self.Libraries =      ()
+		self.Uses =           ()
+		self.Entities =       ()
+		self.Architectures =  ()
+		self.Packages =       ()
+		self.PackageBodies =  ()
+		self.Diagnostics =    ()
+
+	def __repr__(self):
+		return "<FileResult {path!s}: {state}>".format(path=self.Path, state=("ok" if (self.Error is None) else self.Error))
+
+	@property
+	def Failed(self):
+		return self.Error is not None
+
+	@classmethod
+	def FromDocument(cls, path, document):
+		result =                cls(path)
+		result.Libraries =      tuple(library.Library for library in document.Libraries)
+		result.Uses =           tuple((use.Library, use.Package, use.Item) for use in document.Uses)
+		result.Entities =       tuple(entity.Name for entity in document.Entities)
+		result.Architectures =  tuple((architecture.Name, architecture.Entity) for architecture in document.Architectures)
+		result.Packages =       tuple(package.Name for package in document.Packages)
+		result.PackageBodies =  tuple(packageBody.Name for packageBody in document.PackageBodies)
+		result.Diagnostics =    tuple("{0!s}: {1}".format(block.StartToken.Start, block.Message) for block in document.Diagnostics)
+		return result
+
+
+def ParseFile(path, cache=None, recover=False):
+	"""Parse a single file into a DocumentModel and return a :class:`FileResult`.
+
+	Exceptions are caught and reported as text, as parser exceptions carry tokens, blocks or groups, which would pull the
+	whole document into the pickled result. 'cache' is an optional :class:`pyVHDLParser.DocumentModel.Cache.ParseCache`.
+	If 'recover' is true, the block parser skips erroneous statements, which are reported as text in ``Diagnostics``.
+	"""
+	from pyVHDLParser.DocumentModel import Document
+
+	path = Path(path)
+	try:
+		document = Document(path, cache=cache, recover=recover)
+		document.Parse()
+	except Exception as ex:
+		result =        FileResult(path)
+		result.Error =  "{0}: {1!s}".format(ex.__class__.__name__, ex)
+		return result
+
+	return FileResult.FromDocument(path, document)
+
+
+def _MapFiles(function, paths, workers, chunkSize):
+	paths = list(paths)
+	if (workers is None):
+		workers = cpu_count() or 1
+
+	if ((workers == 1) or (len(paths) <= 1)):
+		return [function(path) for path in paths]
+
+	if (chunkSize is None):
+		chunkSize = max(1, len(paths) // (workers * 4))
+
+	with ProcessPoolExecutor(max_workers=workers) as executor:
+		return list(executor.map(function, paths, chunksize=chunkSize))
+
+
+def ParseFiles(paths, workers=None, chunkSize=None, cache=None, recover=False):
+	"""Parse files in a pool of 'workers' processes and return a list of :class:`FileResult` in the order of 'paths'.
+
+	'workers' defaults to the number of CPUs. With one worker, files are parsed in the calling process. 'chunkSize' is
+	the number of files sent to a worker at once; by default each worker gets about 4 chunks. All workers share the
+	optional parse 'cache'. 'recover' is passed to :func:`ParseFile`.
+	"""
+	return _MapFiles(partial(ParseFile, cache=cache, recover=recover), paths, workers, chunkSize)
+
+
+def ScanFiles(paths, workers=None, chunkSize=None):
+	"""Scan files like :func:`ParseFiles`, but by :func:`pyVHDLParser.Dependencies.ScanFile` without building a DocumentModel.
+
+	Returns a list of :class:`~pyVHDLParser.Dependencies.DependencySummary` in the order of 'paths'. Unlike a parsed
+	:class:`FileResult`, a summary also lists contexts, configurations and instantiations, but its ``Diagnostics`` are
+	always empty, as the scanner doesn't recover from errors.
+	"""
+	from pyVHDLParser.Dependencies import ScanFile
+
+	return _MapFiles(ScanFile, paths, workers, chunkSize)
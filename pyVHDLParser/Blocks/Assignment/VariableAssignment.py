@@ -104,7 +104,7 @@ class SignalAssignmentBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -182,7 +182,7 @@ class SignalAssignmentBlock(Block):
 				return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -104,7 +104,7 @@ class AttributeSpecificationBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -184,7 +184,7 @@ class AttributeSpecificationBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -261,7 +261,7 @@ class AttributeSpecificationBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -337,7 +337,7 @@ class AttributeSpecificationBlock(Block):
 				return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -419,7 +419,7 @@ class AttributeSpecificationBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -28,8 +28,9 @@
 # ==============================================================================
 #
 # load dependencies
-from pyVHDLParser.Token     import SpaceToken, IndentationToken
-from pyVHDLParser.Blocks    import ParserState, SkipableBlock
+from pyVHDLParser           import TypeDispatchMap
+from pyVHDLParser.Token     import SpaceToken, IndentationToken, LinebreakToken, CommentToken
+from pyVHDLParser.Blocks    import ParserState, SkipableBlock, CommentBlock
 
 
 class WhitespaceBlock(SkipableBlock):
@@ -83,3 +84,20 @@ class IndentationBlock(WhitespaceBlock):
 				start=self.StartToken.Start,
 				end=self.EndToken.End
 			)
+
+
+# Block types for whitespace, linebreak and comment tokens, resolved by the exact token class.
+SPACE_BLOCKS = TypeDispatchMap({
+	SpaceToken:       WhitespaceBlock,
+	IndentationToken: IndentationBlock
+})
+LINEBREAK_COMMENT_BLOCKS = TypeDispatchMap({
+	LinebreakToken:   LinebreakBlock,
+	CommentToken:     CommentBlock
+})
+TRIVIA_BLOCKS = TypeDispatchMap({
+	SpaceToken:       WhitespaceBlock,
+	IndentationToken: IndentationBlock,
+	LinebreakToken:   LinebreakBlock,
+	CommentToken:     CommentBlock
+})
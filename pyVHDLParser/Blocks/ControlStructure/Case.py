@@ -30,8 +30,8 @@
 # load dependencies
 from pyVHDLParser.Token               import CharacterToken, LinebreakToken, SpaceToken, IndentationToken, CommentToken, MultiLineCommentToken, SingleLineCommentToken
 from pyVHDLParser.Token.Keywords      import StringToken, BoundaryToken, CaseKeyword, WhenKeyword, OthersKeyword, IsKeyword, EndKeyword, MapAssociationKeyword
-from pyVHDLParser.Blocks              import TokenParserException, Block, CommentBlock, ParserState
-from pyVHDLParser.Blocks.Common       import LinebreakBlock, IndentationBlock, WhitespaceBlock
+from pyVHDLParser.Blocks              import TokenParserException, Block, CommentBlock, ParserState, ResumableState
+from pyVHDLParser.Blocks.Common       import LinebreakBlock, IndentationBlock, WhitespaceBlock, SPACE_BLOCKS, LINEBREAK_COMMENT_BLOCKS
 from pyVHDLParser.Blocks.Generic      import SequentialBeginBlock
 from pyVHDLParser.Blocks.Generic1     import EndBlock as EndBlockBase
 from pyVHDLParser.Blocks.Expression   import ExpressionBlockEndedByCharORClosingRoundBracket, ExpressionBlockEndedByKeywordORClosingRoundBracket
@@ -50,6 +50,7 @@ class ArrowBlock(SequentialBeginBlock):
 		cls.stateSequentialRegion(parserState)
 
 	@classmethod
+	@ResumableState
 	def stateSequentialRegion(cls, parserState: ParserState):
 		token = parserState.Token
 		if (isinstance(token, StringToken)and (token <= "when")):
@@ -85,8 +86,8 @@ class WhenBlock(SequentialBeginBlock):
 			parserState.NewToken =    BoundaryToken(token)
 			parserState.NextState =   cls.stateWhitespace1
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                   LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken, multiPart=True)
 			_ =                       block(parserState.NewBlock, token)
 			parserState.TokenMarker = None
@@ -120,7 +121,7 @@ class WhenBlock(SequentialBeginBlock):
 			return
 		elif (isinstance(token, SpaceToken) and (isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 			parserState.NewToken =    BoundaryToken(token)
-			parserState.NewBlock =    WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker = None
 			return
 		else:
@@ -139,13 +140,13 @@ class IsBlock(SequentialBeginBlock):
 	def stateIsKeyword(cls, parserState: ParserState):
 		token = parserState.Token
 		if isinstance(token, SpaceToken):
-			blockType =               IndentationBlock if isinstance(token, IndentationToken) else WhitespaceBlock
-			parserState.NewBlock =    blockType(parserState.LastBlock, token)
+			blockType =               SPACE_BLOCKS[token.__class__]
+			parserState.AddTriviaBlock(blockType, token)
 			parserState.TokenMarker = None
 			parserState.NextState =   cls.stateWhitespace1
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                   LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =    block(parserState.LastBlock, token)
 			parserState.TokenMarker = None
 			parserState.NextState =   cls.stateWhitespace1
@@ -157,7 +158,7 @@ class IsBlock(SequentialBeginBlock):
 	def stateWhitespace1(cls, parserState: ParserState):
 		token = parserState.Token
 		if isinstance(token, StringToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.LowerValue
 			if (tokenValue == "when"):
 				newToken =                WhenKeyword(token)
 				parserState.NewToken =    newToken
@@ -185,7 +186,7 @@ class IsBlock(SequentialBeginBlock):
 			return
 		elif (isinstance(token, SpaceToken) and (isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -212,8 +213,8 @@ class CaseBlock(Block):
 			parserState.NewToken =    BoundaryToken(token)
 			parserState.NextState =   cls.stateWhitespace1
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                   LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken, multiPart=True)
 			_ =                       block(parserState.NewBlock, token)
 			parserState.TokenMarker = None
@@ -247,7 +248,7 @@ class CaseBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and (isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 		else:
@@ -30,8 +30,8 @@
 # load dependencies
 from pyVHDLParser.Token               import CharacterToken, LinebreakToken, SpaceToken, IndentationToken, CommentToken, MultiLineCommentToken, SingleLineCommentToken
 from pyVHDLParser.Token.Keywords      import StringToken, BoundaryToken, IfKeyword, ThenKeyword, ElsIfKeyword, ElseKeyword
-from pyVHDLParser.Blocks              import TokenParserException, Block, CommentBlock, ParserState
-from pyVHDLParser.Blocks.Common       import LinebreakBlock, IndentationBlock, WhitespaceBlock
+from pyVHDLParser.Blocks              import TokenParserException, Block, CommentBlock, ParserState, ResumableState
+from pyVHDLParser.Blocks.Common       import LinebreakBlock, IndentationBlock, WhitespaceBlock, LINEBREAK_COMMENT_BLOCKS
 from pyVHDLParser.Blocks.Generic      import SequentialBeginBlock
 from pyVHDLParser.Blocks.Generic1     import EndBlock as EndBlockBase
 from pyVHDLParser.Blocks.Expression   import ExpressionBlockEndedByKeywordORClosingRoundBracket
@@ -50,10 +50,11 @@ class ThenBlock(SequentialBeginBlock):
 		cls.stateSequentialRegion(parserState)
 
 	@classmethod
+	@ResumableState
 	def stateSequentialRegion(cls, parserState: ParserState):
 		token = parserState.Token
 		if isinstance(token, StringToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.LowerValue
 
 			if (tokenValue == "elsif"):
 				newToken =                ElsIfKeyword(token)
@@ -100,8 +101,8 @@ class IfConditionBlock(Block):
 			parserState.NewToken =    BoundaryToken(token)
 			parserState.NextState =   cls.stateWhitespace1
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                   LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken, multiPart=True)
 			_ =                       block(parserState.NewBlock, token)
 			parserState.TokenMarker = None
@@ -135,7 +136,7 @@ class IfConditionBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and (isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 		else:
@@ -162,8 +163,8 @@ class ElsIfConditionBlock(Block):
 			parserState.NewToken =    BoundaryToken(token)
 			parserState.NextState =   cls.stateWhitespace1
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                   LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken, multiPart=True)
 			_ =                       block(parserState.NewBlock, token)
 			parserState.TokenMarker = None
@@ -197,7 +198,7 @@ class ElsIfConditionBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and (isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 		else:
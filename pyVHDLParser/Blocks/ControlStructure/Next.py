@@ -32,7 +32,7 @@ from pyVHDLParser.Token             import SpaceToken, LinebreakToken, CommentTo
 from pyVHDLParser.Token             import StringToken, ExtendedIdentifier, CharacterToken
 from pyVHDLParser.Token.Keywords    import BoundaryToken, IdentifierToken, EndToken, WhenKeyword
 from pyVHDLParser.Blocks            import Block, ParserState, CommentBlock, TokenParserException
-from pyVHDLParser.Blocks.Common     import LinebreakBlock, WhitespaceBlock
+from pyVHDLParser.Blocks.Common     import LinebreakBlock, WhitespaceBlock, LINEBREAK_COMMENT_BLOCKS
 from pyVHDLParser.Blocks.Generic1   import EndOfStatementBlock
 from pyVHDLParser.Blocks.Expression import ExpressionBlockEndedBySemicolon
 
@@ -60,8 +60,8 @@ class NextBlock(Block):
 			# parserState.TokenMarker = None
 			parserState.NextState =   cls.stateWhitespace1
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                   LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken, multiPart=True)
 			_ =                       block(parserState.NewBlock, token)
 			parserState.TokenMarker = None
@@ -91,8 +91,8 @@ class NextBlock(Block):
 		elif isinstance(token, ExtendedIdentifier):
 			parserState.NextState =   cls.stateNextLoopLabel
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                   LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =    block(parserState.LastBlock, token)
 			parserState.TokenMarker = None
 			return
@@ -100,7 +100,7 @@ class NextBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and (isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 			parserState.NewToken =    BoundaryToken(token)
-			parserState.NewBlock =    WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker = None
 			return
 
@@ -120,8 +120,8 @@ class NextBlock(Block):
 			# parserState.TokenMarker = None
 			parserState.NextState =   cls.stateWhitespace2
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                   LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken, multiPart=True)
 			_ =                       block(parserState.NewBlock, token)
 			parserState.TokenMarker = None
@@ -142,8 +142,8 @@ class NextBlock(Block):
 			parserState.NewToken =    WhenKeyword(token)
 			parserState.NextState =   cls.stateWhenKeyword
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                   LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =    block(parserState.LastBlock, token)
 			parserState.TokenMarker = None
 			return
@@ -151,7 +151,7 @@ class NextBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and (isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 			parserState.NewToken =    BoundaryToken(token)
-			parserState.NewBlock =    WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker = None
 			return
 
@@ -177,8 +177,8 @@ class NextBlock(Block):
 			parserState.NewToken =    BoundaryToken(token)
 			parserState.NextState =   cls.stateWhitespace3
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                   LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken, multiPart=True)
 			_ =                       block(parserState.NewBlock, token)
 			parserState.TokenMarker = None
@@ -213,7 +213,7 @@ class NextBlock(Block):
 		elif (isinstance(token, SpaceToken) and (
 			isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 		else:
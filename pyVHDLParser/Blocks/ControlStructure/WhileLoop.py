@@ -32,7 +32,7 @@ from pyVHDLParser.Token                import CharacterToken, LinebreakToken, In
 from pyVHDLParser.Token.Keywords       import BoundaryToken, IdentifierToken, LoopKeyword
 from pyVHDLParser.Token.Keywords       import IsKeyword, EndKeyword, GenericKeyword, PortKeyword
 from pyVHDLParser.Token.Parser         import SpaceToken, StringToken
-from pyVHDLParser.Blocks               import TokenParserException, Block
+from pyVHDLParser.Blocks               import TokenParserException, Block, ResumableState
 from pyVHDLParser.Blocks.Common        import LinebreakBlock, IndentationBlock, WhitespaceBlock
 from pyVHDLParser.Blocks.Generic       import EndBlock as EndBlockBase
 from pyVHDLParser.Blocks.List          import GenericList, PortList
@@ -106,7 +106,7 @@ class ConditionBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -179,13 +179,14 @@ class ConditionBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
 		raise TokenParserException(errorMessage, token)
 
 	@classmethod
+	@ResumableState
 	def stateDeclarativeRegion(cls, parserState: ParserState):
 		errorMessage = "Expected one of these keywords: generic, port, begin, end."
 		token = parserState.Token
@@ -208,7 +209,7 @@ class ConditionBlock(Block):
 			parserState.NewBlock =      IndentationBlock(parserState.LastBlock, parserState.NewToken)
 			return
 		elif isinstance(token, StringToken):
-			keyword = token.Value.lower()
+			keyword = token.LowerValue
 			if (keyword == "generic"):
 				newToken =              GenericKeyword(token)
 				parserState.PushState = GenericList.OpenBlock.stateGenericKeyword
@@ -38,7 +38,7 @@ from pyVHDLParser.Token.Keywords  import NorKeyword, AndKeyword, NandKeyword, Xo
 from pyVHDLParser.Token.Keywords  import NotKeyword, AbsKeyword, OpeningRoundBracketToken, BoundaryToken, ClosingRoundBracketToken, IdentifierToken
 from pyVHDLParser.Token.Keywords  import LoopKeyword, ToKeyword, DowntoKeyword, EndToken
 from pyVHDLParser.Blocks          import Block, ParserState, TokenParserException, CommentBlock
-from pyVHDLParser.Blocks.Common   import LinebreakBlock, WhitespaceBlock
+from pyVHDLParser.Blocks.Common   import LinebreakBlock, WhitespaceBlock, LINEBREAK_COMMENT_BLOCKS
 
 
 class ExpressionBlock(Block):
@@ -185,8 +185,8 @@ class ExpressionBlockEndedByCharORClosingRoundBracket(ExpressionBlock):
 		elif isinstance(token, SpaceToken):
 			parserState.NextState =     cls.stateWhitespace1
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                     LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                     LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =      cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken, multiPart=True)
 			_ =                         block(parserState.NewBlock, token)
 			parserState.TokenMarker =   None
@@ -232,10 +232,6 @@ class ExpressionBlockEndedByCharORClosingRoundBracket(ExpressionBlock):
 				if (parserState.Counter == 0):
 					parserState.NewToken =    BoundaryToken(token)
 					parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=parserState.NewToken.PreviousToken)
-					i = 1
-					for stackElement in parserState._stack:
-						print("{0}: {1!s}".format(i, stackElement))
-						i += 1
 					parserState.Pop(3)
 					parserState.TokenMarker = parserState.NewToken
 					return
@@ -278,7 +274,7 @@ class ExpressionBlockEndedByCharORClosingRoundBracket(ExpressionBlock):
 			return
 		elif (isinstance(token, SpaceToken) and (isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -326,8 +322,8 @@ class ExpressionBlockEndedByKeywordORClosingRoundBracket(ExpressionBlock):
 		elif isinstance(token, SpaceToken):
 			parserState.NextState =     cls.stateWhitespace1
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                     LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                     LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =      cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken, multiPart=True)
 			_ =                         block(parserState.NewBlock, token)
 			parserState.TokenMarker =   None
@@ -396,7 +392,7 @@ class ExpressionBlockEndedByKeywordORClosingRoundBracket(ExpressionBlock):
 			return
 		elif (isinstance(token, SpaceToken) and (isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -426,7 +422,7 @@ class ExpressionBlockEndedByKeywordOrToOrDownto(ExpressionBlock):
 				parserState.NewToken =    cls.CHARACTER_TRANSLATION[token.Value](token)
 				return
 		elif isinstance(token, StringToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.LowerValue
 			if (tokenValue == cls.EXIT_KEYWORD.__KEYWORD__):
 				parserState.NewToken =    LoopKeyword(token)
 				parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=parserState.NewToken.PreviousToken)
@@ -463,8 +459,8 @@ class ExpressionBlockEndedByKeywordOrToOrDownto(ExpressionBlock):
 		elif isinstance(token, SpaceToken):
 			parserState.NextState =     cls.stateWhitespace1
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                     LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                     LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =      cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken, multiPart=True)
 			_ =                         block(parserState.NewBlock, token)
 			parserState.TokenMarker =   None
@@ -496,7 +492,7 @@ class ExpressionBlockEndedByKeywordOrToOrDownto(ExpressionBlock):
 				parserState.NextState =   cls.stateExpression
 				return
 		elif isinstance(token, StringToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.LowerValue
 			if (tokenValue == cls.EXIT_KEYWORD.__KEYWORD__):
 				parserState.NewToken =    LoopKeyword(token)
 				parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=parserState.NewToken.PreviousToken)
@@ -552,7 +548,7 @@ class ExpressionBlockEndedByKeywordOrToOrDownto(ExpressionBlock):
 			return
 		elif (isinstance(token, SpaceToken) and (isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -679,7 +675,7 @@ class ExpressionBlockEndedByKeywordOrToOrDownto(ExpressionBlock):
 # 			return
 # 		elif (isinstance(token, SpaceToken) and (isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 # 			parserState.NewToken =      BoundaryToken(token)
-# 			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+# 			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 # 			parserState.TokenMarker =   None
 # 			return
 #
@@ -730,8 +726,8 @@ class ExpressionBlockEndedBySemicolon(ExpressionBlock):
 		elif isinstance(token, SpaceToken):
 			parserState.NextState =     cls.stateWhitespace1
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                     LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                     LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =      cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken, multiPart=True)
 			_ =                         block(parserState.NewBlock, token)
 			parserState.TokenMarker =   None
@@ -804,7 +800,7 @@ class ExpressionBlockEndedBySemicolon(ExpressionBlock):
 			return
 		elif (isinstance(token, SpaceToken) and (isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
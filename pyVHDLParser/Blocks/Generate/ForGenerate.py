@@ -31,7 +31,7 @@
 from pyVHDLParser.Token.Keywords            import BoundaryToken, IdentifierToken, EndToken, BeginKeyword, ProcessKeyword, AssertKeyword
 from pyVHDLParser.Token.Keywords            import IsKeyword, EndKeyword, GenericKeyword, PortKeyword
 from pyVHDLParser.Token                     import CharacterToken, SpaceToken, StringToken, LinebreakToken, IndentationToken
-from pyVHDLParser.Blocks                    import Block, TokenParserException, ParserState
+from pyVHDLParser.Blocks                    import Block, TokenParserException, ParserState, ResumableState
 from pyVHDLParser.Blocks.Exception          import TokenParserException
 from pyVHDLParser.Blocks.Common             import LinebreakBlock, IndentationBlock, WhitespaceBlock
 from pyVHDLParser.Blocks.Generate           import EndGenerateBlock as EndGenerateBlockBase
@@ -109,7 +109,7 @@ class RangeBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -182,13 +182,14 @@ class RangeBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
 		raise TokenParserException(errorMessage, token)
 
 	@classmethod
+	@ResumableState
 	def stateDeclarativeRegion(cls, parserState: ParserState):
 		errorMessage = "Expected one of these keywords: generic, port, begin, end."
 		token = parserState.Token
@@ -211,7 +212,7 @@ class RangeBlock(Block):
 			parserState.NewBlock =      IndentationBlock(parserState.LastBlock, parserState.NewToken)
 			return
 		elif isinstance(token, StringToken):
-			keyword = token.Value.lower()
+			keyword = token.LowerValue
 			if (keyword == "generic"):
 				newToken =              GenericKeyword(token)
 				parserState.PushState = GenericList.OpenBlock.stateGenericKeyword
@@ -260,7 +261,7 @@ class BeginBlock(Block):
 		# 	parserState.NewBlock = IndentationBlock(parserState.LastBlock, parserState.NewToken)
 		# 	return
 		elif isinstance(token, StringToken):
-			keyword = token.Value.lower()
+			keyword = token.LowerValue
 			if (keyword == "process"):
 				newToken =                ProcessKeyword(token)
 				parserState.PushState =   Process.OpenBlock.stateProcessKeyword
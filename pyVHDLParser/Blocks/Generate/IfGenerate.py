@@ -32,7 +32,7 @@ from pyVHDLParser.Token.Keywords            import BoundaryToken, IdentifierToke
 from pyVHDLParser.Token.Keywords            import BeginKeyword, ProcessKeyword, AssertKeyword, GenerateKeyword
 from pyVHDLParser.Token.Keywords            import IsKeyword, EndKeyword, GenericKeyword, PortKeyword
 from pyVHDLParser.Token                     import CharacterToken, SpaceToken, StringToken, LinebreakToken, IndentationToken
-from pyVHDLParser.Blocks                    import Block, TokenParserException, ParserState
+from pyVHDLParser.Blocks                    import Block, TokenParserException, ParserState, ResumableState
 from pyVHDLParser.Blocks.Common             import LinebreakBlock, IndentationBlock, WhitespaceBlock
 from pyVHDLParser.Blocks.Generate           import EndGenerateBlock as EndGenerateBlockBase
 from pyVHDLParser.Blocks.List               import GenericList, PortList
@@ -108,7 +108,7 @@ class IfConditionBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -181,13 +181,14 @@ class IfConditionBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
 		raise TokenParserException(errorMessage, token)
 
 	@classmethod
+	@ResumableState
 	def stateDeclarativeRegion(cls, parserState: ParserState):
 		errorMessage = "Expected one of these keywords: generic, port, begin, end."
 		token = parserState.Token
@@ -210,7 +211,7 @@ class IfConditionBlock(Block):
 			parserState.NewBlock =      IndentationBlock(parserState.LastBlock, parserState.NewToken)
 			return
 		elif isinstance(token, StringToken):
-			keyword = token.Value.lower()
+			keyword = token.LowerValue
 			if (keyword == "generic"):
 				newToken =              GenericKeyword(token)
 				parserState.PushState = GenericList.OpenBlock.stateGenericKeyword
@@ -259,7 +260,7 @@ class BeginBlock(Block):
 		# 	parserState.NewBlock = IndentationBlock(parserState.LastBlock, parserState.NewToken)
 		# 	return
 		elif isinstance(token, StringToken):
-			keyword = token.Value.lower()
+			keyword = token.LowerValue
 			if (keyword == "process"):
 				newToken =                ProcessKeyword(token)
 				parserState.PushState =   Process.OpenBlock.stateProcessKeyword
@@ -346,7 +347,7 @@ class ElsIfConditionBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -419,13 +420,14 @@ class ElsIfConditionBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
 		raise TokenParserException(errorMessage, token)
 
 	@classmethod
+	@ResumableState
 	def stateDeclarativeRegion(cls, parserState: ParserState):
 		errorMessage = "Expected one of these keywords: generic, port, begin, end."
 		token = parserState.Token
@@ -448,7 +450,7 @@ class ElsIfConditionBlock(Block):
 			parserState.NewBlock =      IndentationBlock(parserState.LastBlock, parserState.NewToken)
 			return
 		elif isinstance(token, StringToken):
-			keyword = token.Value.lower()
+			keyword = token.LowerValue
 			if (keyword == "generic"):
 				newToken =              GenericKeyword(token)
 				parserState.PushState = GenericList.OpenBlock.stateGenericKeyword
@@ -497,7 +499,7 @@ class ElsIfBeginBlock(Block):
 		# 	parserState.NewBlock = IndentationBlock(parserState.LastBlock, parserState.NewToken)
 		# 	return
 		elif isinstance(token, StringToken):
-			keyword = token.Value.lower()
+			keyword = token.LowerValue
 			if (keyword == "process"):
 				newToken =                ProcessKeyword(token)
 				parserState.PushState =   Process.OpenBlock.stateProcessKeyword
@@ -584,7 +586,7 @@ class ElseGenerateBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -657,13 +659,14 @@ class ElseGenerateBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and isinstance(parserState.LastBlock, MultiLineCommentBlock)):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
 		raise TokenParserException(errorMessage, token)
 
 	@classmethod
+	@ResumableState
 	def stateDeclarativeRegion(cls, parserState: ParserState):
 		errorMessage = "Expected one of these keywords: generic, port, begin, end."
 		token = parserState.Token
@@ -686,7 +689,7 @@ class ElseGenerateBlock(Block):
 			parserState.NewBlock =      IndentationBlock(parserState.LastBlock, parserState.NewToken)
 			return
 		elif isinstance(token, StringToken):
-			keyword = token.Value.lower()
+			keyword = token.LowerValue
 			if (keyword == "generic"):
 				newToken =              GenericKeyword(token)
 				parserState.PushState = GenericList.OpenBlock.stateGenericKeyword
@@ -735,7 +738,7 @@ class ElseGenerateBeginBlock(Block):
 		# 	parserState.NewBlock = IndentationBlock(parserState.LastBlock, parserState.NewToken)
 		# 	return
 		elif isinstance(token, StringToken):
-			keyword = token.Value.lower()
+			keyword = token.LowerValue
 			if (keyword == "process"):
 				newToken =                ProcessKeyword(token)
 				parserState.PushState =   Process.OpenBlock.stateProcessKeyword
@@ -28,13 +28,13 @@
 # ==============================================================================
 #
 # load dependencies
-from pyVHDLParser.Token           import LinebreakToken, CommentToken, IndentationToken
+from pyVHDLParser.Token           import IndentationToken
 from pyVHDLParser.Token.Keywords  import AssertKeyword, EndKeyword, ProcessKeyword, ReportKeyword, IfKeyword, ForKeyword, ReturnKeyword, NextKeyword, NullKeyword
 from pyVHDLParser.Token.Keywords  import ExitKeyword, UseKeyword, SignalKeyword, ConstantKeyword, SharedKeyword, FunctionKeyword, ProcedureKeyword
 from pyVHDLParser.Token.Keywords  import ImpureKeyword, PureKeyword, VariableKeyword, BeginKeyword, CaseKeyword
-from pyVHDLParser.Token.Parser    import SpaceToken, StringToken
-from pyVHDLParser.Blocks          import TokenParserException, CommentBlock, ParserState, MetaBlock
-from pyVHDLParser.Blocks.Common   import LinebreakBlock, WhitespaceBlock, IndentationBlock
+from pyVHDLParser.Token.Parser    import StringToken
+from pyVHDLParser.Blocks          import TokenParserException, ParserState, MetaBlock, ResumableState
+from pyVHDLParser.Blocks.Common   import WhitespaceBlock, IndentationBlock, TRIVIA_BLOCKS
 from pyVHDLParser.Blocks.Object   import VariableDeclarationBlock
 from pyVHDLParser.Blocks.Generic1 import EndBlock, BeginBlock
 
@@ -64,31 +64,24 @@ class DeclarativeRegion(metaclass=MetaBlock):
 
 
 	@classmethod
+	@ResumableState
 	def stateDeclarativeRegion(cls, parserState: ParserState):
-		token = parserState.Token
-		if isinstance(token, SpaceToken):
-			blockType =                 IndentationBlock if isinstance(token, IndentationToken) else WhitespaceBlock
-			parserState.NewBlock =      blockType(parserState.LastBlock, token)
-			parserState.TokenMarker =   None
-			return
-		elif isinstance(token, LinebreakToken):
-			parserState.NewBlock =      LinebreakBlock(parserState.LastBlock, token)
-			parserState.TokenMarker =   None
-			return
-		elif isinstance(token, CommentToken):
-			parserState.NewBlock =      CommentBlock(parserState.LastBlock, token)
-			parserState.TokenMarker =   None
+		token =     parserState.Token
+		blockType = TRIVIA_BLOCKS.get(token.__class__)
+		if (blockType is not None):
+			parserState.AddTriviaBlock(blockType, token)
+			parserState.TokenMarker = None
 			return
 		elif isinstance(token, StringToken):
-			tokenValue = token.Value.lower()
-
-			for keyword in cls.KEYWORDS:
-				if (tokenValue == keyword.__KEYWORD__):
-					newToken =                keyword(token)
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			tokenValue = token.LowerValue
+
+			if (tokenValue in cls.__KEYWORD_DISPATCH__):
+				keyword, transition =     cls.__KEYWORD_DISPATCH__[tokenValue]
+				newToken =                keyword(token)
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if (tokenValue == "begin"):
 				parserState.NewToken =  BeginKeyword(token)
@@ -148,33 +141,30 @@ class ConcurrentBeginBlock(BeginBlock):
 		}
 
 	@classmethod
+	@ResumableState
 	def stateStatementRegion(cls, parserState: ParserState):
 		parserState.NextState = cls.stateConcurrentRegion
 		parserState.NextState(parserState)
 
 	@classmethod
+	@ResumableState
 	def stateConcurrentRegion(cls, parserState: ParserState):
-		token = parserState.Token
-		if isinstance(token, SpaceToken):
-			blockType =               IndentationBlock if isinstance(token, IndentationToken) else WhitespaceBlock
-			parserState.NewBlock =    blockType(parserState.LastBlock, token)
-			parserState.TokenMarker = None
-			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
-			parserState.NewBlock =    block(parserState.LastBlock, token)
+		token =     parserState.Token
+		blockType = TRIVIA_BLOCKS.get(token.__class__)
+		if (blockType is not None):
+			parserState.AddTriviaBlock(blockType, token)
 			parserState.TokenMarker = None
 			return
 		elif isinstance(token, StringToken):
-			tokenValue = token.Value.lower()
-
-			for keyword in cls.KEYWORDS:
-				if (tokenValue == keyword.__KEYWORD__):
-					newToken = keyword(token)
-					parserState.PushState = cls.KEYWORDS[keyword]
-					parserState.NewToken = newToken
-					parserState.TokenMarker = newToken
-					return
+			tokenValue = token.LowerValue
+
+			if (tokenValue in cls.__KEYWORD_DISPATCH__):
+				keyword, transition =     cls.__KEYWORD_DISPATCH__[tokenValue]
+				newToken = keyword(token)
+				parserState.PushState = transition
+				parserState.NewToken = newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if (tokenValue == "end"):
 				parserState.NewToken =  EndKeyword(token)
@@ -217,36 +207,34 @@ class SequentialBeginBlock(BeginBlock):
 		}
 
 	@classmethod
+	@ResumableState
 	def stateStatementRegion(cls, parserState: ParserState):
 		cls.stateAnyRegion(parserState)
 
 	@classmethod
+	@ResumableState
 	def stateSequentialRegion(cls, parserState: ParserState):
 		cls.stateAnyRegion(parserState)
 
 	@classmethod
+	@ResumableState
 	def stateAnyRegion(cls, parserState: ParserState):
-		token = parserState.Token
-		if isinstance(token, SpaceToken):
-			blockType =               IndentationBlock if isinstance(token, IndentationToken) else WhitespaceBlock
-			parserState.NewBlock =    blockType(parserState.LastBlock, token)
-			parserState.TokenMarker = None
-			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
-			parserState.NewBlock =    block(parserState.LastBlock, token)
+		token =     parserState.Token
+		blockType = TRIVIA_BLOCKS.get(token.__class__)
+		if (blockType is not None):
+			parserState.AddTriviaBlock(blockType, token)
 			parserState.TokenMarker = None
 			return
 		elif isinstance(token, StringToken):
-			tokenValue = token.Value.lower()
-
-			for keyword in cls.KEYWORDS:
-				if (tokenValue == keyword.__KEYWORD__):
-					newToken =                keyword(token)
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			tokenValue = token.LowerValue
+
+			if (tokenValue in cls.__KEYWORD_DISPATCH__):
+				keyword, transition =     cls.__KEYWORD_DISPATCH__[tokenValue]
+				newToken =                keyword(token)
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if (tokenValue == "end"):
 				parserState.NewToken =  EndKeyword(token)
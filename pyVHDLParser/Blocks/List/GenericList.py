@@ -33,7 +33,7 @@ from pyVHDLParser.Token.Keywords          import BoundaryToken, ConstantKeyword,
 from pyVHDLParser.Token.Keywords          import IdentifierToken
 from pyVHDLParser.Token.Parser            import SpaceToken, StringToken
 from pyVHDLParser.Blocks                  import TokenParserException, Block, CommentBlock, ParserState, SkipableBlock
-from pyVHDLParser.Blocks.Common           import LinebreakBlock, IndentationBlock, WhitespaceBlock
+from pyVHDLParser.Blocks.Common           import LinebreakBlock, IndentationBlock, WhitespaceBlock, SPACE_BLOCKS, LINEBREAK_COMMENT_BLOCKS
 from pyVHDLParser.Blocks.Generic1         import CloseBlock as CloseBlockBase
 from pyVHDLParser.Blocks.Expression       import ExpressionBlockEndedByCharORClosingRoundBracket
 from pyVHDLParser.Blocks.InterfaceObject  import InterfaceConstantBlock, InterfaceTypeBlock, InterfaceSignalBlock
@@ -120,8 +120,8 @@ class OpenBlock(Block):
 		elif isinstance(token, SpaceToken):
 			parserState.NextState =   cls.stateWhitespace1
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                   LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken, multiPart=True)
 			_ =                       block(parserState.NewBlock, token)
 			parserState.TokenMarker = None
@@ -156,7 +156,7 @@ class OpenBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and (isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -164,8 +164,12 @@ class OpenBlock(Block):
 
 	@classmethod
 	def stateOpeningParenthesis(cls, parserState: ParserState):
-		token = parserState.Token
-		if (isinstance(token, CharacterToken)and (token == ")")):
+		token =     parserState.Token
+		blockType = SPACE_BLOCKS.get(token.__class__)
+		if (blockType is not None):
+			parserState.AddTriviaBlock(blockType, token)
+			return
+		elif (isinstance(token, CharacterToken)and (token == ")")):
 			# if (parserState.TokenMarker != token):
 			# 	parserState.NewBlock = IndentationBlock(parserState.LastBlock, parserState.TokenMarker, token.PreviousToken)
 			parserState.Pop()
@@ -201,10 +205,6 @@ class OpenBlock(Block):
 		elif isinstance(token, ExtendedIdentifier):
 			parserState.NextState =   GenericListInterfaceConstantBlock.stateObjectName
 			return
-		elif isinstance(token, SpaceToken):
-			blockType =               IndentationBlock if isinstance(token, IndentationToken) else WhitespaceBlock
-			parserState.NewBlock =    blockType(parserState.LastBlock, token)
-			return
 		elif isinstance(token, LinebreakToken):
 			parserState.NewBlock =    LinebreakBlock(parserState.LastBlock, token)
 			parserState.TokenMarker = token
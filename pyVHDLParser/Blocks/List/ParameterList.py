@@ -33,7 +33,7 @@ from pyVHDLParser.Token.Keywords          import BoundaryToken, DelimiterToken,
 from pyVHDLParser.Token.Keywords          import ConstantKeyword, SignalKeyword, VariableKeyword, TypeKeyword
 from pyVHDLParser.Token.Parser            import SpaceToken, StringToken
 from pyVHDLParser.Blocks                  import TokenParserException, Block, CommentBlock, ParserState, SkipableBlock
-from pyVHDLParser.Blocks.Common           import LinebreakBlock, IndentationBlock, WhitespaceBlock
+from pyVHDLParser.Blocks.Common           import LinebreakBlock, IndentationBlock, WhitespaceBlock, SPACE_BLOCKS, LINEBREAK_COMMENT_BLOCKS
 from pyVHDLParser.Blocks.Generic1         import CloseBlock as CloseBlockBase
 from pyVHDLParser.Blocks.InterfaceObject  import InterfaceSignalBlock, InterfaceConstantBlock, InterfaceVariableBlock
 
@@ -52,8 +52,8 @@ class OpenBlock(Block):
 		elif isinstance(token, SpaceToken):
 			parserState.NextState =   cls.stateWhitespace1
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                   LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken, multiPart=True)
 			_ =                       block(parserState.NewBlock, token)
 			parserState.TokenMarker = None
@@ -88,7 +88,7 @@ class OpenBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and (isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
@@ -96,8 +96,12 @@ class OpenBlock(Block):
 
 	@classmethod
 	def stateOpeningParenthesis(cls, parserState: ParserState):
-		token = parserState.Token
-		if isinstance(token, StringToken):
+		token =     parserState.Token
+		blockType = SPACE_BLOCKS.get(token.__class__)
+		if (blockType is not None):
+			parserState.AddTriviaBlock(blockType, token)
+			return
+		elif isinstance(token, StringToken):
 			if (token <= "constant"):
 				parserState.NewToken =    ConstantKeyword(token)
 				parserState.NextState =   DelimiterBlock.stateItemDelimiter
@@ -124,10 +128,6 @@ class OpenBlock(Block):
 		elif isinstance(token, ExtendedIdentifier):
 			parserState.NextState =   ParameterListInterfaceConstantBlock.stateObjectName
 			return
-		elif isinstance(token, SpaceToken):
-			blockType =               IndentationBlock if isinstance(token, IndentationToken) else WhitespaceBlock
-			parserState.NewBlock =    blockType(parserState.LastBlock, token)
-			return
 		elif isinstance(token, LinebreakToken):
 			parserState.NewBlock =    LinebreakBlock(parserState.LastBlock, token)
 			parserState.TokenMarker = token
@@ -178,7 +178,7 @@ class DelimiterBlock(SkipableBlock):
 	def stateItemDelimiter(cls, parserState: ParserState):
 		token = parserState.Token
 		if isinstance(token, StringToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.LowerValue
 			if (tokenValue == "constant"):
 				parserState.NewToken =    ConstantKeyword(token)
 				parserState.PushState =   ParameterListInterfaceConstantBlock.stateConstantKeyword
@@ -216,13 +216,13 @@ class DelimiterBlock(SkipableBlock):
 			parserState.NextState =   ParameterListInterfaceConstantBlock.stateObjectName
 			return
 		elif isinstance(token, SpaceToken):
-			parserState.TokenMarker = token
-			parserState.NextState =   ItemBlock.stateItemRemainder
+			parserState.AddTriviaBlock(SPACE_BLOCKS[token.__class__], token)
+			parserState.NextState =   OpenBlock.stateOpeningParenthesis
 			return
 		elif isinstance(token, LinebreakToken):
 			parserState.NewBlock =    LinebreakBlock(parserState.LastBlock, token)
 			parserState.TokenMarker = token
-			parserState.NextState =   ItemBlock.stateItemRemainder
+			parserState.NextState =   OpenBlock.stateOpeningParenthesis
 			return
 		elif isinstance(token, CommentToken):
 			parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken, multiPart=True)
@@ -32,7 +32,7 @@ from pyVHDLParser.Token                     import CharacterToken, SpaceToken, L
 from pyVHDLParser.Token.Keywords            import StringToken, BoundaryToken, IsKeyword, UseKeyword, ConstantKeyword, ImpureKeyword, PureKeyword
 from pyVHDLParser.Token.Keywords            import VariableKeyword, ProcessKeyword, BeginKeyword, FunctionKeyword, ProcedureKeyword
 from pyVHDLParser.Blocks                    import Block, CommentBlock, TokenParserException, ParserState
-from pyVHDLParser.Blocks.Common             import LinebreakBlock, IndentationBlock, WhitespaceBlock
+from pyVHDLParser.Blocks.Common             import LinebreakBlock, IndentationBlock, WhitespaceBlock, LINEBREAK_COMMENT_BLOCKS
 # from pyVHDLParser.Blocks.ControlStructure   import If, Case, ForLoop, WhileLoop
 from pyVHDLParser.Blocks.Generic import SequentialBeginBlock, SequentialDeclarativeRegion
 from pyVHDLParser.Blocks.Generic1           import EndBlock as EndBlockBase
@@ -68,8 +68,8 @@ class OpenBlock(Block):
 		elif isinstance(token, SpaceToken):
 			parserState.NextState =   cls.stateWhitespace1
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                   LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken, multiPart=True)
 			_ =                       block(parserState.NewBlock, token)
 			parserState.TokenMarker = None
@@ -104,22 +104,22 @@ class OpenBlock(Block):
 			return
 		elif (isinstance(token, SpaceToken) and (isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 		elif isinstance(token, StringToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.LowerValue
 
 			parserState.NewBlock =      cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken)
 
-			for keyword in OpenBlock2.KEYWORDS:
-				if (tokenValue == keyword.__KEYWORD__):
-					newToken = keyword(token)
-					parserState.NextState =  DeclarativeRegion.stateDeclarativeRegion
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			if (tokenValue in OpenBlock2.__KEYWORD_DISPATCH__):
+				keyword, transition =     OpenBlock2.__KEYWORD_DISPATCH__[tokenValue]
+				newToken = keyword(token)
+				parserState.NextState =  DeclarativeRegion.stateDeclarativeRegion
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if (tokenValue == "begin"):
 				parserState.NewToken =    BeginKeyword(token)
@@ -157,16 +157,16 @@ class OpenBlock2(Block):
 	def stateAfterSensitivityList(cls, parserState: ParserState):
 		token = parserState.Token
 		if isinstance(token, StringToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.LowerValue
 
-			for keyword in OpenBlock2.KEYWORDS:
-				if (tokenValue == keyword.__KEYWORD__):
-					newToken =                keyword(token)
-					parserState.NextState =   DeclarativeRegion.stateDeclarativeRegion
-					parserState.PushState =   OpenBlock2.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			if (tokenValue in OpenBlock2.__KEYWORD_DISPATCH__):
+				keyword, transition =     OpenBlock2.__KEYWORD_DISPATCH__[tokenValue]
+				newToken =                keyword(token)
+				parserState.NextState =   DeclarativeRegion.stateDeclarativeRegion
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if (tokenValue == "begin"):
 				parserState.NewToken =    BeginKeyword(token)
@@ -185,8 +185,8 @@ class OpenBlock2(Block):
 			parserState.TokenMarker = parserState.NewToken
 			parserState.NextState =   cls.stateWhitespace1
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (token.__class__ in LINEBREAK_COMMENT_BLOCKS):
+			block =                   LINEBREAK_COMMENT_BLOCKS[token.__class__]
 			parserState.NewBlock =    block(parserState.LastBlock, token)
 			parserState.TokenMarker = None
 			parserState.NextState =   cls.stateWhitespace1
@@ -198,16 +198,16 @@ class OpenBlock2(Block):
 	def stateWhitespace1(cls, parserState: ParserState):
 		token = parserState.Token
 		if isinstance(token, StringToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.LowerValue
 
-			for keyword in cls.KEYWORDS:
-				if (tokenValue == keyword.__KEYWORD__):
-					newToken =                keyword(token)
-					parserState.NextState =   DeclarativeRegion.stateDeclarativeRegion
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			if (tokenValue in cls.__KEYWORD_DISPATCH__):
+				keyword, transition =     cls.__KEYWORD_DISPATCH__[tokenValue]
+				newToken =                keyword(token)
+				parserState.NextState =   DeclarativeRegion.stateDeclarativeRegion
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if (tokenValue == "begin"):
 				parserState.NewToken =    BeginKeyword(token)
@@ -238,7 +238,7 @@ class OpenBlock2(Block):
 			return
 		elif (isinstance(token, SpaceToken) and (isinstance(parserState.LastBlock, CommentBlock) and isinstance(parserState.LastBlock.StartToken, MultiLineCommentToken))):
 			parserState.NewToken =      BoundaryToken(token)
-			parserState.NewBlock =      WhitespaceBlock(parserState.LastBlock, parserState.NewToken)
+			parserState.AddTriviaBlock(WhitespaceBlock, parserState.NewToken)
 			parserState.TokenMarker =   None
 			return
 
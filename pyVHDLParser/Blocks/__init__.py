@@ -27,39 +27,208 @@
 # limitations under the License.
 # ==============================================================================
 #
-from types                          import FunctionType
+from functools                      import wraps
+from types                          import FunctionType, MappingProxyType
 
-from pyVHDLParser                   import StartOfDocument, EndOfDocument, StartOfSnippet, EndOfSnippet
+from pyVHDLParser                   import StartOfDocument, EndOfDocument, StartOfSnippet, EndOfSnippet, ImportSubmodule
 from pyVHDLParser.Base              import ParserException
 from pyVHDLParser.Token             import CharacterToken, Token, SpaceToken, IndentationToken, LinebreakToken, CommentToken, StringToken, EndOfDocumentToken
+from pyVHDLParser.Token             import StartOfDocumentToken, SingleLineCommentToken, TriviaToken
 from pyVHDLParser.Token.Keywords    import LibraryKeyword, UseKeyword, ContextKeyword, EntityKeyword, ArchitectureKeyword, PackageKeyword
 from pyVHDLParser.Functions         import Console
 
 
+def __getattr__(name):
+	return ImportSubmodule(__name__, name)
+
+
 class TokenParserException(ParserException):
 	def __init__(self, message, token):
 		super().__init__(message)
 		self._token = token
 
 
+def ResumableState(state):
+	"""Mark a region state, in which the error recovery of :meth:`ParserState.BeginRecovery` resumes parsing."""
+	state.__resumable__ = True
+	return state
+
+
+DEFAULT_CHECKPOINT_INTERVAL = 64
+
+
 class TokenToBlockParser:
 	@staticmethod
-	def Transform(tokenGenerator, debug=False):
-		return ParserState(tokenGenerator, debug=debug).GetGenerator()
+	def Transform(tokenGenerator, debug=False, checkpointInterval=None, trivia=True, recover=False, streaming=False):
+		"""Transform a token stream into a stream of blocks.
+
+		If 'checkpointInterval' is given, every n-th line start, which isn't covered by a pending block, gets a
+		:class:`ParserCheckpoint` attached to the last block, so the block chain can be updated by :meth:`ReParse`.
+
+		If 'trivia' is false, each run of whitespace, linebreaks and comments between two significant tokens is fused into
+		a single :class:`~pyVHDLParser.Token.TriviaToken` and no whitespace or comment blocks are emitted. The fused token
+		spans the run and its value is the run's text, so the token chain still covers the whole document. As there are no
+		linebreak tokens left, no checkpoints are recorded in this mode.
+
+		If 'recover' is true, an exception raised by a state doesn't end the block stream. The tokens up to the next ';'
+		or design unit keyword at a line start are emitted as an :class:`ErrorBlock`, which carries the exception, and
+		parsing continues in the enclosing region.
+
+		If 'streaming' is true, the tokens and blocks in front of the predecessor of a yielded block are unlinked in both
+		directions, so they are freed as soon as the consumer drops them and memory use doesn't grow with the document.
+		Only the last two yielded blocks can be iterated and walked backwards.
+		"""
+		parserState = ParserState(tokenGenerator, debug=debug)
+		parserState.SkipTrivia = not trivia
+		parserState.Recover =    recover
+		parserState.Streaming =  streaming
+		if (checkpointInterval is not None):
+			parserState.LineStartHandler = CheckpointRecorder(checkpointInterval)
+		return parserState.GetGenerator()
+
+	@staticmethod
+	def ReParse(startBlock, content, offset, removedLength, insertedText, tokenizer=None, checkpointInterval=DEFAULT_CHECKPOINT_INTERVAL, internTable=None, debug=False):
+		"""Update a checkpointed block chain for an edit and return a generator of the new blocks.
+
+		The edit replaced 'removedLength' characters at (0-based) offset 'offset' by 'insertedText'; 'content' is the
+		document after the edit. The token chain must be produced by a table-driven tokenizer. Parsing resumes at the
+		last checkpoint before the edit, as the block parser replaces tokens by keyword tokens, the tokens from there
+		on are created anew. Parsing stops at the first line start behind the edit, where the parser state equals an
+		old checkpoint. Then the old tokens and blocks are spliced in behind the new ones.
+		"""
+		if (tokenizer is None):
+			from pyVHDLParser.Token.Parser import TableDrivenTokenizer as tokenizer
+
+		# find the last checkpoint before the edit
+		resumeBlock =   startBlock
+		checkpoint =    None
+		position =      0
+		block =         startBlock.NextBlock
+		while (block is not None):
+			if (block.Checkpoint is not None):
+				blockPosition = block.EndToken.NextToken._start - 1
+				if (blockPosition >= offset):
+					break
+				resumeBlock =   block
+				checkpoint =    block.Checkpoint
+				position =      blockPosition
+			block =         block.NextBlock
+
+		startBlock.StartToken._lineIndex.Replace(offset, removedLength, insertedText)
+
+		previousToken =   startBlock.StartToken if (checkpoint is None) else resumeBlock.EndToken
+		handler =         ReParseHandler(checkpointInterval, tokenizer, resumeBlock.NextBlock, offset + removedLength, len(insertedText) - removedLength)
+		tokenGenerator =  tokenizer.GetVHDLTokenizerFromPosition(previousToken, content, position, internTable)
+		parserState =     ParserState(tokenGenerator, debug=debug, lastBlock=resumeBlock, checkpoint=checkpoint)
+		parserState.LineStartHandler = handler
+
+		yield from parserState.GetGenerator()
+		tokenGenerator.close()
+
+
+class ParserCheckpoint:
+	"""Snapshot of a :class:`ParserState` at a line start, which isn't covered by a pending block."""
+
+	def __init__(self, parserState):
+		self.NextState =  parserState.NextState
+		self.Stack =      tuple(parserState._stack)
+		self.Counter =    parserState.Counter
+
+	def __eq__(self, other):
+		return (self.NextState == other.NextState) and (self.Counter == other.Counter) and (self.Stack == other.Stack)
+
+
+class CheckpointRecorder:
+	"""Attach a checkpoint to the last block at every n-th line start."""
+
+	def __init__(self, interval):
+		self._interval =  interval
+		self._count =     0
+
+	def __call__(self, parserState, token):
+		self._count += 1
+		# the recovery state can't be resumed from a checkpoint
+		if ((self._count >= self._interval) and (parserState.NextState != ErrorBlock.stateRecover)):
+			self._count = 0
+			parserState.LastBlock.Checkpoint = ParserCheckpoint(parserState)
+		return False
+
+
+class ReParseHandler(CheckpointRecorder):
+	"""Record checkpoints for the new blocks and stop re-parsing, when the parser state converges with an old checkpoint behind the edit."""
+
+	def __init__(self, interval, tokenizer, oldBlock, editEnd, delta):
+		super().__init__(interval)
+		self._tokenizer = tokenizer
+		self._oldBlock =  oldBlock
+		self._editEnd =   editEnd
+		self._delta =     delta
+
+	def __call__(self, parserState, token):
+		position =  token._start - 1
+		if (position < self._editEnd + self._delta):
+			return super().__call__(parserState, token)
+
+		# advance to the next old checkpoint behind the edit, which is not left of the current position
+		oldBlock =  self._oldBlock
+		while (oldBlock is not None):
+			if (oldBlock.Checkpoint is not None):
+				oldPosition = oldBlock.EndToken.NextToken._start - 1
+				if ((oldPosition >= self._editEnd) and (oldPosition + self._delta >= position)):
+					break
+			oldBlock = oldBlock.NextBlock
+		self._oldBlock = oldBlock
+
+		if ((oldBlock is None) or (oldPosition + self._delta != position) or (oldBlock.__class__ is not parserState.LastBlock.__class__) or
+				(oldBlock.Checkpoint != ParserCheckpoint(parserState))):
+			return super().__call__(parserState, token)
+
+		# converged: continue with the old tokens and blocks
+		oldToken =                  oldBlock.EndToken.NextToken
+		oldToken.PreviousToken =    token.PreviousToken
+		self._tokenizer.ShiftTokens(oldToken, self._delta)
+
+		# empty multi-part blocks behind the checkpoint end with the replaced token before the line start
+		replacedToken =             oldBlock.EndToken
+		block =                     oldBlock.NextBlock
+		while ((block is not None) and (block.EndToken is replacedToken)):
+			block.EndToken =          token.PreviousToken
+			block =                   block.NextBlock
+		if (oldBlock.NextBlock is not None):
+			oldBlock.NextBlock.PreviousBlock = parserState.LastBlock
+		return True
 
 
 class ParserState:
-	def __init__(self, tokenGenerator, debug):
+	def __init__(self, tokenGenerator, debug, lastBlock=None, checkpoint=None):
+		MetaBlock.Initialize()
+
 		self._stack =               []
 		self._iterator =            iter(tokenGenerator)
 		self._tokenMarker : Token = None
 		self.NextState =            StartOfDocumentBlock.stateDocument
 		self.ReIssue =              False
-		self.LastBlock    : Block = None
-		self.NewBlock     : Block = StartOfDocumentBlock(next(self._iterator))
-		self.Token        : Token = self.NewBlock.StartToken
+		self.LastBlock    : Block = lastBlock
 		self.NewToken     : Token = None
 		self.Counter =              0
+		self.LineStartHandler =     None
+		self.SkipTrivia =           False
+		self.Recover =              False
+		self.Streaming =            False
+		self.RecoveryState =        None
+		self.RecoveryError =        None
+
+		if (lastBlock is None):
+			self.NewBlock   : Block = StartOfDocumentBlock(next(self._iterator))
+			self.Token      : Token = self.NewBlock.StartToken
+		else:
+			# resume behind 'lastBlock' with the parser state saved in 'checkpoint'
+			self.NewBlock   : Block = None
+			self.Token      : Token = None
+			if (checkpoint is not None):
+				self._stack =           list(checkpoint.Stack)
+				self.NextState =        checkpoint.NextState
+				self.Counter =          checkpoint.Counter
 
 		self.debug        : bool =  debug
 
@@ -101,57 +270,170 @@ class ParserState:
 		self.Counter =      top[1]
 		self._tokenMarker = None
 
+	def AddTriviaBlock(self, blockType, token):
+		"""Emit a whitespace or comment block of 'blockType' for 'token', unless trivia blocks are skipped."""
+		if (not self.SkipTrivia):
+			self.NewBlock = blockType(self.LastBlock, token)
+
+
+	def BeginRecovery(self, exception):
+		"""Skip tokens in :meth:`ErrorBlock.stateRecover` and resume in the innermost region state afterwards."""
+		resumeState = (self.NextState, self.Counter)
+		while (not getattr(resumeState[0], "__resumable__", False)):
+			if (not self._stack):
+				resumeState = (StartOfDocumentBlock.stateDocument, 0)
+				break
+			resumeState = self._stack.pop()
+
+		self.RecoveryState =  resumeState
+		self.RecoveryError =  exception
+		self.NewBlock =       None
+		self.NextState =      ErrorBlock.stateRecover
+		self.NextState(self)
+
+	@classmethod
+	def ReleaseConsumed(cls, block):
+		"""Unlink all blocks and tokens in front of the predecessor of 'block'."""
+		if (block._previousBlock is not None):
+			cls._ReleaseInFrontOf(block._previousBlock)
+
+	@staticmethod
+	def _ReleaseInFrontOf(block):
+		previousBlock = block._previousBlock
+		if (previousBlock is None):
+			return
+
+		previousBlock.NextBlock =  None
+		block._previousBlock =     None
+
+		token =               block.StartToken
+		releasedToken =       token._previousToken
+		token._previousToken = None
+		# tokens in front of the last released block were unlinked before
+		while (releasedToken is not None):
+			releasedToken.NextToken =     None
+			token =                       releasedToken
+			releasedToken =               token._previousToken
+			token._previousToken =        None
 
 	def GetGenerator(self):
 		from pyVHDLParser.Token             import EndOfDocumentToken
 		from pyVHDLParser.Blocks            import TokenParserException, EndOfDocumentBlock
 		from pyVHDLParser.Blocks.Common     import LinebreakBlock, EmptyLineBlock
 
+		lineStartHandler =  self.LineStartHandler
+		skipTrivia =        self.SkipTrivia
+		streaming =         self.Streaming
+		pendingToken =      None
+		triviaStart =       None
+		triviaEnd =         None
+		triviaValues =      None
+
 		for token in self._iterator:
-			# set parserState.Token to current token
-			self.Token = token
-
-			# overwrite an existing token and connect the next token with the new one
-			if (self.NewToken is not None):
-				# print("{MAGENTA}NewToken: {token}{NOCOLOR}".format(token=self.NewToken, **Console.Foreground))
-				# update topmost TokenMarker
-				if (self._tokenMarker is token.PreviousToken):
-					if self.debug: print("  update token marker: {0!s} -> {1!s}".format(self._tokenMarker, self.NewToken))
-					self._tokenMarker = self.NewToken
-
-				token.PreviousToken = self.NewToken
-				self.NewToken =       None
-
-			# an empty marker means: fill on next yield run
-			if (self._tokenMarker is None):
-				if self.debug: print("  new token marker: None -> {0!s}".format(token))
-				self._tokenMarker = token
-
-			# a new block is assembled
-			while (self.NewBlock is not None):
-				if (isinstance(self.NewBlock, LinebreakBlock) and isinstance(self.LastBlock, (LinebreakBlock, EmptyLineBlock))):
-					self.LastBlock = EmptyLineBlock(self.LastBlock, self.NewBlock.StartToken)
-					self.LastBlock.NextBlock = self.NewBlock.NextBlock
-				else:
-					self.LastBlock = self.NewBlock
-
-				self.NewBlock =  self.NewBlock.NextBlock
-				yield self.LastBlock
-
-			# if self.debug: print("{MAGENTA}------ iteration end ------{NOCOLOR}".format(**Console.Foreground))
-			if self.debug: print("    {DARK_GRAY}state={state!s: <50}  token={token!s: <40}{NOCOLOR}   ".format(state=self, token=token, **Console.Foreground))
-			# execute a state
-			self.NextState(self)
+			# fuse each run of whitespace, linebreak and comment tokens into a single token, which is processed in front of 'token'
+			if skipTrivia:
+				if isinstance(token, (SpaceToken, LinebreakToken, CommentToken)):
+					if (triviaStart is None):
+						triviaStart =   token
+					elif (triviaValues is None):
+						triviaValues =  [triviaStart.Value, token.Value]
+					else:
+						triviaValues.append(token.Value)
+					triviaEnd =       token
+					continue
+
+				if (triviaStart is not None):
+					pendingToken =    token
+					# a single space is passed through unchanged
+					if ((triviaValues is None) and (triviaStart.__class__ is SpaceToken)):
+						token =         triviaStart
+					else:
+						value =         triviaStart.Value if (triviaValues is None) else "".join(triviaValues)
+						token =         TriviaToken(triviaStart.PreviousToken, value, triviaStart._start, triviaEnd._end)
+						pendingToken.PreviousToken = token
+					triviaStart =     None
+					triviaValues =    None
+
+			while (token is not None):
+				# set parserState.Token to current token
+				self.Token = token
+
+				# overwrite an existing token and connect the next token with the new one
+				if (self.NewToken is not None):
+					# print("{MAGENTA}NewToken: {token}{NOCOLOR}".format(token=self.NewToken, **Console.Foreground))
+					# update topmost TokenMarker
+					if (self._tokenMarker is token.PreviousToken):
+						if self.debug: print("  update token marker: {0!s} -> {1!s}".format(self._tokenMarker, self.NewToken))
+						self._tokenMarker = self.NewToken
+
+					token.PreviousToken = self.NewToken
+					self.NewToken =       None
+
+				# an empty marker means: fill on next yield run
+				if (self._tokenMarker is None):
+					if self.debug: print("  new token marker: None -> {0!s}".format(token))
+					self._tokenMarker = token
+
+				# a new block is assembled
+				while (self.NewBlock is not None):
+					# the states don't emit whitespace blocks for fused trivia tokens; remaining skipable blocks are dropped
+					if (skipTrivia and isinstance(self.NewBlock, SkipableBlock)):
+						if (self.LastBlock.NextBlock is self.NewBlock):
+							self.LastBlock.NextBlock = None
+						self.NewBlock = self.NewBlock.NextBlock
+						continue
+
+					if (isinstance(self.NewBlock, LinebreakBlock) and isinstance(self.LastBlock, (LinebreakBlock, EmptyLineBlock))):
+						self.LastBlock = EmptyLineBlock(self.LastBlock, self.NewBlock.StartToken)
+						self.LastBlock.NextBlock = self.NewBlock.NextBlock
+					else:
+						self.LastBlock = self.NewBlock
+
+					self.NewBlock =  self.NewBlock.NextBlock
+					if streaming:
+						self.ReleaseConsumed(self.LastBlock)
+					yield self.LastBlock
+
+				# a line start, which isn't covered by a pending block
+				if ((lineStartHandler is not None) and isinstance(token._previousToken, LinebreakToken) and (self._tokenMarker is token) and
+						(self.LastBlock.EndToken is token._previousToken) and not isinstance(token, EndOfDocumentToken)):
+					if lineStartHandler(self, token):
+						return
+
+				# if self.debug: print("{MAGENTA}------ iteration end ------{NOCOLOR}".format(**Console.Foreground))
+				if self.debug: print("    {DARK_GRAY}state={state!s: <50}  token={token!s: <40}{NOCOLOR}   ".format(state=self, token=token, **Console.Foreground))
+				# execute a state
+				try:
+					self.NextState(self)
+				except Exception as ex:
+					if (not self.Recover):
+						raise
+					self.BeginRecovery(ex)
+
+				token, pendingToken = pendingToken, None
 
 		else:
+			# an error block ended by the end of the document
+			if isinstance(self.NewBlock, ErrorBlock):
+				self.LastBlock =  self.NewBlock
+				if streaming:
+					self.ReleaseConsumed(self.LastBlock)
+				yield self.NewBlock
+				self.NewBlock =   EndOfDocumentBlock(self.Token)
+
 			if (isinstance(self.Token, EndOfDocumentToken) and isinstance(self.NewBlock, EndOfDocumentBlock)):
+				# the end of document block isn't linked to the last block
+				if streaming:
+					self._ReleaseInFrontOf(self.LastBlock)
 				yield self.NewBlock
 			else:
 				raise TokenParserException("Unexpected end of document.", self.Token)
 
 
 class MetaBlock(type):
-	BLOCKS = []
+	BLOCKS =            []
+	__DISPATCH_MAPS__ = []
+	__INITIALIZED__ =   0
 
 	"""Register all state*** methods in an array called '__STATES__'"""
 	def __new__(cls, className, baseClasses, classMembers : dict):
@@ -162,13 +444,60 @@ class MetaBlock(type):
 
 		classMembers['__STATES__'] = states
 
+		if ("__cls_init__" in classMembers):
+			classMembers["__cls_init__"] = classmethod(cls._WrapClassInit(classMembers["__cls_init__"].__func__))
+
 		block = super().__new__(cls, className, baseClasses, classMembers)
 		cls.BLOCKS.append(block)
+		for dispatchMap in cls.__DISPATCH_MAPS__:
+			dispatchMap.AddClass(block)
 		return block
 
+	@classmethod
+	def Initialize(mcs):
+		"""Build the transition tables of all block classes, which are not initialized yet, and freeze them.
+
+		Each class is initialized exactly once. Base classes are created and thus initialized before their
+		subclasses. '__cls_init__' methods import the modules of their transition targets, so blocks appended to
+		'BLOCKS' while iterating are initialized in the same run.
+		"""
+		blocks =      mcs.BLOCKS
+		index =       mcs.__INITIALIZED__
+		initialized = []
+
+		while (index < len(blocks)):
+			block =  blocks[index]
+			index += 1
+			if hasattr(block, "__cls_init__"):
+				block.__cls_init__()
+				initialized.append(block)
+
+		# Subclasses extend the tables of their base classes in '__cls_init__', so freeze them after all classes are built.
+		for block in initialized:
+			for tableName in ("KEYWORDS", "__KEYWORD_DISPATCH__"):
+				table = block.__dict__.get(tableName)
+				if isinstance(table, dict):
+					setattr(block, tableName, MappingProxyType(table))
+
+		mcs.__INITIALIZED__ = index
+
+	@staticmethod
+	def _WrapClassInit(classInit):
+		"""After '__cls_init__' has filled 'KEYWORDS', map each lower-case keyword to its keyword class and transition in '__KEYWORD_DISPATCH__'."""
+		@wraps(classInit)
+		def __cls_init__(blockClass):
+			classInit(blockClass)
+
+			keywords = getattr(blockClass, "KEYWORDS", None)
+			if (keywords is not None):
+				blockClass.__KEYWORD_DISPATCH__ = {keyword.__KEYWORD__: (keyword, transition) for keyword, transition in keywords.items()}
+
+		return __cls_init__
+
 
 class Block(metaclass=MetaBlock):
-	__STATES__ = None
+	__STATES__ =  None
+	Checkpoint =  None
 
 	def __init__(self, previousBlock, startToken, endToken=None, multiPart=False):
 		previousBlock.NextBlock =       self
@@ -242,6 +571,66 @@ class FinalBlock(Block):            pass
 class CommentBlock(SkipableBlock):  pass
 
 
+class ErrorBlock(Block):
+	"""Tokens skipped by the error recovery of :meth:`TokenToBlockParser.Transform` after 'Exception' was raised."""
+
+	# keywords, which start a design unit or context clause at the beginning of a line
+	RESYNC_KEYWORDS = frozenset(("library", "use", "context", "entity", "architecture", "configuration", "package"))
+
+	def __init__(self, previousBlock, startToken, endToken, exception):
+		super().__init__(previousBlock, startToken, endToken)
+		self.Exception = exception
+
+	@property
+	def Message(self):
+		return "{0}: {1!s}".format(self.Exception.__class__.__name__, self.Exception)
+
+	@classmethod
+	def stateRecover(cls, parserState: ParserState):
+		token = parserState.Token
+		if (isinstance(token, CharacterToken) and (token.Value == ";")):
+			parserState.NewBlock =    cls(parserState.LastBlock, cls._StartToken(parserState, token), token, parserState.RecoveryError)
+			parserState.NextState =   parserState.RecoveryState[0]
+			parserState.Counter =     parserState.RecoveryState[1]
+			parserState.TokenMarker = None
+			return
+		elif isinstance(token, EndOfDocumentToken):
+			parserState.NewBlock =    cls(parserState.LastBlock, cls._StartToken(parserState, token), token.PreviousToken, parserState.RecoveryError)
+			return
+		elif (isinstance(token, StringToken) and (token.LowerValue in cls.RESYNC_KEYWORDS) and cls._IsLineStart(token)):
+			# a design unit, which isn't accepted by 'StartOfDocumentBlock.stateDocument', is skipped in an error block of its own
+			if (token.LowerValue not in StartOfDocumentBlock.__KEYWORD_DISPATCH__):
+				startToken = parserState.TokenMarker
+				if ((startToken is not None) and (startToken is not token)):
+					parserState.NewBlock =      cls(parserState.LastBlock, startToken, token.PreviousToken, parserState.RecoveryError)
+					parserState.RecoveryError = TokenParserException("Design unit '{0}' is not supported.".format(token.Value.upper()), token)
+				parserState._stack.clear()
+				parserState.RecoveryState = (StartOfDocumentBlock.stateDocument, 0)
+				parserState.TokenMarker =   token
+				return
+
+			parserState.NewBlock =    cls(parserState.LastBlock, cls._StartToken(parserState, token), token.PreviousToken, parserState.RecoveryError)
+			parserState._stack.clear()
+			parserState.NextState =   StartOfDocumentBlock.stateDocument
+			parserState.TokenMarker = None
+			parserState.NextState(parserState)
+
+	@staticmethod
+	def _StartToken(parserState, token):
+		# an error at the synchronizing token itself skips no tokens, so the block covers the token before
+		startToken = parserState.TokenMarker
+		return token.PreviousToken if ((startToken is None) or (startToken is token)) else startToken
+
+	@staticmethod
+	def _IsLineStart(token):
+		previousToken = token.PreviousToken
+		if isinstance(previousToken, SpaceToken):
+			if (isinstance(previousToken, TriviaToken) and ("\n" in previousToken.Value)):
+				return True
+			previousToken = previousToken.PreviousToken
+		return isinstance(previousToken, (LinebreakToken, SingleLineCommentToken, StartOfDocumentToken))
+
+
 class StartOfBlock(Block):
 	def __init__(self, startToken):
 		self._previousBlock =     None
@@ -303,30 +692,26 @@ class StartOfDocumentBlock(StartOfBlock, StartOfDocument):
 		}
 
 	@classmethod
+	@ResumableState
 	def stateDocument(cls, parserState: ParserState):
-		from pyVHDLParser.Blocks.Common     import IndentationBlock, WhitespaceBlock, LinebreakBlock
+		from pyVHDLParser.Blocks.Common     import TRIVIA_BLOCKS
 
-		token = parserState.Token
-		if isinstance(token, SpaceToken):
-			blockType =               IndentationBlock if isinstance(token, IndentationToken) else WhitespaceBlock
-			parserState.NewBlock =    blockType(parserState.LastBlock, token)
-			parserState.TokenMarker = None
-			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
-			parserState.NewBlock =    block(parserState.LastBlock, token)
+		token =     parserState.Token
+		blockType = TRIVIA_BLOCKS.get(token.__class__)
+		if (blockType is not None):
+			parserState.AddTriviaBlock(blockType, token)
 			parserState.TokenMarker = None
 			return
 		elif isinstance(token, StringToken):
-			tokenValue = token.Value.lower()
-
-			for keyword in cls.KEYWORDS:
-				if (tokenValue == keyword.__KEYWORD__):
-					newToken =                keyword(token)
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			tokenValue = token.LowerValue
+
+			if (tokenValue in cls.__KEYWORD_DISPATCH__):
+				keyword, transition =     cls.__KEYWORD_DISPATCH__[tokenValue]
+				newToken =                keyword(token)
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 		elif isinstance(token, EndOfDocumentToken):
 			parserState.NewBlock =    EndOfDocumentBlock(token)
@@ -0,0 +1,370 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+#
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   Scan VHDL files for design units and their dependencies.
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# load dependencies
+from pathlib                  import Path
+
+from pyVHDLParser.Base        import ParserException
+from pyVHDLParser.Batch       import FileResult
+from pyVHDLParser.Token       import StringToken, ExtendedIdentifier, CharacterToken, FusedCharacterToken, IntegerLiteralToken
+from pyVHDLParser.Token.Parser  import TableDrivenTokenizer
+
+
+class DependencySummary(FileResult):
+	"""Design units and references of a file found by :class:`DependencyScanner`.
+
+	In addition to :class:`~pyVHDLParser.Batch.FileResult`, it lists declared contexts and configurations, context
+	references, instantiated components, referenced entities and configurations and package instantiations.
+	"""
+
+	def __init__(self, path):
+		super().__init__(path)
+		self.Contexts =                 ()
+		self.ContextReferences =        ()
+		self.Configurations =           ()
+		self.ComponentInstances =       ()
+		self.EntityReferences =         ()
+		self.ConfigurationReferences =  ()
+		self.PackageInstances =         ()
+
+
+class DependencyScanner:
+	"""Scan the tokens of a document for design unit boundaries and reference clauses without building blocks or groups.
+
+	Statement and declarative regions are skipped by tracking ``end`` nesting: ``end`` followed by a statement keyword
+	closes a construct, which needs no tracking. Otherwise it closes the innermost subprogram body, nested package or
+	generate alternative, or the design unit itself.
+	"""
+
+	INNER_END_KEYWORDS =  frozenset(("if", "case", "loop", "process", "postponed", "block", "component", "record", "units", "protected", "for"))
+	UNIT_END_KEYWORDS =   frozenset(("entity", "architecture", "configuration", "context"))
+	LABEL_PREFIXES =      frozenset((";", "begin", "generate", "=>"))
+	SEQUENTIAL_KEYWORDS = frozenset(("wait", "null", "next", "exit", "return"))
+	DELIMITERS =          frozenset((";", ":", "(", ")", ".", ",", ":=", "<=", "=>"))
+
+	def __init__(self, content, path=None):
+		self._values =  []
+		self._lower =   []
+		self._error =   None
+		self._ReadTokens(content)
+		self._count =   len(self._values)
+
+		self._libraries =               []
+		self._uses =                    []
+		self._entities =                []
+		self._architectures =           []
+		self._packages =                []
+		self._packageBodies =           []
+		self._contexts =                []
+		self._contextReferences =       []
+		self._configurations =          []
+		self._componentInstances =      []
+		self._entityReferences =        []
+		self._configurationReferences = []
+		self._packageInstances =        []
+		self._path =                    path
+
+	def _ReadTokens(self, content):
+		"""Keep the values of identifiers and delimiters of interest from the token stream of :class:`TableDrivenTokenizer`.
+
+		Comments, literals and other delimiters are dropped. Identifier parts of a based or real literal like ``16#FF#``
+		or ``1.5e3`` are dropped with the literal.
+		"""
+		values =      self._values
+		lower =       self._lower
+		delimiters =  self.DELIMITERS
+		inLiteral =   False
+		try:
+			for token in TableDrivenTokenizer.GetVHDLTokenizer(content):
+				cls = token.__class__
+				if (cls is IntegerLiteralToken):
+					inLiteral = True
+				elif inLiteral and ((cls is StringToken) or ((cls is CharacterToken) and (token.Value in ".#"))):
+					pass
+				elif (cls is StringToken):
+					inLiteral = False
+					values.append(token.Value)
+					lower.append(token.LowerValue)
+				elif (cls is ExtendedIdentifier):
+					inLiteral = False
+					values.append(token.Value)
+					lower.append(token.Value)
+				elif (((cls is CharacterToken) or (cls is FusedCharacterToken)) and (token.Value in delimiters)):
+					inLiteral = False
+					values.append(token.Value)
+					lower.append(token.Value)
+				else:
+					inLiteral = False
+		except ParserException as ex:
+			self._error = "{0}: {1!s}".format(ex.__class__.__name__, ex)
+
+	@classmethod
+	def Scan(cls, content, path=None):
+		"""Scan 'content' and return a :class:`DependencySummary`."""
+		scanner = cls(content, path)
+		scanner._ScanDocument()
+		return scanner.GetSummary()
+
+	def GetSummary(self):
+		summary =                         DependencySummary(self._path)
+		summary.Error =                   self._error
+		summary.Libraries =               tuple(self._libraries)
+		summary.Uses =                    tuple(self._uses)
+		summary.Entities =                tuple(self._entities)
+		summary.Architectures =           tuple(self._architectures)
+		summary.Packages =                tuple(self._packages)
+		summary.PackageBodies =           tuple(self._packageBodies)
+		summary.Contexts =                tuple(self._contexts)
+		summary.ContextReferences =       tuple(self._contextReferences)
+		summary.Configurations =          tuple(self._configurations)
+		summary.ComponentInstances =      tuple(self._componentInstances)
+		summary.EntityReferences =        tuple(self._entityReferences)
+		summary.ConfigurationReferences = tuple(self._configurationReferences)
+		summary.PackageInstances =        tuple(self._packageInstances)
+		return summary
+
+	def _Value(self, index):
+		return self._values[index] if (index < self._count) else None
+
+	def _Lower(self, index):
+		return self._lower[index] if (index < self._count) else None
+
+	def _SkipStatement(self, index):
+		"""Return the index behind the next ';'."""
+		lower = self._lower
+		while ((index < self._count) and (lower[index] != ";")):
+			index += 1
+		return index + 1
+
+	def _SelectedName(self, index):
+		"""Read a selected name like ``lib.pkg.all`` and return its parts and the index behind it."""
+		parts = [self._values[index]]
+		index += 1
+		while ((self._Lower(index) == ".") and (index + 1 < self._count)):
+			parts.append(self._values[index + 1])
+			index += 2
+		return parts, index
+
+	def _NameList(self, index):
+		"""Read a ','-separated list of selected names up to ';' and return the names and the index behind ';'."""
+		names = []
+		while (index < self._count):
+			lower = self._lower[index]
+			if (lower == ";"):
+				return names, index + 1
+			elif (lower == ","):
+				index += 1
+			else:
+				parts, index = self._SelectedName(index)
+				names.append(parts)
+		return names, index
+
+	def _ScanDocument(self):
+		lower = self._lower
+		index = 0
+		while (index < self._count):
+			keyword = lower[index]
+			if (keyword in ("library", "use", "context")):
+				index = self._ScanClause(index)
+			elif (keyword == "entity"):
+				self._entities.append(self._Value(index + 1))
+				index = self._ScanUnit(index + 2, "entity")
+			elif (keyword == "architecture"):
+				self._architectures.append((self._Value(index + 1), self._Value(index + 3)))
+				index = self._ScanUnit(index + 4, "architecture")
+			elif (keyword == "configuration"):
+				self._configurations.append((self._Value(index + 1), self._Value(index + 3)))
+				index = self._ScanUnit(index + 4, "configuration")
+			elif (keyword == "package"):
+				if (self._Lower(index + 1) == "body"):
+					self._packageBodies.append(self._Value(index + 2))
+					index = self._ScanUnit(index + 3, "package body")
+				else:
+					self._packages.append(self._Value(index + 1))
+					nextIndex = self._ScanPackage(index)
+					index = self._ScanUnit(index + 3, "package") if (nextIndex is None) else nextIndex
+			else:
+				index += 1
+
+	def _ScanClause(self, index):
+		"""Scan a library, use or context clause or a context declaration and return the index behind it."""
+		keyword = self._lower[index]
+		if (keyword == "library"):
+			names, index = self._NameList(index + 1)
+			self._libraries.extend(parts[0] for parts in names)
+		elif (keyword == "use"):
+			names, index = self._NameList(index + 1)
+			for parts in names:
+				parts = (parts + [None, None])[:3]
+				# like :class:`~pyVHDLParser.DocumentModel.Reference.Use`, the keyword 'all' is reported as 'ALL'
+				if ((parts[2] is not None) and (parts[2].lower() == "all")):
+					parts[2] = "ALL"
+				self._uses.append(tuple(parts))
+		elif (self._Lower(index + 2) == "is"):
+			self._contexts.append(self._Value(index + 1))
+			index = self._ScanUnit(index + 3, "context")
+		else:
+			names, index = self._NameList(index + 1)
+			self._contextReferences.extend((parts[0], parts[-1]) if (len(parts) > 1) else (None, parts[0]) for parts in names)
+		return index
+
+	def _ScanPackage(self, index):
+		"""Scan a package instantiation ``package p is new lib.pkg ...;`` and return the index behind it, else None."""
+		if ((self._Lower(index + 2) != "is") or (self._Lower(index + 3) != "new")):
+			return None
+
+		parts, _ = self._SelectedName(index + 4)
+		self._packageInstances.append((self._Value(index + 1), parts[0], parts[-1]) if (len(parts) > 1) else (self._Value(index + 1), None, parts[0]))
+		return self._SkipStatement(index + 4)
+
+	def _ScanReference(self, index, isStatement=False):
+		"""Scan an entity, configuration or component reference behind ':' or ``use``.
+
+		A component instantiation without generic or port map is only recognized, if 'isStatement' is true.
+		"""
+		keyword = self._Lower(index)
+		if (self._Lower(index + 1) == "is"):
+			# entity class of an attribute specification
+			return index
+		elif (keyword == "entity"):
+			parts, index = self._SelectedName(index + 1)
+			architecture = self._Value(index + 1) if (self._Lower(index) == "(") else None
+			self._entityReferences.append(((parts[0], parts[-1]) if (len(parts) > 1) else (None, parts[0])) + (architecture,))
+		elif (keyword == "configuration"):
+			parts, index = self._SelectedName(index + 1)
+			self._configurationReferences.append((parts[0], parts[-1]) if (len(parts) > 1) else (None, parts[0]))
+		elif (keyword == "component"):
+			self._componentInstances.append(self._Value(index + 1))
+			index += 2
+		elif ((self._Lower(index + 1) in ("generic", "port")) and (self._Lower(index + 2) == "map")):
+			self._componentInstances.append(self._Value(index))
+			index += 1
+		elif (isStatement and (self._Lower(index + 1) == ";") and (keyword not in self.SEQUENTIAL_KEYWORDS)):
+			self._componentInstances.append(self._Value(index))
+			index += 1
+		return index
+
+	def _ScanUnit(self, index, kind):
+		"""Skip the body of a design unit, record the references in it and return the index behind its end."""
+		lower =       self._lower
+		count =       self._count
+		stack =       []
+		parentheses = 0
+		inRecord =    False
+
+		while (index < count):
+			keyword = lower[index]
+			if (keyword == "end"):
+				nextKeyword = self._Lower(index + 1)
+				if (nextKeyword in self.INNER_END_KEYWORDS):
+					inRecord =  inRecord and (nextKeyword != "record")
+					index +=    2
+					continue
+				elif (nextKeyword == "generate"):
+					while (stack and (stack.pop() != "generate")):
+						pass
+					index += 2
+					continue
+				elif ((nextKeyword in self.UNIT_END_KEYWORDS) or not stack):
+					return self._SkipStatement(index)
+				elif (stack[-1] != "generate"):
+					stack.pop()
+				# else: 'end' of a generate alternative
+			elif (keyword == "("):
+				parentheses += 1
+			elif (keyword == ")"):
+				parentheses -= 1
+			elif (parentheses != 0):
+				pass
+			elif (keyword == ":"):
+				index = self._ScanReference(index + 1, (not inRecord) and (index >= 2) and (lower[index - 2] in self.LABEL_PREFIXES))
+				continue
+			elif (keyword == "record"):
+				inRecord = True
+			elif (keyword == "use"):
+				if (self._Lower(index + 1) in ("entity", "configuration")):
+					index = self._ScanReference(index + 1)
+				else:
+					index = self._ScanClause(index)
+				continue
+			elif (keyword in ("library", "context")):
+				index = self._ScanClause(index)
+				continue
+			elif (keyword == "generate"):
+				stack.append("generate")
+			elif ((keyword in ("function", "procedure")) and (lower[index - 1] != ":")):
+				if self._IsBody(index + 1):
+					stack.append("subprogram")
+			elif (keyword == "package"):
+				if (self._Lower(index + 1) == "body"):
+					stack.append("package")
+				else:
+					nextIndex = self._ScanPackage(index)
+					if (nextIndex is not None):
+						index = nextIndex
+						continue
+					stack.append("package")
+			index += 1
+
+		# a tokenizer error ends the token stream early and is reported instead
+		if (self._error is None):
+			self._error = "Unexpected end of document in {0}.".format(kind)
+		return index
+
+	def _IsBody(self, index):
+		"""Return true, if the subprogram header starting at 'index' is followed by ``is`` and not by ``is new``."""
+		lower =       self._lower
+		parentheses = 0
+		while (index < self._count):
+			keyword = lower[index]
+			if (keyword == "("):
+				parentheses += 1
+			elif (keyword == ")"):
+				parentheses -= 1
+			elif (parentheses == 0):
+				if (keyword == ";"):
+					return False
+				elif (keyword == "is"):
+					return self._Lower(index + 1) != "new"
+			index += 1
+		return False
+
+
+def ScanFile(path):
+	"""Scan a single file and return a :class:`DependencySummary`."""
+	path = Path(path)
+	try:
+		with path.open('r') as fileHandle:
+			content = fileHandle.read()
+	except Exception as ex:
+		summary =       DependencySummary(path)
+		summary.Error = "{0}: {1!s}".format(ex.__class__.__name__, ex)
+		return summary
+
+	return DependencyScanner.Scan(content, path)
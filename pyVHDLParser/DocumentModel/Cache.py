@@ -0,0 +1,175 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+#
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A persistent cache for parsed documents.
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+from hashlib      import sha256
+from os           import replace, scandir, unlink, utime
+from pathlib      import Path
+from pickle       import dumps, loads, HIGHEST_PROTOCOL
+from tempfile     import mkstemp
+
+import pyVHDLParser
+from pyVHDLParser.Common  import vhdlVersion
+
+
+CACHE_FORMAT =        2
+DEFAULT_MAX_SIZE =    256 * 1024 * 1024
+EVICTION_SLACK =      16
+
+
+_parserFingerprint = None
+
+
+def GetParserFingerprint():
+	"""Return a hash over the sources of all pyVHDLParser modules, so any change to the parser or the models invalidates cached entries."""
+	global _parserFingerprint
+
+	if (_parserFingerprint is None):
+		packageDirectory =  Path(pyVHDLParser.__file__).parent
+		hash =              sha256()
+		for path in sorted(packageDirectory.rglob("*.py")):
+			hash.update(path.relative_to(packageDirectory).as_posix().encode("utf-8") + b"\0")
+			hash.update(path.read_bytes())
+		_parserFingerprint = hash.hexdigest()
+	return _parserFingerprint
+
+
+class CacheEntry:
+	"""Cached result of a parsed document: the design units and references of the document model."""
+
+	def __init__(self):
+		self.Libraries =      []
+		self.Uses =           []
+		self.Entities =       []
+		self.Architectures =  []
+		self.Packages =       []
+		self.PackageBodies =  []
+
+	def RecordDocument(self, document):
+		self.Libraries =      document.Libraries
+		self.Uses =           document.Uses
+		self.Entities =       document.Entities
+		self.Architectures =  document.Architectures
+		self.Packages =       document.Packages
+		self.PackageBodies =  document.PackageBodies
+
+	def RestoreDocument(self, document):
+		for library in self.Libraries:            document.AddLibrary(library)
+		for use in self.Uses:                     document.AddUse(use)
+		for entity in self.Entities:              document.AddEntity(entity)
+		for architecture in self.Architectures:   document.AddArchitecture(architecture)
+		for package in self.Packages:             document.AddPackage(package)
+		for packageBody in self.PackageBodies:    document.AddPackageBody(packageBody)
+
+
+class ParseCache:
+	"""A directory of cached parse results keyed by the hash of the file content, the parser sources and the VHDL version.
+
+	Entries are written to a temporary file and renamed, so concurrent writers never expose partial entries and the
+	last writer wins. A hit updates the entry's modification time, which is used to evict the least recently used
+	entries, when the directory grows above 'maxSize' bytes. The directory is scanned for eviction after each process
+	has written 1/EVICTION_SLACK of 'maxSize', so parallel writers may exceed the limit by that amount each.
+	"""
+
+	def __init__(self, directory, maxSize=DEFAULT_MAX_SIZE):
+		self._directory =   Path(directory)
+		self._maxSize =     maxSize
+		self._writtenSize = 0
+		self._directory.mkdir(parents=True, exist_ok=True)
+
+	@property
+	def Directory(self):
+		return self._directory
+
+	@property
+	def MaxSize(self):
+		return self._maxSize
+
+	def GetKey(self, content):
+		prefix = "{format}:{parser}:{vhdl}\0".format(format=CACHE_FORMAT, parser=GetParserFingerprint(), vhdl=vhdlVersion.value)
+		return sha256((prefix + content).encode("utf-8")).hexdigest()
+
+	def Load(self, key):
+		"""Return the entry for 'key' or None. Unreadable entries are treated as misses."""
+		path = self._directory / (key + ".pickle")
+		try:
+			with path.open("rb") as fileHandle:
+				entry = loads(fileHandle.read())
+		except Exception:   # missing, corrupt or written by an incompatible parser
+			return None
+		if (not isinstance(entry, CacheEntry)):
+			return None
+
+		try:
+			utime(str(path))
+		except OSError:     # evicted by another process in the meantime
+			pass
+		return entry
+
+	def Store(self, key, entry):
+		data =                          dumps(entry, protocol=HIGHEST_PROTOCOL)
+		fileDescriptor, temporaryPath = mkstemp(dir=str(self._directory), prefix=key, suffix=".tmp")
+		try:
+			with open(fileDescriptor, "wb") as fileHandle:
+				fileHandle.write(data)
+			replace(temporaryPath, str(self._directory / (key + ".pickle")))
+		except BaseException:
+			unlink(temporaryPath)
+			raise
+
+		self._writtenSize += len(data)
+		if (self._writtenSize >= self._maxSize // EVICTION_SLACK):
+			self._writtenSize = 0
+			self.Evict()
+
+	def Evict(self):
+		"""Remove the least recently used entries until the cache fits into its size limit."""
+		entries =   []
+		totalSize = 0
+		for dirEntry in scandir(str(self._directory)):
+			if dirEntry.name.endswith(".pickle"):
+				try:
+					status = dirEntry.stat()
+				except FileNotFoundError:
+					continue
+				entries.append((status.st_mtime, status.st_size, dirEntry.path))
+				totalSize += status.st_size
+
+		if (totalSize <= self._maxSize):
+			return
+
+		entries.sort()
+		for _, size, path in entries:
+			try:
+				unlink(path)
+			except FileNotFoundError:
+				pass
+			totalSize -= size
+			if (totalSize <= self._maxSize):
+				break
@@ -28,164 +28,161 @@
 # ==============================================================================
 #
 # load dependencies
-from typing import List
-
-import pyVHDLParser.Blocks.InterfaceObject
-from pyVHDLParser.Token.Keywords            import IdentifierToken
-from pyVHDLParser.Blocks                    import TokenParserException
-from pyVHDLParser.Blocks.List               import GenericList as GenericListBlocks, PortList as PortListBlocks
-from pyVHDLParser.Blocks.Object             import Constant
-from pyVHDLParser.Blocks.Sequential         import Package as PackageBlock, PackageBody as PackageBodyBlock
-from pyVHDLParser.Blocks.Structural         import Entity as EntityBlocks, Architecture as ArchitectureBlocks
-from pyVHDLParser.Groups.List               import GenericListGroup, PortListGroup
-from pyVHDLParser.VHDLModel                 import Entity as EntityVHDLModel, Architecture as ArchitectureModelModel
-from pyVHDLParser.VHDLModel                 import Package as PackageVHDLModel, PackageBody as PackageBodyVHDLModel
-from pyVHDLParser.DocumentModel.Reference   import Library, Use
-from pyVHDLParser.Functions                 import Console
-
-
-class Entity(EntityVHDLModel):
-	def __init__(self, entityName):
-		super().__init__()
-		self._name = entityName
-
-	@classmethod
-	def stateParse(cls, document, group):
+from pyVHDLParser                                   import TypeDispatchMap
+from pyVHDLParser.Token.Keywords                    import IdentifierToken
+from pyVHDLParser.Blocks.List                       import GenericList as GenericListBlocks, PortList as PortListBlocks, ParameterList as ParameterListBlocks
+from pyVHDLParser.Blocks.List                       import SensitivityList as SensitivityListBlocks
+from pyVHDLParser.Blocks.Object                     import ConstantDeclarationBlock, VariableDeclarationBlock, SharedVariableDeclarationBlock, SignalDeclarationBlock
+from pyVHDLParser.Blocks.Object                     import ConstantDeclarationDefaultExpressionBlock, VariableDeclarationDefaultExpressionBlock, SignalDeclarationDefaultExpressionBlock
+from pyVHDLParser.Blocks.Sequential                 import Function as FunctionBlocks, Process as ProcessBlocks
+from pyVHDLParser.VHDLModel                         import Entity as EntityVHDLModel, Architecture as ArchitectureModelModel
+from pyVHDLParser.VHDLModel                         import Package as PackageVHDLModel, PackageBody as PackageBodyVHDLModel
+from pyVHDLParser.DocumentModel                     import GroupParserException
+from pyVHDLParser.DocumentModel.ObjectDeclaration   import Constant, Variable, Signal, ConstantInterfaceItem, PortSignalInterfaceItem
+from pyVHDLParser.DocumentModel.ObjectDeclaration   import ParameterConstantInterfaceItem, ParameterVariableInterfaceItem, ParameterSignalInterfaceItem
+from pyVHDLParser.DocumentModel.Sequential.Function import Function
+from pyVHDLParser.DocumentModel.Sequential.Process  import Process
+from pyVHDLParser.DocumentModel.Events              import DesignUnitFound
+from pyVHDLParser.Functions                         import Console
+
+
+class DesignUnit:
+	"""Fill generics, ports, declarations and statements of a design unit in a single pass over the blocks of its group."""
+
+	# block type -> model class, which reads the block's tokens
+	ITEM_BLOCKS = TypeDispatchMap({
+		GenericListBlocks.GenericListInterfaceConstantBlock:      ConstantInterfaceItem,
+		PortListBlocks.PortListInterfaceSignalBlock:              PortSignalInterfaceItem,
+		ParameterListBlocks.ParameterListInterfaceConstantBlock:  ParameterConstantInterfaceItem,
+		ParameterListBlocks.ParameterListInterfaceVariableBlock:  ParameterVariableInterfaceItem,
+		ParameterListBlocks.ParameterListInterfaceSignalBlock:    ParameterSignalInterfaceItem,
+		ConstantDeclarationBlock:                                 Constant,
+		VariableDeclarationBlock:                                 Variable,
+		SharedVariableDeclarationBlock:                           Variable,
+		SignalDeclarationBlock:                                   Signal,
+		FunctionBlocks.NameBlock:                                 Function,
+		ProcessBlocks.OpenBlock:                                  Process
+	})
+	PARAMETER_ITEMS =           (ParameterConstantInterfaceItem, ParameterVariableInterfaceItem, ParameterSignalInterfaceItem)
+	DEFAULT_EXPRESSION_BLOCKS = (
+		GenericListBlocks.DefaultValueExpressionBlock, PortListBlocks.DefaultValueExpressionBlock,
+		ConstantDeclarationDefaultExpressionBlock, VariableDeclarationDefaultExpressionBlock, SignalDeclarationDefaultExpressionBlock
+	)
+	SCOPE_END_BLOCKS =          (FunctionBlocks.EndBlock, ProcessBlocks.EndBlock)
+
+	@staticmethod
+	def _GetIdentifiers(group, count):
+		"""Return the first 'count' identifiers of the group's (multi-part) name block."""
+		nameBlockType = group.StartBlock.__class__
+		identifiers =   []
 		for block in group:
-			if isinstance(block, EntityBlocks.NameBlock):
-				for token in block:
-					if isinstance(token, IdentifierToken):
-						entityName = token.Value
-						break
-				else:
-					raise TokenParserException("EntityName not found.", None)
-
-				entity = cls(entityName)
-				entity.AddLibraryReferences(document.Libraries)
-				entity.AddUses(document.Uses)
-
-				print("Found library '{0}'. Adding to current node '{1!s}'.".format(entityName, document))
-				document.AddEntity(entity)
-				break
-
-		subGroupIterator = iter(group.GetSubGroups())
-		subGroup =         next(subGroupIterator)
-
-		if isinstance(subGroup, GenericListGroup):
-			cls.stateParseGenericList(document, subGroup)
-			subGroup = next(subGroupIterator)
-
-		if isinstance(subGroup, PortListGroup):
-			cls.stateParsePortList(document, subGroup)
-			subGroup = next(subGroupIterator)
-
-		# FIXME entity declarative region
-		# if isinstance(subGroup, ):
-		# 	cls.stateParsePortList(document, subGroup)
-		# 	subGroup = next(subGroupIterator)
-
-		# FIXME entity statements
-		# if isinstance(subGroup, ):
-		# 	cls.stateParsePortList(document, subGroup)
-		# 	subGroup = next(subGroupIterator)
-
-		# FIXME: how to check if everthing is consumed?
-
-
-	@classmethod
-	def stateParseGenericList(cls, document, group):
-		assert isinstance(parserState.CurrentGroup, GenericListBlocks.OpenBlock)
-
-		for block in parserState.GroupIterator:
-			if isinstance(block, pyVHDLParser.Blocks.InterfaceObject.InterfaceConstantBlock):
-				cls.stateParseGeneric(parserState)
-			elif isinstance(block, GenericListBlocks.CloseBlock):
-				break
-		else:
-			raise TokenParserException("", None)
-
-		parserState.Pop()
-
-	@classmethod
-	def stateParseGeneric(cls, document, group):
-		assert isinstance(parserState.CurrentGroup, pyVHDLParser.Blocks.InterfaceObject.InterfaceConstantBlock)
+			if (block.__class__ is nameBlockType):
+				identifiers.extend(token.Value for token in block if isinstance(token, IdentifierToken))
+				if (len(identifiers) >= count):
+					return identifiers[:count]
 
-		tokenIterator = iter(parserState)
+		raise GroupParserException("Design unit name not found.", group)
 
-		for token in tokenIterator:
-			if isinstance(token, IdentifierToken):
-				genericName = token.Value
-				break
-		else:
-			raise TokenParserException("", None)
+	def _ParseBlocks(self, document, group):
+		# processes and subprograms own the declarations up to their end block
+		scopes =        [self]
+		item =          None
+		itemBlockType = None
+		lastItem =      None      # receives the default expression blocks following its declaration
 
-		parserState.CurrentNode.AddGeneric(genericName)
-
-	@classmethod
-	def stateParsePortList(cls, document, group):
-		assert isinstance(parserState.CurrentGroup, PortListBlocks.OpenBlock)
+		for block in group:
+			blockType = block.__class__
+			if (blockType in self.ITEM_BLOCKS):
+				# a multi-part declaration continues in the next block of the same type
+				if ((item is not None) and (blockType is itemBlockType)):
+					item.ParseBlock(block)
+				else:
+					item = lastItem = self.ITEM_BLOCKS[blockType]()
+					item.ParseBlock(block)
+
+					if isinstance(item, ConstantInterfaceItem):
+						self._genericItems.append(item)
+					elif isinstance(item, PortSignalInterfaceItem):
+						self._portItems.append(item)
+					elif isinstance(item, self.PARAMETER_ITEMS):
+						scopes[-1].AddParameterItem(item)
+					elif isinstance(item, Process):
+						self._bodyItems.append(item)
+						scopes.append(item)
+					else:
+						scopes[-1].AddDeclaredItem(item)
+						if isinstance(item, Function):
+							scopes.append(item)
+
+				itemBlockType = blockType
+				if (not block.MultiPart):
+					item = None
+			elif isinstance(block, self.DEFAULT_EXPRESSION_BLOCKS):
+				lastItem.ParseDefaultExpression(block)
+			elif isinstance(block, SensitivityListBlocks.ItemBlock):
+				scopes[-1].ParseSensitivityList(block)
+			elif isinstance(block, FunctionBlocks.ReturnTypeBlock):
+				function = scopes[-1]
+				function.ParseBlock(block)
+				if function.IsDeclaration:
+					scopes.pop()
+			elif isinstance(block, self.SCOPE_END_BLOCKS):
+				scopes.pop()
+
+		self._libraryReferences.extend(document.Libraries)
+		self._uses.extend(document.Uses)
+
+		if (document.EventSink is not None):
+			document.EventSink.Emit(DesignUnitFound(document, self))
+
+	def AddDeclaredItem(self, item):
+		self._declaredItems.append(item)
+
+	def _PrintContext(self, indentation):
+		for library in self._libraryReferences:
+			print("{indent}{DARK_CYAN}LIBRARY{NOCOLOR} {GREEN}{lib}{NOCOLOR};".format(indent=indentation, lib=library, **Console.Foreground))
+		for use in self._uses:
+			print("{indent}{DARK_CYAN}USE {GREEN}{lib}{NOCOLOR}.{GREEN}{pack}{NOCOLOR}.{GREEN}{item}{NOCOLOR};".format(indent=indentation, lib=use.Library, pack=use.Package, item=use.Item, **Console.Foreground))
+		print()
 
-		for block in parserState.GroupIterator:
-			if isinstance(block, pyVHDLParser.Blocks.InterfaceObject.InterfaceSignalBlock):
-				cls.stateParsePort(parserState)
-			elif isinstance(block, PortListBlocks.CloseBlock):
-				break
-		else:
-			raise TokenParserException("", None)
 
-		parserState.Pop()
+class Entity(DesignUnit, EntityVHDLModel):
+	def __init__(self, entityName):
+		super().__init__()
+		self._name = entityName
 
 	@classmethod
-	def stateParsePort(cls, document, group):
-		assert isinstance(parserState.CurrentGroup, pyVHDLParser.Blocks.InterfaceObject.InterfaceSignalBlock)
-
-		tokenIterator = iter(parserState)
-
-		for token in tokenIterator:
-			if isinstance(token, IdentifierToken):
-				portName = token.Value
-				break
-		else:
-			raise TokenParserException("", None)
-
-		parserState.CurrentNode.AddPort(portName)
-
-	def AddLibraries(self, libraries):
-		for library in libraries:
-			self._libraries.append(library)
-
-	def AddUses(self, uses):
-		for use in uses:
-			self._uses.append(use)
-
-	def AddGeneric(self, generic):
-		self._genericItems.append(generic)
+	def stateParse(cls, document, group):
+		entityName, = cls._GetIdentifiers(group, 1)
 
-	def AddPort(self, port):
-		self._portItems.append(port)
+		entity = cls(entityName)
+		document.AddEntity(entity)
+		entity._ParseBlocks(document, group)
 
 	def Print(self, indent=0):
 		indentation = "  "*indent
-		for lib in self._libraries:
-			print("{indent}{DARK_CYAN}LIBRARY{NOCOLOR} {GREEN}{lib}{NOCOLOR};".format(indent=indentation, lib=lib, **Console.Foreground))
-		for lib, pack, obj in self._uses:
-			print("{indent}{DARK_CYAN}USE {GREEN}{lib}{NOCOLOR}.{GREEN}{pack}{NOCOLOR}.{GREEN}{obj}{NOCOLOR};".format(indent=indentation, lib=lib, pack=pack, obj=obj, **Console.Foreground))
-		print()
+		self._PrintContext(indentation)
 		print("{indent}{DARK_CYAN}ENTITY{NOCOLOR} {YELLOW}{name}{NOCOLOR} {DARK_CYAN}IS{NOCOLOR}".format(name=self._name, indent=indentation, **Console.Foreground))
 		if (len(self._genericItems) > 0):
 			print("{indent}  {DARK_CYAN}GENERIC{NOCOLOR} (".format(indent=indentation, **Console.Foreground))
 			for generic in self._genericItems:
-				print("{indent}    {YELLOW}{name}{NOCOLOR} : {GREEN}{type}{NOCOLOR}".format(indent=indentation, name=generic, type="", **Console.Foreground))
+				generic.Print(indent+2)
 			print("{indent}  );".format(indent=indentation, **Console.Foreground))
 		if (len(self._portItems) > 0):
 			print("{indent}  {DARK_CYAN}PORT{NOCOLOR} (".format(indent=indentation, **Console.Foreground))
 			for port in self._portItems:
-				print("{indent}    {YELLOW}{name}{NOCOLOR} : {GREEN}{type}{NOCOLOR}".format(indent=indentation, name=port, type="", **Console.Foreground))
+				port.Print(indent+2)
 			print("{indent}  );".format(indent=indentation, **Console.Foreground))
+		for item in self._declaredItems:
+			item.Print(indent+1)
+		if (len(self._bodyItems) > 0):
+			print("{indent}{DARK_CYAN}BEGIN{NOCOLOR}".format(indent=indentation, **Console.Foreground))
+			for item in self._bodyItems:
+				item.Print(indent+1)
 		print("{indent}{DARK_CYAN}END ENTITY{NOCOLOR};".format(name=self._name, indent=indentation, **Console.Foreground))
 
 
-class Architecture(ArchitectureModelModel):
+class Architecture(DesignUnit, ArchitectureModelModel):
 	def __init__(self, architectureName, entityName):
 		super().__init__()
 		self._name =    architectureName
@@ -193,341 +190,69 @@ class Architecture(ArchitectureModelModel):
 
 	@classmethod
 	def stateParse(cls, document, group):
-		# cls.stateParseArchitectureName(parserState)
-		#
-		# for block in parserState.GroupIterator:
-		# 	if isinstance(block, Constant.ConstantBlock):
-		# 		raise NotImplementedError()
-		# 	# elif isinstance(block, ArchitectureBlock.ConcurrentBeginBlock):
-		# 	# 	raise NotImplementedError()
-		# 	elif isinstance(block, ArchitectureBlock.EndBlock):
-		# 		break
-		# else:
-		# 	raise TokenParserException("", None)
-
-		parserState.Pop()
-		# parserState.CurrentBlock = None
+		architectureName, entityName = cls._GetIdentifiers(group, 2)
 
-	@classmethod
-	def stateParseArchitectureName(cls, document, group):
-		assert isinstance(parserState.CurrentGroup, ArchitectureBlock.NameBlock)
-
-		tokenIterator = iter(parserState)
-
-		for token in tokenIterator:
-			if isinstance(token, IdentifierToken):
-				architectureName = token.Value
-				break
-		else:
-			raise TokenParserException("", None)
-
-		for token in tokenIterator:
-			if isinstance(token, IdentifierToken):
-				entityName = token.Value
-				break
-		else:
-			raise TokenParserException("", None)
-
-		oldNode = parserState.CurrentNode
 		architecture = cls(architectureName, entityName)
-
-		parserState.CurrentNode.AddArchitecture(architecture)
-		parserState.CurrentNode = architecture
-		parserState.CurrentNode.AddLibraryReferences(oldNode.Libraries)
-		parserState.CurrentNode.AddUses(oldNode.Uses)
-
-		oldNode.Libraries.clear()
-		oldNode.Uses.clear()
-
-	def AddLibraries(self, libraries):
-		for library in libraries:
-			self._libraryReferences.append(library)
-
-	def AddUses(self, uses):
-		for use in uses:
-			self._uses.append(use)
-
+		document.AddArchitecture(architecture)
+		architecture._ParseBlocks(document, group)
 
 	def Print(self, indent=0):
 		indentation = "  "*indent
-		for lib in self._libraryReferences:
-			print("{indent}{DARK_CYAN}LIBRARY{NOCOLOR} {GREEN}{lib}{NOCOLOR};".format(indent=indentation, lib=lib, **Console.Foreground))
-		for lib, pack, obj in self._uses:
-			print("{indent}{DARK_CYAN}USE {GREEN}{lib}{NOCOLOR}.{GREEN}{pack}{NOCOLOR}.{GREEN}{obj}{NOCOLOR};".format(indent=indentation, lib=lib, pack=pack, obj=obj, **Console.Foreground))
-		print()
+		self._PrintContext(indentation)
 		print("{indent}{DARK_CYAN}ARCHITECTURE {YELLOW}{name}{NOCOLOR} {DARK_CYAN}OF{NOCOLOR} {GREEN}{entity}{NOCOLOR} {DARK_CYAN}IS{NOCOLOR}".format(indent=indentation, name=self._name, entity=self._entity, **Console.Foreground))
+		for item in self._declaredItems:
+			item.Print(indent+1)
 		print("{indent}{DARK_CYAN}BEGIN{NOCOLOR}".format(indent=indentation, **Console.Foreground))
+		for item in self._bodyItems:
+			item.Print(indent+1)
 		print("{indent}{DARK_CYAN}END ARCHITECTURE{NOCOLOR};".format(indent=indentation, name=self._name, **Console.Foreground))
 
 
-class Package(PackageVHDLModel):
+class Package(DesignUnit, PackageVHDLModel):
 	def __init__(self, packageName):
 		super().__init__()
 		self._name = packageName
 
 	@classmethod
 	def stateParse(cls, document, group):
-		assert isinstance(parserState.CurrentGroup, PackageBlock.NameBlock)
-		cls.stateParsePackageName(parserState)
-
-		for block in parserState.GroupIterator:
-			if isinstance(block, GenericListBlocks.OpenBlock):
-				parserState.PushState = cls.stateParseGenericList
-				parserState.ReIssue()
-			elif isinstance(block, ConstantBlock):
-				parserState.PushState = Constant.stateParse
-				parserState.ReIssue()
-			elif isinstance(block, FunctionBlock.NameBlock):
-				parserState.PushState = Function.stateParse
-				parserState.ReIssue()
-			elif isinstance(block, PackageBlock.EndBlock):
-				break
-			else:
-				raise TokenParserException("Block '{0!r}' not supported in a package.".format(block), block)
-		else:
-			raise TokenParserException("", None)
-
-		parserState.Pop()
-		# parserState.CurrentBlock = None
+		packageName, = cls._GetIdentifiers(group, 1)
 
-	@classmethod
-	def stateParsePackageName(cls, document, group):
-		assert isinstance(parserState.CurrentGroup, PackageBlock.NameBlock)
-
-		tokenIterator = iter(parserState)
-		for token in tokenIterator:
-			if isinstance(token, IdentifierToken):
-				packageName = token.Value
-				break
-		else:
-			raise TokenParserException("", None)
-
-		oldNode = parserState.CurrentNode
 		package = cls(packageName)
-
-		parserState.CurrentNode.AddPackage(package)
-		parserState.CurrentNode = package
-		parserState.CurrentNode.AddLibraryReferences(oldNode.Libraries)
-		parserState.CurrentNode.AddUses(oldNode.Uses)
-
-		oldNode.Libraries.clear()
-		oldNode.Uses.clear()
-
-	@classmethod
-	def stateParseGenericList(cls, document, group):
-		assert isinstance(parserState.CurrentGroup, GenericListBlocks.OpenBlock)
-
-		for block in parserState.GroupIterator:
-			if isinstance(block, pyVHDLParser.Blocks.InterfaceObject.InterfaceConstantBlock):
-				cls.stateParseGeneric(parserState)
-			elif isinstance(block, GenericListBlocks.CloseBlock):
-				break
-		else:
-			raise TokenParserException("", None)
-
-		parserState.Pop()
-
-	@classmethod
-	def stateParseGeneric(cls, document, group):
-		assert isinstance(parserState.CurrentGroup, pyVHDLParser.Blocks.InterfaceObject.InterfaceConstantBlock)
-
-		tokenIterator = iter(parserState)
-		for token in tokenIterator:
-			if isinstance(token, IdentifierToken):
-				genericName = token.Value
-				break
-		else:
-			raise TokenParserException("", None)
-
-		parserState.CurrentNode.AddGeneric(genericName)
-
-	def AddLibraryReferences(self, libraries : List[Library]):
-		if ((DEBUG is True) and (len(libraries) > 0)): print("{DARK_CYAN}Adding libraries to package {GREEN}{0}{NOCOLOR}:".format(self._name, **Console.Foreground))
-		for library in libraries:
-			if DEBUG: print("  {GREEN}{0!s}{NOCOLOR}".format(library, **Console.Foreground))
-			self._libraryReferences.append(library._library)
-
-	def AddUses(self, uses : List[Use]):
-		if ((DEBUG is True) and (len(uses) > 0)): print("{DARK_CYAN}Adding uses to package {GREEN}{0}{NOCOLOR}:".format(self._name, **Console.Foreground))
-		for use in uses:
-			if DEBUG: print("  {GREEN}{0!s}{NOCOLOR}".format(use, **Console.Foreground))
-			self._uses.append(use)
-
-	def AddGeneric(self, generic):
-		if DEBUG: print("{DARK_CYAN}Adding generic to package {GREEN}{0}{NOCOLOR}:\n  {YELLOW}{1}{NOCOLOR} : {2}".format(self._name, generic, "", **Console.Foreground))
-		self._genericItems.append(generic)
-
-	def AddConstant(self, constant):
-		if DEBUG: print("{DARK_CYAN}Adding constant to package {GREEN}{0}{NOCOLOR}:\n  {1!s}".format(self._name, constant, **Console.Foreground))
-		self._declaredItems.append(constant)
-
-	def AddFunction(self, function):
-		if DEBUG: print("{DARK_CYAN}Adding function to package {GREEN}{0}{NOCOLOR}:\n  {1!s}".format(self._name, function, **Console.Foreground))
-		self._declaredItems.append(function)
-
-	def AddProcedure(self, procedure):
-		if DEBUG: print("{DARK_CYAN}Adding procedure to package {GREEN}{0}{NOCOLOR}:\n  {1!s}".format(self._name, procedure, **Console.Foreground))
-		self._declaredItems.append(procedure)
+		document.AddPackage(package)
+		package._ParseBlocks(document, group)
 
 	def Print(self, indent=0):
 		indentation = "  "*indent
-		for lib in self._libraries:
-			print("{indent}{DARK_CYAN}LIBRARY{NOCOLOR} {GREEN}{lib}{NOCOLOR};".format(indent=indentation, lib=lib, **Console.Foreground))
-		for use in self._uses:
-			print("{indent}{DARK_CYAN}USE {GREEN}{lib}{NOCOLOR}.{GREEN}{pack}{NOCOLOR}.{GREEN}{item}{NOCOLOR};".format(indent=indentation, lib=use._library, pack=use._package, item=use._item, **Console.Foreground))
-		print()
+		self._PrintContext(indentation)
 		print("{indent}{DARK_CYAN}PACKAGE{NOCOLOR} {YELLOW}{name}{NOCOLOR} {DARK_CYAN}IS{NOCOLOR}".format(indent=indentation, name=self._name, **Console.Foreground))
 		if (len(self._genericItems) > 0):
 			print("{indent}  {DARK_CYAN}GENERIC{NOCOLOR} (".format(indent=indentation, **Console.Foreground))
 			for generic in self._genericItems:
-				print("{indent}    {YELLOW}{name}{NOCOLOR} : {GREEN}{type}{NOCOLOR}".format(indent=indentation, name=generic, type="", **Console.Foreground))
+				generic.Print(indent+2)
 			print("{indent}  );".format(indent=indentation))
-		if (len(self._declaredItems) > 0):
-			for item in self._declaredItems:
-				item.Print(indent+1)
+		for item in self._declaredItems:
+			item.Print(indent+1)
 		print("{indent}{DARK_CYAN}END PACKAGE{NOCOLOR};".format(indent=indentation, name=self._name, **Console.Foreground))
 
 
-class PackageBody(PackageBodyVHDLModel):
+class PackageBody(DesignUnit, PackageBodyVHDLModel):
 	def __init__(self, packageBodyName):
 		super().__init__()
-		self._name = packageBodyName
+		self._name =    packageBodyName
+		self._package = packageBodyName
 
 	@classmethod
 	def stateParse(cls, document, group):
-		assert isinstance(parserState.CurrentGroup, PackageBodyBlock.NameBlock)
-		cls.stateParsePackageBodyName(parserState)
-
-		for block in parserState.GroupIterator:
-			if isinstance(block, GenericListBlocks.OpenBlock):
-				parserState.PushState = cls.stateParseGenericList
-				parserState.ReIssue()
-			elif isinstance(block, PortListBlocks.OpenBlock):
-				parserState.PushState = cls.stateParsePortList
-				parserState.ReIssue()
-			elif isinstance(block, ConstantBlock):
-				parserState.PushState = Constant.stateParse
-				parserState.ReIssue()
-			elif isinstance(block, Function.BeginBlock):
-				parserState.PushState = Function.stateParse
-				parserState.ReIssue()
-			elif isinstance(block, PackageBodyBlock.EndBlock):
-				break
-			else:
-				raise TokenParserException("Block '{0!r}' not supported in a package body.".format(block), block)
-		else:
-			raise TokenParserException("", None)
-
-		parserState.Pop()
-		# parserState.CurrentBlock = None
-
-	@classmethod
-	def stateParsePackageBodyName(cls, document, group):
-		assert isinstance(parserState.CurrentGroup, PackageBodyBlock.NameBlock)
+		packageName, = cls._GetIdentifiers(group, 1)
 
-		tokenIterator = iter(parserState)
-
-		for token in tokenIterator:
-			if isinstance(token, IdentifierToken):
-				packageName = token.Value
-				break
-		else:
-			raise TokenParserException("", None)
-
-		oldNode = parserState.CurrentNode
 		packageBody = cls(packageName)
-
-		parserState.CurrentNode.AddPackageBody(packageBody)
-		parserState.CurrentNode = packageBody
-		parserState.CurrentNode.AddLibraryReferences(oldNode.Libraries)
-		parserState.CurrentNode.AddUses(oldNode.Uses)
-
-		oldNode.Libraries.clear()
-		oldNode.Uses.clear()
-
-	@classmethod
-	def stateParseGenericList(cls, document, group):
-		assert isinstance(parserState.CurrentGroup, GenericListBlocks.OpenBlock)
-
-		for block in parserState.GroupIterator:
-			if isinstance(block, pyVHDLParser.Blocks.InterfaceObject.InterfaceConstantBlock):
-				cls.stateParseGeneric(parserState)
-			elif isinstance(block, GenericListBlocks.CloseBlock):
-				break
-		else:
-			raise TokenParserException("", None)
-
-		parserState.Pop()
-
-	@classmethod
-	def stateParseGeneric(cls, document, group):
-		assert isinstance(parserState.CurrentGroup, pyVHDLParser.Blocks.InterfaceObject.InterfaceConstantBlock)
-
-		tokenIterator = iter(parserState)
-
-		for token in tokenIterator:
-			if isinstance(token, IdentifierToken):
-				genericName = token.Value
-				break
-		else:
-			raise TokenParserException("", None)
-
-		parserState.CurrentNode.AddGeneric(genericName)
-
-	@classmethod
-	def stateParsePortList(cls, document, group):
-		assert isinstance(parserState.CurrentGroup, PortListBlocks.OpenBlock)
-
-		for block in parserState.GroupIterator:
-			if isinstance(block, pyVHDLParser.Blocks.InterfaceObject.InterfaceSignalBlock):
-				cls.stateParsePort(parserState)
-			elif isinstance(block, PortListBlocks.CloseBlock):
-				break
-		else:
-			raise TokenParserException("", None)
-
-		parserState.Pop()
-
-	@classmethod
-	def stateParsePort(cls, document, group):
-		assert isinstance(parserState.CurrentGroup, pyVHDLParser.Blocks.InterfaceObject.InterfaceSignalBlock)
-
-		tokenIterator = iter(parserState)
-
-		for token in tokenIterator:
-			if isinstance(token, IdentifierToken):
-				portName = token.Value
-				break
-		else:
-			raise TokenParserException("", None)
-
-		parserState.CurrentNode.AddPort(portName)
-
-	def AddLibraries(self, libraries : List[Library]):
-		if ((DEBUG is True) and (len(libraries) > 0)): print("{DARK_CYAN}Adding libraries to package body {GREEN}{0}{NOCOLOR}:".format(self._name, **Console.Foreground))
-		for library in libraries:
-			if DEBUG: print("  {GREEN}{0!s}{NOCOLOR}".format(library, **Console.Foreground))
-			self._libraries.append(library._library)
-
-	def AddUses(self, uses : List[Use]):
-		if ((DEBUG is True) and (len(uses) > 0)): print("{DARK_CYAN}Adding uses to package body {GREEN}{0}{NOCOLOR}:".format(self._name, **Console.Foreground))
-		for use in uses:
-			if DEBUG: print("  {GREEN}{0!s}{NOCOLOR}".format(use, **Console.Foreground))
-			self._uses.append(use)
-
-	def AddConstant(self, constant):
-		if DEBUG: print("{DARK_CYAN}Adding constant to package body {GREEN}{0}{NOCOLOR}:\n  {1!s}".format(self._name, constant, **Console.Foreground))
-		self._declaredItems.append(constant)
+		document.AddPackageBody(packageBody)
+		packageBody._ParseBlocks(document, group)
 
 	def Print(self, indent=0):
 		indentation = "  "*indent
-		for lib in self._libraries:
-			print("{indent}{DARK_CYAN}LIBRARY{NOCOLOR} {GREEN}{lib}{NOCOLOR};".format(indent=indentation, lib=lib, **Console.Foreground))
-		for lib, pack, obj in self._uses:
-			print("{indent}{DARK_CYAN}USE {GREEN}{lib}{NOCOLOR}.{GREEN}{pack}{NOCOLOR}.{GREEN}{obj}{NOCOLOR};".format(indent=indentation, lib=lib, pack=pack, obj=obj, **Console.Foreground))
-		print()
+		self._PrintContext(indentation)
 		print("{indent}{DARK_CYAN}PACKAGE BODY{NOCOLOR} {GREEN}{name}{NOCOLOR} {DARK_CYAN}IS{NOCOLOR}".format(indent=indentation, name=self._name, **Console.Foreground))
-		if (len(self._declaredItems) > 0):
-			for item in self._declaredItems:
-				item.Print(indent+1)
-		print("{indent}{DARK_CYAN}END PACKAGE BODY{NOCOLOR};".format(indent=indentation, name=self._name, **Console.Foreground))
\ No newline at end of file
+		for item in self._declaredItems:
+			item.Print(indent+1)
+		print("{indent}{DARK_CYAN}END PACKAGE BODY{NOCOLOR};".format(indent=indentation, name=self._name, **Console.Foreground))
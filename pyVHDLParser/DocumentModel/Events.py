@@ -0,0 +1,94 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+#
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A persistent cache for parsed documents.
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from collections  import Counter
+from logging      import getLogger, DEBUG, WARNING
+
+from pyVHDLParser.VHDLModel import NamedEntity
+
+
+class ParseEvent:
+	"""Base class of the events emitted while a :class:`~pyVHDLParser.DocumentModel.Document` is parsed."""
+
+	def __init__(self, document, node):
+		self.Document = document
+		self.Node =     node
+
+	def __str__(self):
+		name = self.Node.Name if isinstance(self.Node, NamedEntity) else self.Node
+		return "{0!s}: {1} {2} '{3!s}'".format(self.Document.FilePath, self.__class__.__name__, self.Node.__class__.__name__, name)
+
+
+class DesignUnitFound(ParseEvent):  pass
+class ClauseFound(ParseEvent):      pass
+
+
+class ParseWarning(ParseEvent):
+	"""A problem, which didn't stop parsing, e.g. a statement skipped by the error recovery. 'Node' is the affected block."""
+
+	def __init__(self, document, node, message):
+		super().__init__(document, node)
+		self.Message = message
+
+	def __str__(self):
+		return "{0!s}: {1}".format(self.Document.FilePath, self.Message)
+
+
+class EventSink:
+	"""Receive parse events; a document without an event sink doesn't create events at all."""
+
+	def Emit(self, event):
+		pass
+
+
+class LoggingEventSink(EventSink):
+	"""Write events to a :mod:`logging` logger; warnings are logged with level WARNING, all other events with 'level'."""
+
+	def __init__(self, logger=None, level=DEBUG):
+		self._logger =  getLogger("pyVHDLParser.DocumentModel") if (logger is None) else logger
+		self._level =   level
+
+	def Emit(self, event):
+		level = WARNING if isinstance(event, ParseWarning) else self._level
+		if self._logger.isEnabledFor(level):
+			self._logger.log(level, "%s", event)
+
+
+class CountingEventSink(EventSink):
+	"""Count events by event type and node type, e.g. ``Counters["DesignUnitFound", "Entity"]``."""
+
+	def __init__(self):
+		self.Counters = Counter()
+
+	def Emit(self, event):
+		self.Counters[event.__class__.__name__, event.Node.__class__.__name__] += 1
+
+	def __getitem__(self, eventType):
+		"""Return the number of events of 'eventType' (an event class) summed over all node types."""
+		return sum(count for (eventName, _), count in self.Counters.items() if (eventName == eventType.__name__))
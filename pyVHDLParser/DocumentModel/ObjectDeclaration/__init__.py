@@ -28,50 +28,160 @@
 # ==============================================================================
 #
 # load dependencies
-from pyVHDLParser.Token.Keywords                    import IdentifierToken
-from pyVHDLParser.Blocks                            import TokenParserException
-from pyVHDLParser.Blocks.Object.Constant import ConstantBlock
-from pyVHDLParser.VHDLModel                         import Constant as ConstantBase
-from pyVHDLParser.DocumentModel.Parser              import GroupToModelParser
-from pyVHDLParser.Functions                         import Console
+from pyVHDLParser.Token           import SpaceToken, LinebreakToken, CommentToken, CharacterLiteralToken, StringLiteralToken
+from pyVHDLParser.Token.Keywords  import IdentifierToken, InKeyword, OutKeyword, InoutKeyword, BufferKeyword, LinkageKeyword
+from pyVHDLParser.VHDLModel       import Modes
+from pyVHDLParser.VHDLModel       import Constant as ConstantModel, Variable as VariableModel, Signal as SignalModel
+from pyVHDLParser.VHDLModel       import ConstantInterfaceItem as ConstantInterfaceItemModel, PortSignalInterfaceItem as PortSignalInterfaceItemModel
+from pyVHDLParser.VHDLModel       import ParameterConstantInterfaceItem as ParameterConstantInterfaceItemModel
+from pyVHDLParser.VHDLModel       import ParameterVariableInterfaceItem as ParameterVariableInterfaceItemModel
+from pyVHDLParser.VHDLModel       import ParameterSignalInterfaceItem as ParameterSignalInterfaceItemModel
+from pyVHDLParser.Functions       import Console
 
-# Type alias for type hinting
-ParserState = GroupToModelParser.GroupParserState
 
+MODE_KEYWORDS = {
+	InKeyword:      Modes.In,
+	OutKeyword:     Modes.Out,
+	InoutKeyword:   Modes.InOut,
+	BufferKeyword:  Modes.Buffer,
+	LinkageKeyword: Modes.Linkage
+}
 
-class Constant(ConstantBase):
-	def __init__(self, constantName):
-		super().__init__()
-		self._name = constantName
+# literal token type -> format of its source text, as the tokenizer strips the quotes
+LITERAL_FORMATS = {
+	CharacterLiteralToken:  "'{0}'",
+	StringLiteralToken:     "\"{0}\""
+}
 
-	@classmethod
-	def stateParse(cls, parserState: ParserState):
-		assert isinstance(parserState.CurrentGroup, ConstantBlock)
 
-		cls.stateParseConstantName(parserState)
+class ObjectDeclaration:
+	"""Read name, subtype and mode of an object or interface item from the blocks of its declaration."""
 
-		parserState.Pop()
+	def ParseBlock(self, block):
+		"""Consume the tokens of one (part of a multi-part) declaration block."""
+		for token in block:
+			if isinstance(token, IdentifierToken):
+				if (self._name is None):
+					self._name =    token.Value
+				elif (self._subType is None) and self._afterColon:
+					self._subType = token.Value
+			elif (token == ":"):
+				self._afterColon =  True
+			elif (token.__class__ in MODE_KEYWORDS):
+				self._mode =        MODE_KEYWORDS[token.__class__]
 
-	@classmethod
-	def stateParseConstantName(cls, parserState: ParserState):
-		assert isinstance(parserState.CurrentGroup, ConstantBlock)
+	def ParseDefaultExpression(self, block):
+		"""Append the source text of one (part of a multi-part) default expression block; whitespace is reduced to single spaces."""
+		# an expression closed by ')' on a new line ends with an empty part, whose end token precedes its start token
+		if (block.EndToken.NextToken is block.StartToken):
+			return
 
-		tokenIterator = iter(parserState)
-		for token in tokenIterator:
-			if isinstance(token, IdentifierToken):
-				constantName = token.Value
-				break
-		else:
-			raise TokenParserException("Constant name (identifier) not found.", None)
+		text = [] if (self._defaultExpression is None) else [self._defaultExpression]
+		for token in block:
+			if isinstance(token, (SpaceToken, LinebreakToken)):
+				if ((len(text) > 0) and (text[-1] != " ")):
+					text.append(" ")
+			elif isinstance(token, CommentToken):
+				continue
+			elif (getattr(token, "Value", None) is not None):
+				text.append(LITERAL_FORMATS.get(token.__class__, "{0}").format(token.Value))
 
-		constant = cls(constantName)
+		self._defaultExpression = "".join(text).rstrip()
 
-		parserState.CurrentNode.AddConstant(constant)
-		parserState.CurrentNode = constant
+	def _PrintDefaultExpression(self):
+		return "" if (self._defaultExpression is None) else " := {0}".format(self._defaultExpression)
 
 	def __str__(self):
 		return "{GREEN}{0}{NOCOLOR} : {YELLOW}{1}{NOCOLOR}".format(self._name, self._subType, **Console.Foreground)
 
+
+class Constant(ObjectDeclaration, ConstantModel):
+	def __init__(self, constantName=None):
+		super().__init__()
+		self._name =        constantName
+		self._afterColon =  False
+
+	def Print(self, indent=0):
+		indentation = "  " * indent
+		print("{indent}{DARK_CYAN}CONSTANT {GREEN}{name}{NOCOLOR} : {GREEN}{type}{NOCOLOR}{default};".format(indent=indentation, name=self._name, type=self._subType, default=self._PrintDefaultExpression(), **Console.Foreground))
+
+
+class Variable(ObjectDeclaration, VariableModel):
+	def __init__(self, variableName=None):
+		super().__init__()
+		self._name =        variableName
+		self._afterColon =  False
+
+	def Print(self, indent=0):
+		indentation = "  " * indent
+		print("{indent}{DARK_CYAN}VARIABLE {GREEN}{name}{NOCOLOR} : {GREEN}{type}{NOCOLOR}{default};".format(indent=indentation, name=self._name, type=self._subType, default=self._PrintDefaultExpression(), **Console.Foreground))
+
+
+class Signal(ObjectDeclaration, SignalModel):
+	def __init__(self, signalName=None):
+		super().__init__()
+		self._name =        signalName
+		self._afterColon =  False
+
+	def Print(self, indent=0):
+		indentation = "  " * indent
+		print("{indent}{DARK_CYAN}SIGNAL {GREEN}{name}{NOCOLOR} : {GREEN}{type}{NOCOLOR}{default};".format(indent=indentation, name=self._name, type=self._subType, default=self._PrintDefaultExpression(), **Console.Foreground))
+
+
+class ConstantInterfaceItem(ObjectDeclaration, ConstantInterfaceItemModel):
+	def __init__(self, genericName=None):
+		super().__init__()
+		self._name =        genericName
+		self._afterColon =  False
+
+	def Print(self, indent=0):
+		indentation = "  " * indent
+		print("{indent}{YELLOW}{name}{NOCOLOR} : {GREEN}{type}{NOCOLOR}{default}".format(indent=indentation, name=self._name, type=self._subType, default=self._PrintDefaultExpression(), **Console.Foreground))
+
+
+class PortSignalInterfaceItem(ObjectDeclaration, PortSignalInterfaceItemModel):
+	def __init__(self, portName=None):
+		super().__init__()
+		self._name =        portName
+		self._mode =        Modes.Default
+		self._afterColon =  False
+
+	def Print(self, indent=0):
+		indentation = "  " * indent
+		print("{indent}{YELLOW}{name}{NOCOLOR} : {DARK_CYAN}{mode}{NOCOLOR} {GREEN}{type}{NOCOLOR}{default}".format(indent=indentation, name=self._name, mode=self._mode.name.upper(), type=self._subType, default=self._PrintDefaultExpression(), **Console.Foreground))
+
+
+class ParameterConstantInterfaceItem(ObjectDeclaration, ParameterConstantInterfaceItemModel):
+	def __init__(self, parameterName=None):
+		super().__init__()
+		self._name =        parameterName
+		self._mode =        Modes.Default
+		self._afterColon =  False
+
+	def Print(self, indent=0):
+		indentation = "  " * indent
+		print("{indent}{YELLOW}{name}{NOCOLOR} : {DARK_CYAN}{mode}{NOCOLOR} {GREEN}{type}{NOCOLOR}{default}".format(indent=indentation, name=self._name, mode=self._mode.name.upper(), type=self._subType, default=self._PrintDefaultExpression(), **Console.Foreground))
+
+
+class ParameterVariableInterfaceItem(ObjectDeclaration, ParameterVariableInterfaceItemModel):
+	def __init__(self, parameterName=None):
+		super().__init__()
+		self._name =        parameterName
+		self._mode =        Modes.Default
+		self._afterColon =  False
+
+	def Print(self, indent=0):
+		indentation = "  " * indent
+		print("{indent}{YELLOW}{name}{NOCOLOR} : {DARK_CYAN}{mode}{NOCOLOR} {GREEN}{type}{NOCOLOR}{default}".format(indent=indentation, name=self._name, mode=self._mode.name.upper(), type=self._subType, default=self._PrintDefaultExpression(), **Console.Foreground))
+
+
+class ParameterSignalInterfaceItem(ObjectDeclaration, ParameterSignalInterfaceItemModel):
+	def __init__(self, parameterName=None):
+		super().__init__()
+		self._name =        parameterName
+		self._mode =        Modes.Default
+		self._afterColon =  False
+
 	def Print(self, indent=0):
 		indentation = "  " * indent
-		print("{indent}{DARK_CYAN}CONSTANT {GREEN}{name}{NOCOLOR} : {GREEN}{type}{NOCOLOR} := xxx;".format(indent=indentation, name=self._name, type="", **Console.Foreground))
+		print("{indent}{YELLOW}{name}{NOCOLOR} : {DARK_CYAN}{mode}{NOCOLOR} {GREEN}{type}{NOCOLOR}{default}".format(indent=indentation, name=self._name, mode=self._mode.name.upper(), type=self._subType, default=self._PrintDefaultExpression(), **Console.Foreground))
@@ -0,0 +1,216 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   Libraries of analyzed documents with a cross-file symbol index.
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from pathlib                import Path
+
+from pyVHDLParser.VHDLModel import Model as ModelModel, Library as LibraryModel
+
+
+def _Key(name):
+	"""VHDL identifiers are case insensitive."""
+	return name.lower()
+
+
+class Library(LibraryModel):
+	"""A library collecting the design units of all documents added to it.
+
+	Design units are stored in dictionaries keyed by their lower-case names, which serve as the lookup indexes. As in
+	VHDL analysis, a unit replaces an earlier unit with the same name; removing it doesn't restore the earlier unit.
+	"""
+
+	def __init__(self, libraryName):
+		super().__init__()
+		self._name =          libraryName
+		self._entities =      {}
+		self._architectures = {}
+		self._packages =      {}
+		self._packageBodies = {}
+		self._declarations =  {}
+
+	@property
+	def Entities(self):
+		return list(self._entities.values())
+
+	@property
+	def Architectures(self):
+		return list(self._architectures.values())
+
+	@property
+	def Packages(self):
+		return list(self._packages.values())
+
+	@property
+	def PackageBodies(self):
+		return list(self._packageBodies.values())
+
+	def AddDocument(self, document):
+		"""Add the design units of 'document' to the indexes."""
+		for entity in document.Entities:
+			self._entities[_Key(entity.Name)] = entity
+		for architecture in document.Architectures:
+			self._architectures[(_Key(architecture.Entity), _Key(architecture.Name))] = architecture
+		for package in document.Packages:
+			key = _Key(package.Name)
+			if (key in self._packages):
+				self._RemoveDeclarations(self._packages[key])
+			self._packages[key] = package
+			self._AddDeclarations(package)
+		for packageBody in document.PackageBodies:
+			self._packageBodies[_Key(packageBody.Name)] = packageBody
+
+	def RemoveDocument(self, document):
+		"""Remove the design units of 'document', which are still indexed, from the indexes."""
+		for entity in document.Entities:
+			self._RemoveUnit(self._entities, _Key(entity.Name), entity)
+		for architecture in document.Architectures:
+			self._RemoveUnit(self._architectures, (_Key(architecture.Entity), _Key(architecture.Name)), architecture)
+		for package in document.Packages:
+			if self._RemoveUnit(self._packages, _Key(package.Name), package):
+				self._RemoveDeclarations(package)
+		for packageBody in document.PackageBodies:
+			self._RemoveUnit(self._packageBodies, _Key(packageBody.Name), packageBody)
+
+	@staticmethod
+	def _RemoveUnit(index, key, unit):
+		if (index.get(key) is unit):
+			del index[key]
+			return True
+		return False
+
+	def _AddDeclarations(self, package):
+		packageKey = _Key(package.Name)
+		for item in package.DeclaredItems:
+			if (item.Name is not None):
+				# overloaded subprograms share a name
+				self._declarations.setdefault((packageKey, _Key(item.Name)), []).append(item)
+
+	def _RemoveDeclarations(self, package):
+		packageKey = _Key(package.Name)
+		for item in package.DeclaredItems:
+			if (item.Name is not None):
+				key =           (packageKey, _Key(item.Name))
+				declarations =  self._declarations[key]
+				declarations.remove(item)
+				if (len(declarations) == 0):
+					del self._declarations[key]
+
+	def GetEntity(self, entityName):
+		return self._entities.get(_Key(entityName))
+
+	def GetArchitecture(self, entityName, architectureName):
+		return self._architectures.get((_Key(entityName), _Key(architectureName)))
+
+	def GetPackage(self, packageName):
+		return self._packages.get(_Key(packageName))
+
+	def GetPackageBody(self, packageName):
+		return self._packageBodies.get(_Key(packageName))
+
+	def GetDeclarations(self, packageName, declarationName):
+		"""Return the declarations named 'declarationName' in package 'packageName'; more than one for overloads."""
+		return self._declarations.get((_Key(packageName), _Key(declarationName)), [])
+
+
+class Project(ModelModel):
+	"""A project maps analyzed documents to libraries and resolves names across documents.
+
+	Documents are tracked by file path, so adding a re-parsed document replaces the contributions of its predecessor.
+	"""
+
+	def __init__(self):
+		super().__init__()
+		self._libraries = {}
+		self._documents = {}
+
+	@property
+	def Libraries(self):
+		return list(self._libraries.values())
+
+	@property
+	def Documents(self):
+		return [document for document, _ in self._documents.values()]
+
+	def AddDocument(self, document, libraryName="work"):
+		"""Add the design units of 'document' to library 'libraryName' and return the library."""
+		self.RemoveDocument(document.FilePath)
+
+		key = _Key(libraryName)
+		try:
+			library = self._libraries[key]
+		except KeyError:
+			library = Library(libraryName)
+			library._parent =       self
+			self._libraries[key] =  library
+
+		library.AddDocument(document)
+		self._documents[document.FilePath] = (document, library)
+		return library
+
+	def RemoveDocument(self, filePath):
+		"""Remove the design units of the document added for 'filePath' and return the document, if any."""
+		try:
+			document, library = self._documents.pop(Path(filePath))
+		except KeyError:
+			return None
+
+		library.RemoveDocument(document)
+		return document
+
+	def GetLibrary(self, libraryName, currentLibrary=None):
+		"""Return library 'libraryName'; ``work`` refers to 'currentLibrary', if given."""
+		if ((currentLibrary is not None) and (_Key(libraryName) == "work")):
+			return currentLibrary
+		return self._libraries.get(_Key(libraryName))
+
+	def GetEntity(self, libraryName, entityName, currentLibrary=None):
+		library = self.GetLibrary(libraryName, currentLibrary)
+		return None if (library is None) else library.GetEntity(entityName)
+
+	def GetArchitecture(self, libraryName, entityName, architectureName, currentLibrary=None):
+		library = self.GetLibrary(libraryName, currentLibrary)
+		return None if (library is None) else library.GetArchitecture(entityName, architectureName)
+
+	def GetPackage(self, libraryName, packageName, currentLibrary=None):
+		library = self.GetLibrary(libraryName, currentLibrary)
+		return None if (library is None) else library.GetPackage(packageName)
+
+	def GetPackageBody(self, libraryName, packageName, currentLibrary=None):
+		library = self.GetLibrary(libraryName, currentLibrary)
+		return None if (library is None) else library.GetPackageBody(packageName)
+
+	def GetDeclarations(self, libraryName, packageName, declarationName, currentLibrary=None):
+		library = self.GetLibrary(libraryName, currentLibrary)
+		return [] if (library is None) else library.GetDeclarations(packageName, declarationName)
+
+	def ResolveUse(self, use, currentLibrary=None):
+		"""Return the package of a ``use lib.pkg.all`` clause or the declarations named by ``use lib.pkg.item``."""
+		if (_Key(use.Item) == "all"):
+			return self.GetPackage(use.Library, use.Package, currentLibrary)
+		return self.GetDeclarations(use.Library, use.Package, use.Item, currentLibrary)
@@ -29,10 +29,27 @@
 #
 # load dependencies
 from pyVHDLParser.Token.Keywords            import IdentifierToken, AllKeyword
-from pyVHDLParser.Blocks                    import TokenParserException
+from pyVHDLParser.Blocks                    import SkipableBlock
 from pyVHDLParser.Blocks.Reference          import Library as LibraryBlocks, Use as UseBlocks
 from pyVHDLParser.VHDLModel                 import LibraryReference as LibraryReferenceModel, Use as UseModel
 from pyVHDLParser.DocumentModel             import GroupParserException
+from pyVHDLParser.DocumentModel.Events      import ClauseFound
+
+
+def _NameTokens(block):
+	"""Yield the identifier and ALL keyword tokens of a name block up to its end token.
+
+	A part of a multi-part block can end in front of its start token, so the walk also stops behind the end position.
+	"""
+	endToken =  block.EndToken
+	end =       endToken.End.Absolute
+	token =     block.StartToken
+	while ((token is not None) and (token.Start.Absolute <= end)):
+		if isinstance(token, (IdentifierToken, AllKeyword)):
+			yield token
+		if (token is endToken):
+			break
+		token = token.NextToken
 
 
 class Library(LibraryReferenceModel):
@@ -46,16 +63,23 @@ class Library(LibraryReferenceModel):
 			if isinstance(block, LibraryBlocks.StartBlock):
 				pass
 			elif isinstance(block, LibraryBlocks.LibraryNameBlock):
-				libraryName = block.StartToken.Value
-				library = cls(libraryName)
-				print("Found library '{0}'. Adding to current node '{1!s}'.".format(libraryName, currentNode))
+				# parts of a multi-part name block may hold only whitespace
+				token = next(_NameTokens(block), None)
+				if (token is None):
+					continue
+
+				library = cls(token.Value)
 				currentNode.AddLibrary(library)
+
+				eventSink = getattr(currentNode, "EventSink", None)
+				if (eventSink is not None):
+					eventSink.Emit(ClauseFound(currentNode, library))
 			elif isinstance(block, LibraryBlocks.EndBlock):
 				return
-			else:
-				raise GroupParserException("Unexpected block type in LibraryGroup.")
+			elif (not isinstance(block, SkipableBlock)):
+				raise GroupParserException("Unexpected block type in LibraryGroup.", group)
 
-		raise GroupParserException("End of use clause not found.")
+		raise GroupParserException("End of library clause not found.", group)
 
 	def __str__(self):
 		return self._library
@@ -70,44 +94,33 @@ class Use(UseModel):
 
 	@classmethod
 	def stateParse(cls, currentNode, group):
+		names = []
 		for block in group:
 			if isinstance(block, UseBlocks.StartBlock):
 				pass
 			elif isinstance(block, UseBlocks.ReferenceNameBlock):
-				tokenIterator = iter(block)
-
-				for token in tokenIterator:
-					if isinstance(token, IdentifierToken):
-						libraryName = token.Value
-						break
-				else:
-					raise TokenParserException("", None)
-
-				for token in tokenIterator:
-					if isinstance(token, IdentifierToken):
-						packageName = token.Value
-						break
-				else:
-					raise TokenParserException("", None)
-
-				for token in tokenIterator:
-					if isinstance(token, IdentifierToken):
-						objectName = token.Value
-						break
-					elif isinstance(token, AllKeyword):
-						objectName = "ALL"
-						break
-				else:
-					raise TokenParserException("", None)
-
-				use = cls(libraryName, packageName, objectName)
+				for token in _NameTokens(block):
+					names.append("ALL" if isinstance(token, AllKeyword) else token.Value)
+
+				# a multi-part reference name continues in the next block
+				if block.MultiPart:
+					continue
+				elif (len(names) != 3):
+					raise GroupParserException("Use clause '{0}' is not of the form library.package.item.".format(".".join(names)), group)
+
+				use =   cls(*names)
+				names = []
 				currentNode.AddUse(use)
+
+				eventSink = getattr(currentNode, "EventSink", None)
+				if (eventSink is not None):
+					eventSink.Emit(ClauseFound(currentNode, use))
 			elif isinstance(block, UseBlocks.EndBlock):
 				return
-			else:
-				raise GroupParserException("Unexpected block type in LibraryGroup.")
+			elif (not isinstance(block, SkipableBlock)):
+				raise GroupParserException("Unexpected block type in UseGroup.", group)
 
-		raise GroupParserException("End of use clause not found.")
+		raise GroupParserException("End of use clause not found.", group)
 
 	def __str__(self):
 		return "{0}.{1}".format(self._library, self._package)
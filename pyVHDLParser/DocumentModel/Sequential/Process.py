@@ -0,0 +1,59 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from pyVHDLParser.Token           import StringToken
+from pyVHDLParser.Token.Keywords  import IdentifierToken, AllKeyword
+from pyVHDLParser.VHDLModel       import ProcessStatement as ProcessStatementModel
+from pyVHDLParser.Functions       import Console
+
+
+class Process(ProcessStatementModel):
+	def ParseBlock(self, block):
+		"""The open block carries no label, as the block parser doesn't support process labels."""
+
+	def ParseSensitivityList(self, block):
+		"""Read the signal names (or ``all``) of a sensitivity list item block."""
+		for token in block:
+			if isinstance(token, (IdentifierToken, AllKeyword, StringToken)):
+				self._sensitivityList.append(token.Value)
+
+	def AddDeclaredItem(self, item):
+		self._declaredItems.append(item)
+
+	def Print(self, indent=0):
+		indentation = "  "*indent
+		if (len(self._sensitivityList) > 0):
+			print("{indent}{DARK_CYAN}PROCESS{NOCOLOR} ({names})".format(indent=indentation, names=", ".join(self._sensitivityList), **Console.Foreground))
+		else:
+			print("{indent}{DARK_CYAN}PROCESS{NOCOLOR}".format(indent=indentation, **Console.Foreground))
+		for item in self._declaredItems:
+			item.Print(indent+1)
+		print("{indent}{DARK_CYAN}BEGIN{NOCOLOR}".format(indent=indentation, **Console.Foreground))
+		print("{indent}{DARK_CYAN}END PROCESS{NOCOLOR};".format(indent=indentation, **Console.Foreground))
@@ -29,15 +29,18 @@
 #
 from pathlib import Path
 
+from pyVHDLParser                    import ImportSubmodule
 from pyVHDLParser.Base               import ParserException
-from pyVHDLParser.Token.Parser       import Tokenizer
-from pyVHDLParser.Blocks             import TokenToBlockParser
+from pyVHDLParser.Token.Parser       import TableDrivenTokenizer
+from pyVHDLParser.Blocks             import TokenToBlockParser, ErrorBlock
 from pyVHDLParser.Groups             import StartOfDocumentGroup, EndOfDocumentGroup, BlockToGroupParser
-from pyVHDLParser.Groups.DesignUnit  import EntityGroup, ArchitectureGroup, PackageBodyGroup, PackageGroup
-from pyVHDLParser.Groups.Reference   import LibraryGroup, UseGroup
 from pyVHDLParser.VHDLModel          import Document as DocumentModel
 
 
+def __getattr__(name):
+	return ImportSubmodule(__name__, name)
+
+
 class GroupParserException(ParserException):
 	def __init__(self, message, group):
 		super().__init__(message)
@@ -45,12 +48,19 @@ class GroupParserException(ParserException):
 
 
 class Document(DocumentModel):
-	def __init__(self, file):
+	def __init__(self, file, cache=None, recover=False, eventSink=None):
 		from pyVHDLParser.DocumentModel.Reference import Use, Library
 
 		super().__init__()
 		self.__libraries  : list[Library] = []
 		self.__uses       : list[Use] =     []
+		self._cache =                       cache
+		self._cacheEntry =                  None
+		self._recover =                     recover
+		self._diagnostics =                 []
+		self._startOfDocumentGroup =        None
+		self._positionIndex =               None
+		self.EventSink =                    eventSink
 
 		if isinstance(file, Path):
 			self._filePath = file
@@ -60,15 +70,47 @@ class Document(DocumentModel):
 			raise ValueError("Unsoppurted type for parameter type.")
 
 	def Parse(self, content=None):
+		# results of a recovering parse aren't cached
+		if ((self._cache is not None) and not self._recover):
+			return self._ParseCached(content)
+
 		if (content is None):
 			if (not self._filePath.exists()):
-				raise GroupParserException("File '{0!s}' does not exist.".format(self._filePath))
+				raise GroupParserException("File '{0!s}' does not exist.".format(self._filePath), None)
+
+			vhdlTokenStream = TableDrivenTokenizer.GetVHDLTokenizerFromFile(self._filePath)
+		else:
+			vhdlTokenStream = TableDrivenTokenizer.GetVHDLTokenizer(content)
+
+		self._Parse(vhdlTokenStream)
+
+	def _ParseCached(self, content):
+		"""Restore the document from the parse cache or parse it and store the document model."""
+		from pyVHDLParser.DocumentModel.Cache import CacheEntry
 
-			with self._filePath.open('r') as fileHandle:
+		if (content is None):
+			if (not self._filePath.exists()):
+				raise GroupParserException("File '{0!s}' does not exist.".format(self._filePath), None)
+
+			with self._filePath.open("r") as fileHandle:
 				content = fileHandle.read()
 
-		vhdlTokenStream = Tokenizer.GetVHDLTokenizer(content)
-		vhdlBlockStream = TokenToBlockParser.Transform(vhdlTokenStream)
+		key =   self._cache.GetKey(content)
+		entry = self._cache.Load(key)
+		if (entry is not None):
+			entry.RestoreDocument(self)
+		else:
+			entry = CacheEntry()
+			self._Parse(TableDrivenTokenizer.GetVHDLTokenizer(content))
+			entry.RecordDocument(self)
+			self._cache.Store(key, entry)
+
+		self._cacheEntry = entry
+
+	def _Parse(self, vhdlTokenStream):
+		vhdlBlockStream = TokenToBlockParser.Transform(vhdlTokenStream, recover=self._recover)
+		if self._recover:
+			vhdlBlockStream = self._CollectErrorBlocks(vhdlBlockStream)
 		vhdlGroupStream = BlockToGroupParser.Transform(vhdlBlockStream)
 		groups =          [group for group in vhdlGroupStream]
 		firstGroup =      groups[0]
@@ -79,11 +121,27 @@ class Document(DocumentModel):
 		elif (not isinstance(lastGroup, EndOfDocumentGroup)):
 			raise GroupParserException("Expected group is not an EndOfDocumentGroup.", lastGroup)
 
+		self._startOfDocumentGroup = firstGroup
+
 		# run recursively (node, group)
 		self.stateParse(self, firstGroup)
 
+	def _CollectErrorBlocks(self, blockGenerator):
+		"""Pass all blocks except error blocks through, which are collected in :attr:`Diagnostics`."""
+		for block in blockGenerator:
+			if isinstance(block, ErrorBlock):
+				self._diagnostics.append(block)
+				if (self.EventSink is not None):
+					from pyVHDLParser.DocumentModel.Events import ParseWarning
+
+					self.EventSink.Emit(ParseWarning(self, block, "{0!s}: {1}".format(block.StartToken.Start, block.Message)))
+			else:
+				yield block
+
 	@classmethod
 	def stateParse(cls, document, startOfDocumentGroup):
+		from pyVHDLParser.Groups.DesignUnit         import EntityGroup, ArchitectureGroup, PackageBodyGroup, PackageGroup
+		from pyVHDLParser.Groups.Reference          import LibraryGroup, UseGroup
 		from pyVHDLParser.DocumentModel.Reference   import Library as LibraryModel, Use as UseModel
 		# from pyVHDLParser.DocumentModel.DesignUnit  import Context as ContextModel
 		from pyVHDLParser.DocumentModel.DesignUnit  import Entity as EntityModel, Architecture as ArchitectureModel
@@ -121,6 +179,29 @@ class Document(DocumentModel):
 	def Uses(self):
 		return self.__uses
 
+	@property
+	def FilePath(self):
+		return self._filePath
+
+	@property
+	def PositionIndex(self):
+		"""Offset to token, block and group index, which is built on first access; None if the document was restored from the parse cache."""
+		if ((self._positionIndex is None) and (self._startOfDocumentGroup is not None)):
+			from pyVHDLParser.PositionIndex import PositionIndex
+
+			self._positionIndex = PositionIndex.FromGroup(self._startOfDocumentGroup)
+		return self._positionIndex
+
+	@property
+	def Diagnostics(self):
+		"""Error blocks skipped by a recovering parse."""
+		return self._diagnostics
+
+	@property
+	def CacheEntry(self):
+		"""The cached document model, if the document was parsed with a cache."""
+		return self._cacheEntry
+
 	def AddEntity(self, entity):
 		self._entities.append(entity)
 
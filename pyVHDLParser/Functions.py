@@ -29,9 +29,10 @@
 # ==============================================================================
 #
 
-from functools  import reduce
-from operator   import or_
-from sys        import version_info
+from collections.abc  import Mapping
+from functools        import reduce
+from operator         import or_
+from sys              import version_info
 
 
 def merge(*dicts):
@@ -58,40 +59,77 @@ class CallByRefParam:
 	def __neg__(self):        return not self.value
 
 
+class _ColorMapping(Mapping):
+	"""Map color names to ANSI escape sequences.
+
+	colorama is imported on first access, so it is only loaded if colored (debug) output is printed. If it isn't
+	installed, all colors map to empty strings.
+	"""
+	__COLORS__ = {
+		"RED":        "LIGHTRED_EX",
+		"DARK_RED":   "RED",
+		"GREEN":      "LIGHTGREEN_EX",
+		"DARK_GREEN": "GREEN",
+		"YELLOW":     "LIGHTYELLOW_EX",
+		"MAGENTA":    "LIGHTMAGENTA_EX",
+		"BLUE":       "LIGHTBLUE_EX",
+		"DARK_BLUE":  "BLUE",
+		"CYAN":       "LIGHTCYAN_EX",
+		"DARK_CYAN":  "CYAN",
+		"GRAY":       "WHITE",
+		"DARK_GRAY":  "LIGHTBLACK_EX",
+		"WHITE":      "LIGHTWHITE_EX",
+		"NOCOLOR":    "RESET",
+
+		"HEADLINE":   "LIGHTMAGENTA_EX",
+		"ERROR":      "LIGHTRED_EX",
+		"WARNING":    "LIGHTYELLOW_EX"
+	}
+
+	def __init__(self):
+		self._colors = None
+
+	def _Load(self):
+		try:
+			from colorama import Fore as Foreground
+		except ImportError:
+			self._colors = {name: "" for name in self.__COLORS__}
+		else:
+			self._colors = {name: getattr(Foreground, color) for name, color in self.__COLORS__.items()}
+		return self._colors
+
+	def __getitem__(self, key):
+		colors = self._colors if (self._colors is not None) else self._Load()
+		return colors[key]
+
+	def __iter__(self):
+		return iter(self.__COLORS__)
+
+	def __len__(self):
+		return len(self.__COLORS__)
+
+
 class Console:
+	Foreground = _ColorMapping()
+
 	@classmethod
 	def init(cls):
-		from colorama import init
+		try:
+			from colorama import init
+		except ImportError:
+			return
 		init()
 
-	from colorama import Fore as Foreground
-	Foreground = {
-		"RED":        Foreground.LIGHTRED_EX,
-		"DARK_RED":		Foreground.RED,
-		"GREEN":      Foreground.LIGHTGREEN_EX,
-		"DARK_GREEN": Foreground.GREEN,
-		"YELLOW":     Foreground.LIGHTYELLOW_EX,
-		"MAGENTA":    Foreground.LIGHTMAGENTA_EX,
-		"BLUE":       Foreground.LIGHTBLUE_EX,
-		"DARK_BLUE":  Foreground.BLUE,
-		"CYAN":       Foreground.LIGHTCYAN_EX,
-		"DARK_CYAN":  Foreground.CYAN,
-		"GRAY":       Foreground.WHITE,
-		"DARK_GRAY":  Foreground.LIGHTBLACK_EX,
-		"WHITE":      Foreground.LIGHTWHITE_EX,
-		"NOCOLOR":    Foreground.RESET,
-
-		"HEADLINE":   Foreground.LIGHTMAGENTA_EX,
-		"ERROR":      Foreground.LIGHTRED_EX,
-		"WARNING":    Foreground.LIGHTYELLOW_EX
-	}
-
 
 class Exit:
 	@classmethod
 	def exit(cls, returnCode=0):
-		from colorama    import Fore as Foreground, Back as Background, Style
-		print(Foreground.RESET + Background.RESET + Style.RESET_ALL, end="")
+		try:
+			from colorama  import Fore as Foreground, Back as Background, Style
+		except ImportError:
+			pass
+		else:
+			print(Foreground.RESET + Background.RESET + Style.RESET_ALL, end="")
 		exit(returnCode)
 
 	@classmethod
@@ -28,6 +28,7 @@
 # ==============================================================================
 #
 # load dependencies
+from pyVHDLParser                 import TypeDispatchMap
 from pyVHDLParser.Blocks          import CommentBlock
 from pyVHDLParser.Blocks.Common   import WhitespaceBlock, LinebreakBlock, IndentationBlock
 from pyVHDLParser.Groups          import ParserState, BlockParserException, Group
@@ -55,4 +56,13 @@ class WhitespaceGroup(Group):
 				parserState.ReIssue =   True
 				return
 
-		raise BlockParserException("End of library clause not found.", block)
\ No newline at end of file
+		raise BlockParserException("End of library clause not found.", block)
+
+
+# Group types for whitespace, linebreak and comment blocks, resolved by the exact block class.
+TRIVIA_GROUPS = TypeDispatchMap({
+	WhitespaceBlock:  WhitespaceGroup,
+	LinebreakBlock:   WhitespaceGroup,
+	IndentationBlock: WhitespaceGroup,
+	CommentBlock:     CommentGroup
+})
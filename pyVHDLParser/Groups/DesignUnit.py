@@ -34,14 +34,14 @@ from itertools                                import chain
 from pyVHDLParser.Blocks                      import CommentBlock, EndOfDocumentBlock
 from pyVHDLParser.Blocks.Common               import LinebreakBlock, IndentationBlock
 from pyVHDLParser.Blocks.List                 import GenericList, ParameterList, PortList
-from pyVHDLParser.Blocks.Object.Constant      import ConstantBlock
-from pyVHDLParser.Blocks.Object.Signal        import SignalBlock
+from pyVHDLParser.Blocks.Object               import ConstantDeclarationBlock as ConstantBlock
+from pyVHDLParser.Blocks.Object               import SignalDeclarationBlock as SignalBlock
 from pyVHDLParser.Blocks.Reference            import Context, Library, Use
 from pyVHDLParser.Blocks.Reporting.Assert     import AssertBlock
 from pyVHDLParser.Blocks.Sequential           import Package, PackageBody, Function, Procedure, Process
 from pyVHDLParser.Blocks.Structural           import Entity, Architecture, Component, Configuration
 from pyVHDLParser.Groups                      import BlockParserException, Group, EndOfDocumentGroup, ParserState
-from pyVHDLParser.Groups.Comment              import CommentGroup, WhitespaceGroup
+from pyVHDLParser.Groups.Comment              import CommentGroup, WhitespaceGroup, TRIVIA_GROUPS
 from pyVHDLParser.Groups.Concurrent           import AssertGroup
 from pyVHDLParser.Groups.List                 import GenericListGroup, ParameterListGroup, PortListGroup
 from pyVHDLParser.Groups.Object               import ConstantGroup, SignalGroup
@@ -75,30 +75,29 @@ class ContextGroup(Group):
 		if isinstance(currentBlock, Context.NameBlock):
 			return
 		elif isinstance(currentBlock, Context.EndBlock):
-			parserState.NextGroup =   cls(parserState.LastGroup, parserState.BlockMarker, parserState.Block)
+			parserState.NextGroup.EndBlock =      currentBlock
+			if currentBlock.MultiPart:
+				return
+
+			# keep the collected sub-groups and link the finished group behind its last sub-group
+			parserState.NextGroup.PreviousGroup = parserState.LastGroup
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState = WhitespaceGroup.stateParse
-			parserState.NextGroup = WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue = True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState = CommentGroup.stateParse
-			parserState.NextGroup = CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group = TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState = group.stateParse
+			parserState.NextGroup = group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue = True
 			return
 		else:
-			for block in cls.SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			if (currentBlock.__class__ in cls.SIMPLE_BLOCKS):
+				group =                   cls.SIMPLE_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -156,7 +155,10 @@ class EntityGroup(Group):
 	def stateParseGenerics(cls, parserState: ParserState):
 		currentBlock = parserState.Block
 
-		if isinstance(currentBlock, GenericList.OpenBlock):
+		if isinstance(currentBlock, Entity.NameBlock):
+			# remainder of a multi-part name block
+			return
+		elif isinstance(currentBlock, GenericList.OpenBlock):
 			parserState.NextState =   cls.stateParsePorts
 			parserState.PushState =   GenericListGroup.stateParse
 			parserState.NextGroup =   GenericListGroup(parserState.LastGroup, currentBlock)
@@ -170,15 +172,10 @@ class EntityGroup(Group):
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
@@ -187,7 +184,9 @@ class EntityGroup(Group):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
 			return
 
-		raise BlockParserException("End of generic clause not found.", currentBlock)
+		# no generic clause
+		parserState.NextState =   cls.stateParsePorts
+		parserState.ReIssue =     True
 
 	@classmethod
 	def stateParsePorts(cls, parserState: ParserState):
@@ -200,15 +199,10 @@ class EntityGroup(Group):
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
@@ -217,7 +211,9 @@ class EntityGroup(Group):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
 			return
 
-		raise BlockParserException("End of port clause not found.", currentBlock)
+		# no port clause
+		parserState.NextState =   cls.stateParseDeclarations
+		parserState.ReIssue =     True
 
 	@classmethod
 	def stateParseDeclarations(cls, parserState: ParserState):
@@ -227,38 +223,36 @@ class EntityGroup(Group):
 			parserState.NextState =   cls.stateParseStatements
 			return
 		elif isinstance(currentBlock, Entity.EndBlock):
-			parserState.NextGroup =   cls(parserState.LastGroup, parserState.BlockMarker, parserState.Block)
+			parserState.NextGroup.EndBlock =      currentBlock
+			if currentBlock.MultiPart:
+				return
+
+			# keep the collected sub-groups and link the finished group behind its last sub-group
+			parserState.NextGroup.PreviousGroup = parserState.LastGroup
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			if (currentBlock.__class__ in cls.DECLARATION_SIMPLE_BLOCKS):
+				group =                   cls.DECLARATION_SIMPLE_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
+
+			if (currentBlock.__class__ in cls.DECLARATION_COMPOUND_BLOCKS):
+				group =                   cls.DECLARATION_COMPOUND_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -271,38 +265,36 @@ class EntityGroup(Group):
 		currentBlock = parserState.Block
 
 		if isinstance(currentBlock, Entity.EndBlock):
-			parserState.NextGroup =   cls(parserState.LastGroup, parserState.BlockMarker, parserState.Block)
+			parserState.NextGroup.EndBlock =      currentBlock
+			if currentBlock.MultiPart:
+				return
+
+			# keep the collected sub-groups and link the finished group behind its last sub-group
+			parserState.NextGroup.PreviousGroup = parserState.LastGroup
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.STATEMENT_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.STATEMENT_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.STATEMENT_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.STATEMENT_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			if (currentBlock.__class__ in cls.STATEMENT_SIMPLE_BLOCKS):
+				group =                   cls.STATEMENT_SIMPLE_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
+
+			if (currentBlock.__class__ in cls.STATEMENT_COMPOUND_BLOCKS):
+				group =                   cls.STATEMENT_COMPOUND_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -349,17 +341,13 @@ class ArchitectureGroup(Group):
 		currentBlock = parserState.Block
 
 		if isinstance(currentBlock, Architecture.NameBlock):
-			parserState.NextState =   cls.stateParseDeclarations
-			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
+			if (not currentBlock.MultiPart):
+				parserState.NextState = cls.stateParseDeclarations
 			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
@@ -378,34 +366,27 @@ class ArchitectureGroup(Group):
 		if isinstance(currentBlock, Architecture.BeginBlock):
 			parserState.NextState =   cls.stateParseStatements
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			if (currentBlock.__class__ in cls.DECLARATION_SIMPLE_BLOCKS):
+				group =                   cls.DECLARATION_SIMPLE_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
+
+			if (currentBlock.__class__ in cls.DECLARATION_COMPOUND_BLOCKS):
+				group =                   cls.DECLARATION_COMPOUND_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -420,38 +401,36 @@ class ArchitectureGroup(Group):
 		currentBlock = parserState.Block
 
 		if isinstance(currentBlock, Architecture.EndBlock):
-			parserState.NextGroup =   cls(parserState.LastGroup, parserState.BlockMarker, parserState.Block)
+			parserState.NextGroup.EndBlock =      currentBlock
+			if currentBlock.MultiPart:
+				return
+
+			# keep the collected sub-groups and link the finished group behind its last sub-group
+			parserState.NextGroup.PreviousGroup = parserState.LastGroup
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.STATEMENT_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.STATEMENT_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.STATEMENT_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.STATEMENT_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			if (currentBlock.__class__ in cls.STATEMENT_SIMPLE_BLOCKS):
+				group =                   cls.STATEMENT_SIMPLE_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
+
+			if (currentBlock.__class__ in cls.STATEMENT_COMPOUND_BLOCKS):
+				group =                   cls.STATEMENT_COMPOUND_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -495,38 +474,36 @@ class PackageGroup(Group):
 		if isinstance(currentBlock, Package.NameBlock):
 			return
 		elif isinstance(currentBlock, Package.EndBlock):
-			parserState.NextGroup = cls(parserState.LastGroup, parserState.BlockMarker, parserState.Block)
+			parserState.NextGroup.EndBlock =      currentBlock
+			if currentBlock.MultiPart:
+				return
+
+			# keep the collected sub-groups and link the finished group behind its last sub-group
+			parserState.NextGroup.PreviousGroup = parserState.LastGroup
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState = WhitespaceGroup.stateParse
-			parserState.NextGroup = WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue = True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState = CommentGroup.stateParse
-			parserState.NextGroup = CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group = TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState = group.stateParse
+			parserState.NextGroup = group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue = True
 			return
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			if (currentBlock.__class__ in cls.DECLARATION_SIMPLE_BLOCKS):
+				group =                   cls.DECLARATION_SIMPLE_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
+
+			if (currentBlock.__class__ in cls.DECLARATION_COMPOUND_BLOCKS):
+				group =                   cls.DECLARATION_COMPOUND_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -570,39 +547,37 @@ class PackageBodyGroup(Group):
 		if isinstance(currentBlock, PackageBody.NameBlock):
 			return
 		elif isinstance(currentBlock, PackageBody.EndBlock):
-			parserState.NextGroup = cls(parserState.LastGroup, parserState.BlockMarker, parserState.Block)
+			parserState.NextGroup.EndBlock =      currentBlock
+			if currentBlock.MultiPart:
+				return
+
+			# keep the collected sub-groups and link the finished group behind its last sub-group
+			parserState.NextGroup.PreviousGroup = parserState.LastGroup
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState = WhitespaceGroup.stateParse
-			parserState.NextGroup = WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue = True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState = CommentGroup.stateParse
-			parserState.NextGroup = CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group = TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState = group.stateParse
+			parserState.NextGroup = group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue = True
 			return
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.NextGroup =   group(parserState.LastGroup, parserState.BlockMarker, currentBlock)
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			if (currentBlock.__class__ in cls.DECLARATION_SIMPLE_BLOCKS):
+				group =                   cls.DECLARATION_SIMPLE_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
+
+			if (currentBlock.__class__ in cls.DECLARATION_COMPOUND_BLOCKS):
+				group =                   cls.DECLARATION_COMPOUND_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.NextGroup =   group(parserState.LastGroup, parserState.BlockMarker, currentBlock)
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -638,38 +613,36 @@ class ComponentGroup(Group):
 		if isinstance(currentBlock, Component.NameBlock):
 			return
 		elif isinstance(currentBlock, Component.EndBlock):
-			parserState.NextGroup = cls(parserState.LastGroup, parserState.BlockMarker, parserState.Block)
+			parserState.NextGroup.EndBlock =      currentBlock
+			if currentBlock.MultiPart:
+				return
+
+			# keep the collected sub-groups and link the finished group behind its last sub-group
+			parserState.NextGroup.PreviousGroup = parserState.LastGroup
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState = WhitespaceGroup.stateParse
-			parserState.NextGroup = WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue = True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState = CommentGroup.stateParse
-			parserState.NextGroup = CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group = TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState = group.stateParse
+			parserState.NextGroup = group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue = True
 			return
 		else:
-			for block in cls.SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			if (currentBlock.__class__ in cls.SIMPLE_BLOCKS):
+				group =                   cls.SIMPLE_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
+
+			if (currentBlock.__class__ in cls.COMPOUND_BLOCKS):
+				group =                   cls.COMPOUND_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -704,38 +677,36 @@ class ConfigurationGroup(Group):
 		if isinstance(currentBlock, Configuration.NameBlock):
 			return
 		elif isinstance(currentBlock, Configuration.EndBlock):
-			parserState.NextGroup = cls(parserState.LastGroup, parserState.BlockMarker, parserState.Block)
+			parserState.NextGroup.EndBlock =      currentBlock
+			if currentBlock.MultiPart:
+				return
+
+			# keep the collected sub-groups and link the finished group behind its last sub-group
+			parserState.NextGroup.PreviousGroup = parserState.LastGroup
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState = WhitespaceGroup.stateParse
-			parserState.NextGroup = WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue = True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState = CommentGroup.stateParse
-			parserState.NextGroup = CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group = TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState = group.stateParse
+			parserState.NextGroup = group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue = True
 			return
 		else:
-			for block in cls.SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.SIMPLE_BLOCKS[block]
-					parserState.PushState = group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue = True
-					return
-
-			for block in cls.COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.COMPOUND_BLOCKS[block]
-					parserState.PushState = group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue = True
-					return
+			if (currentBlock.__class__ in cls.SIMPLE_BLOCKS):
+				group =                   cls.SIMPLE_BLOCKS[currentBlock.__class__]
+				parserState.PushState = group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue = True
+				return
+
+			if (currentBlock.__class__ in cls.COMPOUND_BLOCKS):
+				group =                   cls.COMPOUND_BLOCKS[currentBlock.__class__]
+				parserState.PushState = group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue = True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
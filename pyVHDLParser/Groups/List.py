@@ -33,7 +33,7 @@ from pyVHDLParser.Blocks            import CommentBlock, EndOfDocumentBlock
 from pyVHDLParser.Blocks.Common     import LinebreakBlock, IndentationBlock
 from pyVHDLParser.Blocks.List       import GenericList, ParameterList, PortList, SensitivityList
 from pyVHDLParser.Groups            import ParserState, BlockParserException, Group, EndOfDocumentGroup
-from pyVHDLParser.Groups.Comment    import WhitespaceGroup, CommentGroup
+from pyVHDLParser.Groups.Comment    import WhitespaceGroup, CommentGroup, TRIVIA_GROUPS
 
 
 class GenericListGroup(Group):
@@ -61,15 +61,10 @@ class GenericListGroup(Group):
 		elif isinstance(currentBlock, GenericList.CloseBlock):
 			parserState.Pop()
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
@@ -129,20 +124,15 @@ class PortListGroup(Group):
 
 		if isinstance(currentBlock, PortList.OpenBlock):
 			return
-		elif isinstance(currentBlock, (pyVHDLParser.Blocks.InterfaceObject.InterfaceSignalBlock, PortList.DelimiterBlock)):
+		elif isinstance(currentBlock, (pyVHDLParser.Blocks.InterfaceObject.InterfaceSignalBlock, PortList.DefaultValueExpressionBlock, PortList.DelimiterBlock)):
 			return
 		elif isinstance(currentBlock, PortList.CloseBlock):
 			parserState.Pop()
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
@@ -202,20 +192,17 @@ class ParameterListGroup(Group):
 
 		if isinstance(currentBlock, ParameterList.OpenBlock):
 			return
-		elif isinstance(currentBlock, (ParameterList.ItemBlock, ParameterList.DelimiterBlock)):
+		elif isinstance(currentBlock, (ParameterList.ItemBlock, ParameterList.DelimiterBlock, pyVHDLParser.Blocks.InterfaceObject.InterfaceObjectBlock)):
+			parserState.NextGroup.EndBlock = currentBlock
 			return
 		elif isinstance(currentBlock, ParameterList.CloseBlock):
+			parserState.NextGroup.EndBlock = currentBlock
 			parserState.Pop()
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
@@ -224,7 +211,9 @@ class ParameterListGroup(Group):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
 			return
 
-		raise BlockParserException("End of generic list not found.", currentBlock)
+		# a function's closing parenthesis is part of its return type block, so any other block ends the list
+		parserState.Pop()
+		parserState.ReIssue =     True
 
 
 class ParameterListItemGroup(Group):
@@ -276,19 +265,16 @@ class SensitivityListGroup(Group):
 		if isinstance(currentBlock, SensitivityList.OpenBlock):
 			return
 		elif isinstance(currentBlock, (SensitivityList.ItemBlock, SensitivityList.DelimiterBlock)):
+			parserState.NextGroup.EndBlock = currentBlock
 			return
 		elif isinstance(currentBlock, SensitivityList.CloseBlock):
+			parserState.NextGroup.EndBlock = currentBlock
 			parserState.Pop()
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
@@ -297,7 +283,9 @@ class SensitivityListGroup(Group):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
 			return
 
-		raise BlockParserException("End of generic list not found.", currentBlock)
+		# the closing parenthesis is part of the next block, so any other block ends the list
+		parserState.Pop()
+		parserState.ReIssue =     True
 
 
 class SensitivityListItemGroup(Group):
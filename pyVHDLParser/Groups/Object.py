@@ -28,9 +28,10 @@
 # ==============================================================================
 #
 # load dependencies
-from pyVHDLParser.Blocks.Object.Constant    import ConstantBlock
-from pyVHDLParser.Blocks.Object.Signal      import SignalBlock
-from pyVHDLParser.Blocks.Object.Variable    import VariableBlock
+from pyVHDLParser.Blocks.Object             import ConstantDeclarationBlock as ConstantBlock
+from pyVHDLParser.Blocks.Object             import SignalDeclarationBlock as SignalBlock
+from pyVHDLParser.Blocks.Object             import VariableDeclarationBlock as VariableBlock
+from pyVHDLParser.Blocks.Object             import ConstantDeclarationEndMarkerBlock, VariableDeclarationEndMarkerBlock, SignalDeclarationEndMarkerBlock
 from pyVHDLParser.Blocks.Reference.Library  import EndBlock, StartBlock
 from pyVHDLParser.Blocks.Reference.Use      import EndBlock, StartBlock
 from pyVHDLParser.Groups                    import ParserState, BlockParserException, Group
@@ -39,15 +40,13 @@ class ConstantGroup(Group):
 	@classmethod
 	def stateParse(cls, parserState: ParserState):
 		marker = parserState.Block
-		if parserState.Block.MultiPart:
-			for block in parserState.GetBlockIterator:
-				if (isinstance(block, ConstantBlock) and not block.MultiPart):
-					marker2 = block
-					break
-			else:
-				raise BlockParserException("End of multi parted constant declaration not found.", block)
+		# a declaration ends with its end marker block (';'), which follows the optional default expression
+		for block in parserState.GetBlockIterator:
+			if isinstance(block, ConstantDeclarationEndMarkerBlock):
+				marker2 = block
+				break
 		else:
-			marker2 = marker
+			raise BlockParserException("End of constant declaration not found.", marker)
 
 		parserState.NextGroup = cls(parserState.LastGroup, marker, marker2)
 		parserState.Pop()
@@ -58,15 +57,12 @@ class VariableGroup(Group):
 	@classmethod
 	def stateParse(cls, parserState: ParserState):
 		marker = parserState.Block
-		if parserState.Block.MultiPart:
-			for block in parserState.GetBlockIterator:
-				if (isinstance(block, VariableBlock) and not block.MultiPart):
-					marker2 = block
-					break
-			else:
-				raise BlockParserException("End of multi parted variable declaration not found.", block)
+		for block in parserState.GetBlockIterator:
+			if isinstance(block, VariableDeclarationEndMarkerBlock):
+				marker2 = block
+				break
 		else:
-			marker2 = marker
+			raise BlockParserException("End of variable declaration not found.", marker)
 
 		parserState.NextGroup = cls(parserState.LastGroup, marker, marker2)
 		parserState.Pop()
@@ -77,15 +73,12 @@ class SignalGroup(Group):
 	@classmethod
 	def stateParse(cls, parserState: ParserState):
 		marker = parserState.Block
-		if parserState.Block.MultiPart:
-			for block in parserState.GetBlockIterator:
-				if (isinstance(block, SignalBlock) and not block.MultiPart):
-					marker2 = block
-					break
-			else:
-				raise BlockParserException("End of multi parted signal declaration not found.", block)
+		for block in parserState.GetBlockIterator:
+			if isinstance(block, SignalDeclarationEndMarkerBlock):
+				marker2 = block
+				break
 		else:
-			marker2 = marker
+			raise BlockParserException("End of signal declaration not found.", marker)
 
 		parserState.NextGroup = cls(parserState.LastGroup, marker, marker2)
 		parserState.Pop()
@@ -35,13 +35,13 @@ from pyVHDLParser.Token.Keywords          import EndToken
 from pyVHDLParser.Blocks                  import CommentBlock, EndOfDocumentBlock
 from pyVHDLParser.Blocks.Common           import LinebreakBlock, IndentationBlock
 from pyVHDLParser.Blocks.List             import GenericList, ParameterList
-from pyVHDLParser.Blocks.Object.Constant  import ConstantBlock
-from pyVHDLParser.Blocks.Object.Variable  import VariableBlock
+from pyVHDLParser.Blocks.Object           import ConstantDeclarationBlock as ConstantBlock
+from pyVHDLParser.Blocks.Object           import VariableDeclarationBlock as VariableBlock
 from pyVHDLParser.Blocks.Reference        import Use
 from pyVHDLParser.Blocks.Reporting.Report import ReportBlock
 from pyVHDLParser.Blocks.Sequential       import Function
 from pyVHDLParser.Groups                  import ParserState, Group, BlockParserException, EndOfDocumentGroup
-from pyVHDLParser.Groups.Comment          import WhitespaceGroup, CommentGroup
+from pyVHDLParser.Groups.Comment          import WhitespaceGroup, CommentGroup, TRIVIA_GROUPS
 from pyVHDLParser.Groups.Concurrent       import ReportGroup
 from pyVHDLParser.Groups.List             import GenericListGroup, ParameterListGroup
 from pyVHDLParser.Groups.Object           import ConstantGroup, VariableGroup
@@ -75,9 +75,11 @@ class FunctionGroup(Group):
 				self.STATEMENT_SIMPLE_BLOCKS.values(),
 				self.STATEMENT_COMPOUND_BLOCKS.values()
 			)},
-			{CommentGroup:    [],
-			 WhitespaceGroup: [],
-			 ReturnTypeGroup:  []
+			{CommentGroup:        [],
+			 WhitespaceGroup:     [],
+			 GenericListGroup:    [],
+			 ParameterListGroup:  [],
+			 ReturnTypeGroup:     []
 			 }
 		))
 
@@ -106,7 +108,8 @@ class FunctionGroup(Group):
 			parserState.ReIssue =     True
 			return
 		elif isinstance(currentBlock, ParameterList.OpenBlock):
-			parserState.NextState =   cls.stateParseDeclarations
+			# the return type block follows the parameter list
+			parserState.NextState =   cls.stateParseGenerics
 			parserState.PushState =   ParameterListGroup.stateParse
 			parserState.NextGroup =   ParameterListGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
@@ -119,15 +122,10 @@ class FunctionGroup(Group):
 				parserState.NextState =   cls.stateParse2
 				parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
@@ -149,15 +147,10 @@ class FunctionGroup(Group):
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
@@ -197,34 +190,27 @@ class FunctionGroup(Group):
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			if (currentBlock.__class__ in cls.DECLARATION_SIMPLE_BLOCKS):
+				group =                   cls.DECLARATION_SIMPLE_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			if (currentBlock.__class__ in cls.DECLARATION_COMPOUND_BLOCKS):
+				group =                   cls.DECLARATION_COMPOUND_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -240,34 +226,27 @@ class FunctionGroup(Group):
 			# parserState.NextGroup =   cls(parserState.LastGroup, parserState.BlockMarker, parserState.Block)
 			parserState.Pop()
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.STATEMENT_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.STATEMENT_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			if (currentBlock.__class__ in cls.STATEMENT_SIMPLE_BLOCKS):
+				group =                   cls.STATEMENT_SIMPLE_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
-			for block in cls.STATEMENT_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.STATEMENT_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			if (currentBlock.__class__ in cls.STATEMENT_COMPOUND_BLOCKS):
+				group =                   cls.STATEMENT_COMPOUND_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
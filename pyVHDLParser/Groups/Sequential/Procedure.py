@@ -34,13 +34,13 @@ from itertools                            import chain
 from pyVHDLParser.Blocks                  import CommentBlock, EndOfDocumentBlock
 from pyVHDLParser.Blocks.Common           import LinebreakBlock, IndentationBlock
 from pyVHDLParser.Blocks.List             import GenericList, ParameterList
-from pyVHDLParser.Blocks.Object.Constant  import ConstantBlock
-from pyVHDLParser.Blocks.Object.Variable  import VariableBlock
+from pyVHDLParser.Blocks.Object           import ConstantDeclarationBlock as ConstantBlock
+from pyVHDLParser.Blocks.Object           import VariableDeclarationBlock as VariableBlock
 from pyVHDLParser.Blocks.Reference        import Use
 from pyVHDLParser.Blocks.Reporting.Report import ReportBlock
 from pyVHDLParser.Blocks.Sequential       import Procedure
 from pyVHDLParser.Groups                  import ParserState, Group, BlockParserException, EndOfDocumentGroup
-from pyVHDLParser.Groups.Comment          import WhitespaceGroup, CommentGroup
+from pyVHDLParser.Groups.Comment          import WhitespaceGroup, CommentGroup, TRIVIA_GROUPS
 from pyVHDLParser.Groups.List             import GenericListGroup, ParameterListGroup
 from pyVHDLParser.Groups.Object           import ConstantGroup, VariableGroup
 from pyVHDLParser.Groups.Reference        import UseGroup
@@ -112,15 +112,10 @@ class ProcedureGroup(Group):
 		elif isinstance(currentBlock, Procedure.VoidBlock):
 			parserState.NextState =   cls.stateParseDeclarations
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
@@ -143,15 +138,10 @@ class ProcedureGroup(Group):
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
@@ -174,34 +164,27 @@ class ProcedureGroup(Group):
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			if (currentBlock.__class__ in cls.DECLARATION_SIMPLE_BLOCKS):
+				group =                   cls.DECLARATION_SIMPLE_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
+
+			if (currentBlock.__class__ in cls.DECLARATION_COMPOUND_BLOCKS):
+				group =                   cls.DECLARATION_COMPOUND_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -218,34 +201,27 @@ class ProcedureGroup(Group):
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.STATEMENT_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.STATEMENT_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.STATEMENT_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.STATEMENT_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			if (currentBlock.__class__ in cls.STATEMENT_SIMPLE_BLOCKS):
+				group =                   cls.STATEMENT_SIMPLE_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
+
+			if (currentBlock.__class__ in cls.STATEMENT_COMPOUND_BLOCKS):
+				group =                   cls.STATEMENT_COMPOUND_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
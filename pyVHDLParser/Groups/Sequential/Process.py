@@ -34,13 +34,13 @@ from itertools                            import chain
 from pyVHDLParser.Blocks                  import CommentBlock, EndOfDocumentBlock
 from pyVHDLParser.Blocks.Common           import LinebreakBlock, IndentationBlock
 from pyVHDLParser.Blocks.List             import SensitivityList, GenericList, ParameterList
-from pyVHDLParser.Blocks.Object.Constant  import ConstantBlock
-from pyVHDLParser.Blocks.Object.Variable  import VariableBlock
+from pyVHDLParser.Blocks.Object           import ConstantDeclarationBlock as ConstantBlock
+from pyVHDLParser.Blocks.Object           import VariableDeclarationBlock as VariableBlock
 from pyVHDLParser.Blocks.Reference        import Use
 from pyVHDLParser.Blocks.Reporting.Report import ReportBlock
 from pyVHDLParser.Blocks.Sequential       import Process
 from pyVHDLParser.Groups                  import ParserState, Group, BlockParserException, EndOfDocumentGroup
-from pyVHDLParser.Groups.Comment          import WhitespaceGroup, CommentGroup
+from pyVHDLParser.Groups.Comment          import WhitespaceGroup, CommentGroup, TRIVIA_GROUPS
 from pyVHDLParser.Groups.List             import GenericListGroup, ParameterListGroup, SensitivityListGroup
 from pyVHDLParser.Groups.Object           import ConstantGroup, VariableGroup
 from pyVHDLParser.Groups.Reference        import UseGroup
@@ -73,8 +73,9 @@ class ProcessGroup(Group):
 				self.STATEMENT_SIMPLE_BLOCKS.values(),
 				self.STATEMENT_COMPOUND_BLOCKS.values()
 			)},
-			{CommentGroup: [],
-			 WhitespaceGroup: []
+			{CommentGroup:         [],
+			 WhitespaceGroup:      [],
+			 SensitivityListGroup: []
 			 }
 		))
 
@@ -95,22 +96,20 @@ class ProcessGroup(Group):
 	def stateParseSensitivityList(cls, parserState: ParserState):
 		currentBlock = parserState.Block
 
-		if isinstance(currentBlock, SensitivityList.OpenBlock):
+		if isinstance(currentBlock, (SensitivityList.OpenBlock, SensitivityList.ItemBlock)):
 			parserState.NextState =   cls.stateParseDeclarations
 			parserState.PushState =   SensitivityListGroup.stateParse
 			parserState.NextGroup =   SensitivityListGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
+		elif isinstance(currentBlock, Process.OpenBlock):
+			# remainder of a multi-part open block
 			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
@@ -119,7 +118,9 @@ class ProcessGroup(Group):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
 			return
 
-		raise BlockParserException("End of process sensitivity list not found.", currentBlock)
+		# no sensitivity list
+		parserState.NextState =   cls.stateParseDeclarations
+		parserState.ReIssue =     True
 
 	@classmethod
 	def stateParseDeclarations(cls, parserState: ParserState):
@@ -128,39 +129,39 @@ class ProcessGroup(Group):
 		if isinstance(currentBlock, Process.BeginBlock):
 			parserState.NextState =   cls.stateParseStatements
 			return
+		elif isinstance(currentBlock, Process.OpenBlock2):
+			# closing parenthesis of the sensitivity list and keyword IS
+			return
 		elif isinstance(currentBlock, Process.EndBlock):
-			parserState.NextGroup =   cls(parserState.LastGroup, parserState.BlockMarker, parserState.Block)
+			parserState.NextGroup.EndBlock =      currentBlock
+			if currentBlock.MultiPart:
+				return
+
+			parserState.NextGroup.PreviousGroup = parserState.LastGroup
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			if (currentBlock.__class__ in cls.DECLARATION_SIMPLE_BLOCKS):
+				group =                   cls.DECLARATION_SIMPLE_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
+
+			if (currentBlock.__class__ in cls.DECLARATION_COMPOUND_BLOCKS):
+				group =                   cls.DECLARATION_COMPOUND_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -173,38 +174,35 @@ class ProcessGroup(Group):
 		currentBlock = parserState.Block
 
 		if isinstance(currentBlock, Process.EndBlock):
-			parserState.NextGroup =   cls(parserState.LastGroup, parserState.BlockMarker, parserState.Block)
+			parserState.NextGroup.EndBlock =      currentBlock
+			if currentBlock.MultiPart:
+				return
+
+			parserState.NextGroup.PreviousGroup = parserState.LastGroup
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
-			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (currentBlock.__class__ in TRIVIA_GROUPS):
+			group =                   TRIVIA_GROUPS[currentBlock.__class__]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.STATEMENT_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.STATEMENT_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.STATEMENT_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.STATEMENT_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			if (currentBlock.__class__ in cls.STATEMENT_SIMPLE_BLOCKS):
+				group =                   cls.STATEMENT_SIMPLE_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
+
+			if (currentBlock.__class__ in cls.STATEMENT_COMPOUND_BLOCKS):
+				group =                   cls.STATEMENT_COMPOUND_BLOCKS[currentBlock.__class__]
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
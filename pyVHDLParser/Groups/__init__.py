@@ -27,19 +27,21 @@
 # limitations under the License.
 # ==============================================================================
 #
+from bisect                                 import bisect_right
+from heapq                                  import merge
 from types                                  import FunctionType
-from typing                                 import Iterator
+from collections.abc                        import Iterator
 
-from pyVHDLParser                           import StartOfDocument, EndOfDocument, StartOfSnippet, EndOfSnippet
+from pyVHDLParser                           import StartOfDocument, EndOfDocument, StartOfSnippet, EndOfSnippet, TypeDispatchMap, ImportSubmodule
 from pyVHDLParser.Base                      import ParserException
-from pyVHDLParser.Blocks                    import Block, CommentBlock, StartOfDocumentBlock, EndOfDocumentBlock
-from pyVHDLParser.Blocks.Common             import LinebreakBlock, IndentationBlock
-from pyVHDLParser.Blocks.Reference          import Context, Library, Use
-from pyVHDLParser.Blocks.Sequential         import Package, PackageBody
-from pyVHDLParser.Blocks.Structural         import Entity, Architecture, Configuration
+from pyVHDLParser.Blocks                    import Block, StartOfDocumentBlock, EndOfDocumentBlock
 from pyVHDLParser.Functions                 import Console
 
 
+def __getattr__(name):
+	return ImportSubmodule(__name__, name)
+
+
 class BlockParserException(ParserException):
 	def __init__(self, message, block):
 		super().__init__(message)
@@ -48,8 +50,17 @@ class BlockParserException(ParserException):
 
 class BlockToGroupParser:
 	@staticmethod
-	def Transform(blockGenerator, debug=False):
-		return ParserState(blockGenerator, debug=debug).GetGenerator()
+	def Transform(blockGenerator, debug=False, streaming=False):
+		"""Transform a block stream into a stream of groups.
+
+		If 'streaming' is true, groups aren't registered as sub-groups of their parents, so :meth:`Group.GetSubGroups`
+		and :meth:`Group.GetSubGroupAt` find nothing. The groups in front of the predecessor of a yielded group are
+		unlinked, so memory use doesn't grow with the document. Combine it with a streaming block stream, as groups
+		reference their start and end blocks.
+		"""
+		parserState = ParserState(blockGenerator, debug=debug)
+		parserState.Streaming = streaming
+		return parserState.GetGenerator()
 
 
 # @staticmethod
@@ -87,6 +98,7 @@ class ParserState:
 		self.Block        : Block = None
 		self.NewBlock     : Block = None
 		self.LastGroup    : Group = None
+		self.Streaming =            False
 
 		self._stack =               []
 		self._iterator =            iter(_BlockIterator(self, blockGenerator))
@@ -154,7 +166,7 @@ class ParserState:
 		self._blockMarker = top[1]
 		self.NextGroup =    top[2]
 		# print("{MAGENTA}appending {0!s} to {1!s}{NOCOLOR}".format(self.NewGroup.__class__.__qualname__, self.NextGroup.__class__,**Console.Foreground))
-		if (self.NextGroup.InnerGroup is None):
+		if ((self.NextGroup.InnerGroup is None) and not self.Streaming):
 			self.NextGroup.InnerGroup = self.NewGroup
 		if (self.NewGroup.__class__ not in self.NextGroup._subGroups):
 			raise BlockParserException("Group '{group1}' not supported in {group2}.".format(
@@ -162,7 +174,23 @@ class ParserState:
 				group2=self.NextGroup.__class__.__qualname__
 			), self.Block)
 
-		self.NextGroup._subGroups[self.NewGroup.__class__].append(self.NewGroup)
+		# not all groups record their closing block, so the enclosing group is extended to the end of the new group
+		endBlock = self.NextGroup.EndBlock
+		if ((endBlock is not None) and (self.NewGroup.EndBlock.EndToken.End.Absolute > endBlock.EndToken.End.Absolute)):
+			self.NextGroup.EndBlock = self.NewGroup.EndBlock
+
+		if (not self.Streaming):
+			self.NextGroup.AddSubGroup(self.NewGroup)
+
+	@staticmethod
+	def ReleaseConsumed(group):
+		"""Unlink all groups in front of the predecessor of 'group'."""
+		previousGroup = group._previousGroup
+		if ((previousGroup is None) or (previousGroup._previousGroup is None)):
+			return
+
+		previousGroup._previousGroup.NextGroup =  None
+		previousGroup._previousGroup =            None
 
 	def GetGenerator(self):
 		from pyVHDLParser.Groups            import BlockParserException
@@ -187,6 +215,8 @@ class ParserState:
 
 				# yield a new group
 				if (self.NewGroup is not None):
+					if self.Streaming:
+						self.ReleaseConsumed(self.NewGroup)
 					yield self.NewGroup
 					self.LastGroup = self.NewGroup
 					self.NewGroup = None
@@ -199,19 +229,23 @@ class ParserState:
 
 
 class MetaGroup(type):
-	"""Register all state*** methods in an array called '__STATES__'"""
+	"""Register all state*** methods in an array called '__STATES__' and turn all '*_BLOCKS' tables into block type dispatch maps."""
 	def __new__(cls, className, baseClasses, classMembers : dict):
 		states = []
 		for memberName, memberObject in classMembers.items():
 			if (isinstance(memberObject, FunctionType) and (memberName[:5] == "state")):
 				states.append(memberObject)
+			elif ((memberName[-7:] == "_BLOCKS") and isinstance(memberObject, dict)):
+				classMembers[memberName] = TypeDispatchMap(memberObject)
 
 		classMembers['__STATES__'] = states
 		return super().__new__(cls, className, baseClasses, classMembers)
 
 
 class Group(metaclass=MetaGroup):
-	__STATES__ = None
+	__STATES__ =        None
+	# (group class, requested group types) -> sub-group classes, which are subclasses of the requested types
+	__SUBGROUP_KEYS__ = {}
 
 	def __init__(self, previousGroup, startBlock, endBlock=None):
 		previousGroup.NextGroup =               self
@@ -219,6 +253,8 @@ class Group(metaclass=MetaGroup):
 		self.NextGroup  : Group =               None
 		self.InnerGroup : Group =               None
 		self._subGroups : {MetaGroup: Group} =  {}
+		self._children  : [Group] =             []
+		self._childStarts : [int] =             []
 
 		self.StartBlock : Block =               startBlock
 		self.EndBlock   : Block =               startBlock if (endBlock is None) else endBlock
@@ -229,7 +265,6 @@ class Group(metaclass=MetaGroup):
 
 	def __iter__(self):
 		block = self.StartBlock
-		print("group={0}({1})  start={2!s}  end={3!s}".format(self.__class__.__name__, self.__class__.__module__, self.StartBlock.StartToken, self.EndBlock.EndToken))
 		while (block is not self.EndBlock):
 			yield block
 			if (block.NextBlock is None):
@@ -254,11 +289,53 @@ class Group(metaclass=MetaGroup):
 			end=self.EndBlock.EndToken.End
 		)
 
+	def AddSubGroup(self, group):
+		"""Register a completed sub-group in the per-type index and the position-sorted child index."""
+		self._subGroups[group.__class__].append(group)
+
+		start = group.StartBlock.StartToken.Start.Absolute
+		# sub-groups are completed in document order, so appending keeps the index sorted
+		if ((not self._childStarts) or (self._childStarts[-1] <= start)):
+			self._children.append(group)
+			self._childStarts.append(start)
+		else:
+			index = bisect_right(self._childStarts, start)
+			self._children.insert(index, group)
+			self._childStarts.insert(index, start)
+
 	def GetSubGroups(self, groupTypes=None):
-		group = self.InnerGroup
-		while (group is not None):
-			yield group
-			group = group.NextGroup
+		"""Return the direct sub-groups in document order, optionally only instances of 'groupTypes' (a group class or an iterable of classes).
+
+		Nested groups are returned by the sub-groups themselves. Unlike following :attr:`NextGroup` from
+		:attr:`InnerGroup`, the iteration doesn't continue behind the end of this group. Sub-groups aren't registered
+		by a streaming :meth:`BlockToGroupParser.Transform`, so nothing is returned in that mode.
+		"""
+		if (groupTypes is None):
+			return iter(self._children)
+		elif (not isinstance(groupTypes, type)):
+			groupTypes = tuple(groupTypes)
+
+		cacheKey = (self.__class__, groupTypes)
+		try:
+			subGroupKeys = self.__SUBGROUP_KEYS__[cacheKey]
+		except KeyError:
+			subGroupKeys = self.__SUBGROUP_KEYS__[cacheKey] = tuple(groupClass for groupClass in self._subGroups if issubclass(groupClass, groupTypes))
+
+		subGroupLists = [self._subGroups[groupClass] for groupClass in subGroupKeys if self._subGroups[groupClass]]
+		if (len(subGroupLists) == 1):
+			return iter(subGroupLists[0])
+		return merge(*subGroupLists, key=lambda group: group.StartBlock.StartToken.Start.Absolute)
+
+	def GetSubGroupAt(self, offset):
+		"""Return the direct sub-group, which covers 'offset' (compared to :attr:`SourceCodePosition.Absolute`), or None.
+
+		Like :meth:`GetSubGroups`, it returns None for groups of a streaming :meth:`BlockToGroupParser.Transform`.
+		"""
+		index = bisect_right(self._childStarts, offset) - 1
+		if (index < 0):
+			return None
+		group = self._children[index]
+		return group if (offset <= group.EndBlock.EndToken.End.Absolute) else None
 
 	@property
 	def PreviousGroup(self):
@@ -283,6 +360,8 @@ class StartOfGroup(Group):
 		self.NextGroup  : Group =               None
 		self.InnerGroup : Group =               None
 		self._subGroups : {MetaGroup: Group} =  {}
+		self._children  : [Group] =             []
+		self._childStarts : [int] =             []
 
 		self.StartBlock : Block =               startBlock
 		self.EndBlock   : Block =               None
@@ -329,6 +408,10 @@ class EndOfGroup(Group):
 
 
 class StartOfDocumentGroup(StartOfGroup, StartOfDocument):
+	SIMPLE_BLOCKS =   None
+	COMPOUND_BLOCKS = None
+	TRIVIA_GROUPS =   None
+
 	def __init__(self, startBlock):
 		from pyVHDLParser.Groups.Comment      import CommentGroup, WhitespaceGroup
 		from pyVHDLParser.Groups.DesignUnit   import ContextGroup, EntityGroup, ArchitectureGroup, PackageGroup, PackageBodyGroup, ConfigurationGroup
@@ -336,6 +419,9 @@ class StartOfDocumentGroup(StartOfGroup, StartOfDocument):
 
 		super().__init__(startBlock)
 
+		if (StartOfDocumentGroup.SIMPLE_BLOCKS is None):
+			StartOfDocumentGroup.__cls_init__()
+
 		self._subGroups = {
 			CommentGroup:       [],
 			WhitespaceGroup:    [],
@@ -350,60 +436,57 @@ class StartOfDocumentGroup(StartOfGroup, StartOfDocument):
 		}
 
 	@classmethod
-	def stateDocument(cls, parserState : ParserState):
+	def __cls_init__(cls):
+		from pyVHDLParser.Blocks.Reference      import Context, Library, Use
+		from pyVHDLParser.Blocks.Sequential     import Package, PackageBody
+		from pyVHDLParser.Blocks.Structural     import Entity, Architecture, Configuration
 		from pyVHDLParser.Groups.DesignUnit     import ContextGroup, EntityGroup, ArchitectureGroup, PackageGroup, PackageBodyGroup, ConfigurationGroup
 		from pyVHDLParser.Groups.Reference      import LibraryGroup, UseGroup
-		from pyVHDLParser.Groups.Comment import CommentGroup, WhitespaceGroup
+		from pyVHDLParser.Groups.Comment        import TRIVIA_GROUPS
 
-		SIMPLE_BLOCKS = {
+		cls.SIMPLE_BLOCKS = TypeDispatchMap({
 			Library.StartBlock:       LibraryGroup,
 			Use.StartBlock:           UseGroup
-		}
-		COMPOUND_BLOCKS = {
+		})
+		cls.COMPOUND_BLOCKS = TypeDispatchMap({
 			Context.NameBlock:        ContextGroup,
 			Entity.NameBlock:         EntityGroup,
 			Architecture.NameBlock:   ArchitectureGroup,
 			Package.NameBlock:        PackageGroup,
 			PackageBody.NameBlock:    PackageBodyGroup,
 			Configuration.NameBlock:  ConfigurationGroup
-		}
+		})
+		cls.TRIVIA_GROUPS = TRIVIA_GROUPS
 
+	@classmethod
+	def stateDocument(cls, parserState : ParserState):
 		currentBlock = parserState.Block
+		blockType =    currentBlock.__class__
 
-		if isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
+		if (blockType in cls.TRIVIA_GROUPS):
+			group =                   cls.TRIVIA_GROUPS[blockType]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
+		elif (blockType in cls.SIMPLE_BLOCKS):
+			group =                   cls.SIMPLE_BLOCKS[blockType]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		else:
-			for blk in SIMPLE_BLOCKS:
-				if isinstance(currentBlock, blk):
-					group =                   SIMPLE_BLOCKS[blk]
-					parserState.PushState =   group.stateParse
-					parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for blk in COMPOUND_BLOCKS:
-				if isinstance(currentBlock, blk):
-					group =                   COMPOUND_BLOCKS[blk]
-					parserState.PushState =   group.stateParse
-					parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			if isinstance(currentBlock, EndOfDocumentBlock):
-				parserState.NewGroup = EndOfDocumentGroup(currentBlock)
-				return
+		elif (blockType in cls.COMPOUND_BLOCKS):
+			group =                   cls.COMPOUND_BLOCKS[blockType]
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
+			parserState.BlockMarker = currentBlock
+			parserState.ReIssue =     True
+			return
+		elif isinstance(currentBlock, EndOfDocumentBlock):
+			parserState.NewGroup = EndOfDocumentGroup(currentBlock)
+			return
 
 		raise BlockParserException("Expected keywords: architecture, context, entity, library, package, use. Found '{block!s}'.".format(
 			block=currentBlock.__class__.__qualname__
@@ -0,0 +1,226 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+#
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   Scan VHDL files for design units and their dependencies.
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+#
+# load dependencies
+from pyVHDLParser import StartOf, EndOf
+
+
+def _Offset(position):
+	return position if (position.__class__ is int) else position.Absolute
+
+def _TokenStart(token):
+	return _Offset(token._start)
+
+def _TokenEnd(token):
+	return _Offset(token._end)
+
+def _BlockStart(block):
+	return _Offset(block.StartToken._start)
+
+def _BlockEnd(block):
+	return _Offset(block.EndToken._end)
+
+
+class _Layer:
+	"""Nodes of a chain sorted by start offset; neighbours may share their boundary offset, then the later one is found.
+
+	Offsets are read from the nodes on each lookup, so shifting tokens behind an edit doesn't invalidate the index.
+	"""
+
+	def __init__(self, firstNode, nextNode, getStart, getEnd):
+		self._nextNode =  nextNode
+		self._getStart =  getStart
+		self._getEnd =    getEnd
+		self._nodes =     self._Collect(firstNode, None)
+
+	def __len__(self):
+		return len(self._nodes)
+
+	def _Collect(self, node, stopNode):
+		nodes =     []
+		nextNode =  self._nextNode
+		while ((node is not None) and (node is not stopNode)):
+			if (not isinstance(node, (StartOf, EndOf))):
+				nodes.append(node)
+			node = nextNode(node)
+		return nodes
+
+	def _Bisect(self, offset):
+		"""Return the number of nodes starting at or before 'offset'."""
+		nodes =     self._nodes
+		getStart =  self._getStart
+		low =       0
+		high =      len(nodes)
+		while (low < high):
+			middle = (low + high) // 2
+			if (offset < getStart(nodes[middle])):
+				high =  middle
+			else:
+				low =   middle + 1
+		return low
+
+	def FindAt(self, offset):
+		index = self._Bisect(offset) - 1
+		if (index < 0):
+			return None
+		node = self._nodes[index]
+		return node if (offset <= self._getEnd(node)) else None
+
+	def FindRange(self, start, end):
+		nodes =   self._nodes
+		getEnd =  self._getEnd
+		# neighbours may share their boundary offset, so step back over all nodes reaching into the range
+		index =   self._Bisect(start)
+		while ((index > 0) and (getEnd(nodes[index - 1]) >= start)):
+			index -= 1
+		last =    self._Bisect(end)
+		return nodes[index:last]
+
+	def Splice(self, before, after):
+		"""Replace the nodes between the unchanged chain neighbours 'before' and 'after' by the nodes now linked in between.
+
+		'before' is a start node for an edit at the start of the document, 'after' is None or an end node for an edit
+		reaching the end of the document.
+		"""
+		nodes = self._nodes
+		if isinstance(before, StartOf):
+			first = 0
+		else:
+			# the nodes in front of 'before' are unchanged and the replaced nodes start behind it, so bisecting is valid
+			first = self._Bisect(self._getStart(before) - 1)
+			while (nodes[first] is not before):
+				first += 1
+			first += 1
+
+		last = first
+		if ((after is None) or isinstance(after, EndOf)):
+			last = len(nodes)
+		else:
+			while (nodes[last] is not after):
+				last += 1
+
+		nodes[first:last] = self._Collect(self._nextNode(before), after)
+
+
+class NodesAt:
+	"""The token, block and enclosing groups (outermost first) at an offset."""
+
+	def __init__(self, token, block, groups):
+		self.Token =  token
+		self.Block =  block
+		self.Groups = groups
+
+	@property
+	def Group(self):
+		"""The innermost group."""
+		return self.Groups[-1] if self.Groups else None
+
+
+class PositionIndex:
+	"""Map source offsets to the tokens, blocks and groups of a document.
+
+	Tokens and blocks are kept in arrays sorted by start offset, so :meth:`FindAt` and :meth:`FindRange` bisect in
+	logarithmic time. Groups are nested, they are found by bisecting the position-sorted sub-groups on each level
+	(see :meth:`~pyVHDLParser.Groups.Group.GetSubGroupAt`). Offsets compare to :attr:`SourceCodePosition.Absolute`.
+	Each layer is optional. After :meth:`~pyVHDLParser.Token.Parser.TableDrivenTokenizer.ReTokenize` or
+	:meth:`~pyVHDLParser.Blocks.TokenToBlockParser.ReParse`, call :meth:`SpliceTokens` or :meth:`SpliceBlocks`.
+	"""
+
+	def __init__(self, startToken=None, startBlock=None, startGroup=None):
+		self._tokens =      None if (startToken is None) else _Layer(startToken, lambda token: token.NextToken, _TokenStart, _TokenEnd)
+		self._blocks =      None if (startBlock is None) else _Layer(startBlock, lambda block: block.NextBlock, _BlockStart, _BlockEnd)
+		self._startGroup =  startGroup
+
+	@classmethod
+	def FromGroup(cls, startOfDocumentGroup):
+		"""Index all layers of a document given by its :class:`~pyVHDLParser.Groups.StartOfDocumentGroup`."""
+		startBlock = startOfDocumentGroup.StartBlock
+		return cls(startBlock.StartToken, startBlock, startOfDocumentGroup)
+
+	def FindTokenAt(self, offset):
+		return None if (self._tokens is None) else self._tokens.FindAt(offset)
+
+	def FindBlockAt(self, offset):
+		return None if (self._blocks is None) else self._blocks.FindAt(offset)
+
+	def FindGroupsAt(self, offset):
+		"""Return the groups covering 'offset' from the outermost to the innermost one."""
+		groups = []
+		if (self._startGroup is not None):
+			group = self._startGroup.GetSubGroupAt(offset)
+			while (group is not None):
+				groups.append(group)
+				group = group.GetSubGroupAt(offset)
+		return groups
+
+	def FindAt(self, offset):
+		return NodesAt(self.FindTokenAt(offset), self.FindBlockAt(offset), self.FindGroupsAt(offset))
+
+	def FindTokensInRange(self, start, end):
+		return [] if (self._tokens is None) else self._tokens.FindRange(start, end)
+
+	def FindBlocksInRange(self, start, end):
+		return [] if (self._blocks is None) else self._blocks.FindRange(start, end)
+
+	def FindGroupsInRange(self, start, end):
+		"""Return the groups overlapping the range in document order; enclosing groups precede their sub-groups."""
+		groups = []
+		if (self._startGroup is not None):
+			self._CollectGroups(self._startGroup, start, end, groups)
+		return groups
+
+	def _CollectGroups(self, parentGroup, start, end, groups):
+		for group in parentGroup.GetSubGroups():
+			groupStart = _BlockStart(group.StartBlock)
+			if (groupStart > end):
+				break
+			if (_BlockEnd(group.EndBlock) >= start):
+				groups.append(group)
+				self._CollectGroups(group, start, end, groups)
+
+	def FindRange(self, start, end):
+		"""Return the tokens, blocks and groups overlapping the range from 'start' to 'end' (inclusive)."""
+		return self.FindTokensInRange(start, end), self.FindBlocksInRange(start, end), self.FindGroupsInRange(start, end)
+
+	def SpliceTokens(self, before, after):
+		"""Update the token layer, after the tokens between 'before' and 'after' were replaced, e.g. with the tokens returned by ReTokenize."""
+		if (self._tokens is not None):
+			self._tokens.Splice(before, after)
+
+	def SpliceBlocks(self, before, after):
+		"""Update the block and token layers, after the blocks between 'before' and 'after' and their tokens were replaced.
+
+		For :meth:`~pyVHDLParser.Blocks.TokenToBlockParser.ReParse`, 'before' is the predecessor of the first new block
+		and 'after' the successor of the last new block.
+		"""
+		if (self._blocks is not None):
+			self._blocks.Splice(before, after)
+		if (self._tokens is not None):
+			beforeToken = before.StartToken if (before.EndToken is None) else before.EndToken
+			afterToken =  None if (after is None) else after.StartToken
+			self._tokens.Splice(beforeToken, afterToken)
@@ -0,0 +1,390 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+#
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A columnar binary format for token and block streams.
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+from array      import array
+from importlib  import import_module
+from struct     import Struct, calcsize
+from sys        import byteorder
+
+from pyVHDLParser             import SourceCodeLineIndex
+from pyVHDLParser.Base        import ParserException
+from pyVHDLParser.Token.Store import TokenColumns, TokenView
+
+
+MAGIC =           b"PVHS"
+FORMAT_VERSION =  2
+BYTE_ORDER =      b"<"      # columns are always stored little-endian
+
+# file header: magic, format version, number of sections, byte order, padding;
+# each section: struct format character, item size, padding, item count
+_HEADER =         Struct("<4sHHc7x")
+_SECTION =        Struct("<cB2xI")
+_ALIGNMENT =      8
+
+# order of the array sections in a stream; the item types are struct format characters with standard sizes
+_SECTIONS = (
+	("_document",         "q"),   # document length
+	("_lineStarts",       "I"),
+	("_tokenKindNames",   "B"),   # UTF-8 encoded, '\n' separated class names
+	("_valueOffsets",     "I"),   # start of each value in '_values' plus the end of the last value
+	("_values",           "B"),   # UTF-8 encoded, concatenated token values
+	("TokenKinds",        "H"),
+	("TokenStarts",       "i"),   # absolute position or -1
+	("TokenEnds",         "i"),   # absolute position or -1, also for end tokens
+	("TokenValues",       "i"),   # index into the value table or -1
+	("_blockKindNames",   "B"),
+	("BlockKinds",        "H"),
+	("BlockStarts",       "i"),   # token index or -1
+	("BlockEnds",         "i"),   # token index or -1
+	("BlockMultiPart",    "B")
+)
+
+
+class SerializationException(ParserException):
+	pass
+
+
+def _ArrayTypeCode(formatCharacter):
+	"""Return the array typecode, whose item size on this platform is the standard size of a struct format character."""
+	itemSize = calcsize("<" + formatCharacter)
+	for typeCode in ("bhilq" if formatCharacter.islower() else "BHILQ"):
+		if (array(typeCode).itemsize == itemSize):
+			return typeCode
+	raise SerializationException("No array type with {0} byte items for format '{1}'.".format(itemSize, formatCharacter))
+
+
+# struct format character -> (array typecode, item size)
+_ARRAY_TYPES = {formatCharacter: (_ArrayTypeCode(formatCharacter), calcsize("<" + formatCharacter)) for _, formatCharacter in _SECTIONS}
+
+
+def _ClassName(cls):
+	return cls.__module__ + ":" + cls.__qualname__
+
+
+def _ResolveClass(name):
+	moduleName, _, qualifiedName = name.partition(":")
+	cls = import_module(moduleName)
+	for name in qualifiedName.split("."):
+		cls = getattr(cls, name)
+	return cls
+
+
+class StreamWriter(TokenColumns):
+	"""Serialize tokens and blocks into parallel arrays: the :class:`~pyVHDLParser.Token.Store.TokenColumns` of the
+	tokens, block kinds and the indices of their start and end tokens.
+
+	Tokens must carry a line index, i.e. they are produced by a table-driven tokenizer. As the block parser replaces
+	tokens by keyword tokens, the tokens of a block stream are written after parsing, e.g. by :meth:`WriteChain`.
+	"""
+
+	def __init__(self):
+		super().__init__()
+		self._blockKinds =    {}
+		self._tokenIndexes =  {}
+		self._firstToken =    None      # keeps written tokens alive, so their ids stay unique
+
+		self.BlockKinds =     array("H")
+		self.BlockStarts =    array("i")
+		self.BlockEnds =      array("i")
+		self.BlockMultiPart = array("B")
+
+	def WriteChain(self, startToken):
+		"""Write all tokens linked to 'startToken' by ``NextToken``."""
+		def chain(token):
+			while (token is not None):
+				yield token
+				token = token.NextToken
+
+		self.WriteTokens(chain(startToken))
+
+	def WriteTokens(self, tokens):
+		def Record(tokens):
+			tokenIndexes =  self._tokenIndexes
+			kinds =         self.TokenKinds
+			for token in tokens:
+				if (self._firstToken is None):
+					if (token._lineIndex is None):
+						raise SerializationException("Tokens without line index can't be serialized.")
+					self._firstToken = token
+
+				tokenIndexes[id(token)] = len(kinds)
+				yield token
+
+		self.Extend(Record(tokens))
+
+	def WriteBlocks(self, blocks):
+		"""Write blocks, whose tokens have been written before."""
+		blockKinds =    self._blockKinds
+		tokenIndexes =  self._tokenIndexes
+
+		try:
+			for block in blocks:
+				kind = blockKinds.get(block.__class__)
+				if (kind is None):
+					kind = blockKinds[block.__class__] = len(blockKinds)
+
+				self.BlockKinds.append(kind)
+				self.BlockStarts.append(-1 if (block.StartToken is None) else tokenIndexes[id(block.StartToken)])
+				self.BlockEnds.append(-1 if (block.EndToken is None) else tokenIndexes[id(block.EndToken)])
+				self.BlockMultiPart.append(block.MultiPart)
+		except KeyError:
+			raise SerializationException("Block '{0!s}' references a token, which wasn't written.".format(block)) from None
+
+	def ToBytes(self):
+		values =        [value.encode("utf-8") for value in self.ValueTable]
+		valueOffsets =  [0]
+		for value in values:
+			valueOffsets.append(valueOffsets[-1] + len(value))
+
+		lineIndex =     self._lineIndex
+		sections = {
+			"_document":        [0 if (lineIndex is None) else lineIndex._length],
+			"_lineStarts":      [] if (lineIndex is None) else lineIndex._lineStarts,
+			"_tokenKindNames":  "\n".join(_ClassName(cls) for cls in self.KindTypes).encode("utf-8"),
+			"_valueOffsets":    valueOffsets,
+			"_values":          b"".join(values),
+			"_blockKindNames":  "\n".join(_ClassName(cls) for cls in self._blockKinds).encode("utf-8")
+		}
+
+		buffer = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, len(_SECTIONS), BYTE_ORDER))
+		for attributeName, formatCharacter in _SECTIONS:
+			typeCode, itemSize = _ARRAY_TYPES[formatCharacter]
+			column = sections[attributeName] if (attributeName in sections) else getattr(self, attributeName)
+			if (not isinstance(column, array)) or (column.typecode != typeCode) or (byteorder == "big"):
+				column = array(typeCode, column)
+				if (byteorder == "big"):
+					column.byteswap()
+
+			buffer += _SECTION.pack(formatCharacter.encode("ascii"), itemSize, len(column))
+			buffer += column.tobytes()
+			buffer += bytes(-len(buffer) % _ALIGNMENT)
+
+		return bytes(buffer)
+
+
+class StreamReader(TokenColumns):
+	"""Read a stream written by :class:`StreamWriter`.
+
+	The columns are memoryviews on the given buffer. Tokens and blocks are accessible as lightweight views or can be
+	reconstructed as linked :class:`~pyVHDLParser.Token.Token` and :class:`~pyVHDLParser.Blocks.Block` objects.
+	"""
+
+	def __init__(self, data):
+		data =    memoryview(data)
+		magic, version, sectionCount, byteOrder = _HEADER.unpack_from(data, 0)
+		if ((magic != MAGIC) or (version != FORMAT_VERSION) or (sectionCount != len(_SECTIONS))):
+			raise SerializationException("Unsupported stream format.")
+		elif (byteOrder != BYTE_ORDER):
+			raise SerializationException("Unsupported byte order '{0}'.".format(byteOrder.decode("ascii", "replace")))
+
+		columns = {}
+		offset =  _HEADER.size
+		for attributeName, expectedFormatCharacter in _SECTIONS:
+			formatCharacter, itemSize, count = _SECTION.unpack_from(data, offset)
+			formatCharacter = formatCharacter.decode("ascii", "replace")
+			typeCode, expectedItemSize = _ARRAY_TYPES[expectedFormatCharacter]
+			if (formatCharacter != expectedFormatCharacter):
+				raise SerializationException("Unexpected section '{0}'.".format(formatCharacter))
+			elif (itemSize != expectedItemSize):
+				raise SerializationException("Unexpected item size {0} in section '{1}'.".format(itemSize, formatCharacter))
+
+			offset +=   _SECTION.size
+			size =      count * itemSize
+			if (offset + size > len(data)):
+				raise SerializationException("Section '{0}' exceeds the stream.".format(formatCharacter))
+			elif (byteorder == "big"):
+				column =  array(typeCode, data[offset:offset + size].tobytes())
+				column.byteswap()
+			else:
+				column =  data[offset:offset + size].cast(typeCode)
+			columns[attributeName] = column
+			offset +=   size + (-(offset + size) % _ALIGNMENT)
+
+		lineIndex =             SourceCodeLineIndex()
+		lineIndex._lineStarts = array("L", columns["_lineStarts"])
+		lineIndex._length =     columns["_document"][0]
+
+		values =                bytes(columns["_values"])
+		valueOffsets =          columns["_valueOffsets"]
+		super().__init__(
+			lineIndex,
+			tuple(_ResolveClass(name) for name in bytes(columns["_tokenKindNames"]).decode("utf-8").split("\n") if name),
+			tuple(values[valueOffsets[i]:valueOffsets[i + 1]].decode("utf-8") for i in range(len(valueOffsets) - 1)),
+			columns["TokenKinds"], columns["TokenStarts"], columns["TokenEnds"], columns["TokenValues"]
+		)
+
+		self.BlockKindTypes = tuple(_ResolveClass(name) for name in bytes(columns["_blockKindNames"]).decode("utf-8").split("\n") if name)
+		self.BlockKinds =     columns["BlockKinds"]
+		self.BlockStarts =    columns["BlockStarts"]
+		self.BlockEnds =      columns["BlockEnds"]
+		self.BlockMultiPart = columns["BlockMultiPart"]
+
+		self._tokens =      None
+		self._blocks =      None
+
+	@property
+	def BlockCount(self):
+		return len(self.BlockKinds)
+
+	def GetTokenView(self, index):
+		return TokenView(self, index)
+
+	def GetBlockView(self, index):
+		return BlockView(self, index)
+
+	def IterateTokenViews(self):
+		for index in range(len(self.TokenKinds)):
+			yield TokenView(self, index)
+
+	def IterateBlockViews(self):
+		for index in range(len(self.BlockKinds)):
+			yield BlockView(self, index)
+
+	def GetTokens(self):
+		"""Reconstruct all tokens as a linked chain and return them as a list."""
+		if (self._tokens is not None):
+			return self._tokens
+
+		from pyVHDLParser.Token import StartOfToken, EndOfToken, StringToken
+
+		lineIndex =     self._lineIndex
+		kindTypes =     self.KindTypes
+		valueTable =    self.ValueTable
+		lowerValues =   {}
+		tokens =        []
+		previousToken = None
+
+		for kind, start, end, valueIndex in zip(self.TokenKinds, self.TokenStarts, self.TokenEnds, self.TokenValues):
+			cls = kindTypes[kind]
+			if issubclass(cls, StartOfToken):
+				token = cls(lineIndex)
+			elif issubclass(cls, EndOfToken):
+				token = cls(previousToken, lineIndex.GetEndPosition())
+			else:
+				token =                 cls.__new__(cls)
+				token._previousToken =  previousToken
+				token._lineIndex =      lineIndex
+				token.NextToken =       None
+				token._start =          start
+				token._end =            end
+				if (valueIndex != -1):
+					token.Value =         valueTable[valueIndex]
+					if isinstance(token, StringToken):
+						lowerValue = lowerValues.get(valueIndex)
+						if (lowerValue is None):
+							lowerValue = lowerValues[valueIndex] = token.Value.lower()
+						token.LowerValue =  lowerValue
+				if (previousToken is not None):
+					previousToken.NextToken = token
+
+			tokens.append(token)
+			previousToken = token
+
+		self._tokens = tokens
+		return tokens
+
+	def GetBlocks(self):
+		"""Reconstruct all blocks on top of :meth:`GetTokens` as a linked chain and return them as a list."""
+		if (self._blocks is not None):
+			return self._blocks
+
+		tokens =        self.GetTokens()
+		kindTypes =     self.BlockKindTypes
+		blocks =        []
+		previousBlock = None
+
+		for kind, start, end, multiPart in zip(self.BlockKinds, self.BlockStarts, self.BlockEnds, self.BlockMultiPart):
+			cls =                   kindTypes[kind]
+			block =                 cls.__new__(cls)
+			block._previousBlock =  previousBlock
+			block.NextBlock =       None
+			block.StartToken =      None if (start == -1) else tokens[start]
+			block.EndToken =        None if (end == -1) else tokens[end]
+			block.MultiPart =       bool(multiPart)
+			if (previousBlock is not None):
+				previousBlock.NextBlock = block
+
+			blocks.append(block)
+			previousBlock = block
+
+		self._blocks = blocks
+		return blocks
+
+
+class BlockView:
+	"""Flyweight view on a block in a :class:`StreamReader`."""
+	__slots__ = ("_reader", "_index")
+
+	def __init__(self, reader, index):
+		self._reader =  reader
+		self._index =   index
+
+	def __iter__(self):
+		reader =  self._reader
+		start =   reader.BlockStarts[self._index]
+		end =     reader.BlockEnds[self._index]
+		if (start == -1):
+			start = end
+		elif (end == -1):
+			end =   start
+
+		for index in range(start, end + 1):
+			yield TokenView(reader, index)
+
+	@property
+	def Index(self):
+		return self._index
+
+	@property
+	def Kind(self):
+		reader = self._reader
+		return reader.BlockKindTypes[reader.BlockKinds[self._index]]
+
+	@property
+	def StartToken(self):
+		start = self._reader.BlockStarts[self._index]
+		return None if (start == -1) else TokenView(self._reader, start)
+
+	@property
+	def EndToken(self):
+		end = self._reader.BlockEnds[self._index]
+		return None if (end == -1) else TokenView(self._reader, end)
+
+	@property
+	def MultiPart(self):
+		return bool(self._reader.BlockMultiPart[self._index])
+
+	@property
+	def PreviousBlock(self):
+		return None if (self._index == 0) else BlockView(self._reader, self._index - 1)
+
+	@property
+	def NextBlock(self):
+		return None if (self._index + 1 == len(self._reader.BlockKinds)) else BlockView(self._reader, self._index + 1)
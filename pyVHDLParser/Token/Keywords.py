@@ -34,12 +34,12 @@ from pyVHDLParser.Token.Parser  import TokenizerException
 
 class BoundaryToken(VHDLToken):
 	def __init__(self, spaceToken):
-		super().__init__(spaceToken.PreviousToken, spaceToken.Value, spaceToken.Start, spaceToken.End)
+		super().__init__(spaceToken.PreviousToken, spaceToken.Value, spaceToken._start, spaceToken._end)
 
 
 class BracketToken(VHDLToken):
 	def __init__(self, characterToken):
-		super().__init__(characterToken.PreviousToken, characterToken.Value, characterToken.Start, characterToken.End)
+		super().__init__(characterToken.PreviousToken, characterToken.Value, characterToken._start, characterToken._end)
 
 
 # Round bracket / parenthesis / ()
@@ -62,7 +62,7 @@ class ClosingAngleBracketToken(AngleBracketToken): pass
 
 class OperatorToken(VHDLToken):
 	def __init__(self, characterToken):
-		super().__init__(characterToken.PreviousToken, characterToken.Value, characterToken.Start, characterToken.End)
+		super().__init__(characterToken.PreviousToken, characterToken.Value, characterToken._start, characterToken._end)
 
 
 class PlusOperator(OperatorToken):        pass
@@ -89,17 +89,17 @@ class MatchingGreaterThanOrEqualOperator(RelationalOperator): __KEYWORD__ = "?>=
 
 class DelimiterToken(VHDLToken):
 	def __init__(self, characterToken):
-		super().__init__(characterToken.PreviousToken, characterToken.Value, characterToken.Start, characterToken.End)
+		super().__init__(characterToken.PreviousToken, characterToken.Value, characterToken._start, characterToken._end)
 
 
 class EndToken(VHDLToken):
 	def __init__(self, characterToken):
-		super().__init__(characterToken.PreviousToken, characterToken.Value, characterToken.Start, characterToken.End)
+		super().__init__(characterToken.PreviousToken, characterToken.Value, characterToken._start, characterToken._end)
 
 
 class IdentifierToken(VHDLToken):
 	def __init__(self, stringToken):
-		super().__init__(stringToken.PreviousToken, stringToken.Value, stringToken.Start, stringToken.End)
+		super().__init__(stringToken.PreviousToken, stringToken.Value, stringToken._start, stringToken._end)
 
 
 class RepeatedIdentifierToken(IdentifierToken):
@@ -108,12 +108,12 @@ class RepeatedIdentifierToken(IdentifierToken):
 
 class SimpleNameToken(VHDLToken):
 	def __init__(self, stringToken):
-		super().__init__(stringToken.PreviousToken, stringToken.Value, stringToken.Start, stringToken.End)
+		super().__init__(stringToken.PreviousToken, stringToken.Value, stringToken._start, stringToken._end)
 
 
 class LabelToken(VHDLToken):
 	def __init__(self, stringToken):
-		super().__init__(stringToken.PreviousToken, stringToken.Value, stringToken.Start, stringToken.End)
+		super().__init__(stringToken.PreviousToken, stringToken.Value, stringToken._start, stringToken._end)
 
 
 class RepeatedLabelToken(LabelToken):
@@ -124,7 +124,7 @@ class MultiCharKeyword(VHDLToken):
 	__KEYWORD__ = None
 
 	def __init__(self, characterToken):
-		super().__init__(characterToken.PreviousToken, self.__KEYWORD__, characterToken.Start, characterToken.End)
+		super().__init__(characterToken.PreviousToken, self.__KEYWORD__, characterToken._start, characterToken._end)
 
 	def __str__(self):
 		return "<{name: <50} '{value}' at {pos!r}>".format(
@@ -155,7 +155,7 @@ class KeywordToken(VHDLToken):
 	def __init__(self, stringToken):
 		if (not (isinstance(stringToken, StringToken) and (stringToken <= self.__KEYWORD__))):
 			raise TokenizerException("Expected keyword {0}.".format(self.__KEYWORD__.upper()), stringToken)
-		super().__init__(stringToken.PreviousToken, self.__KEYWORD__, stringToken.Start, stringToken.End)
+		super().__init__(stringToken.PreviousToken, self.__KEYWORD__, stringToken._start, stringToken._end)
 
 	def __str__(self):
 		return "<{name: <50}  {value:.<59} at {pos!r}>".format(
@@ -29,15 +29,23 @@
 # ==============================================================================
 #
 # load dependencies
-from enum                     import Enum
+from enum                     import Enum, IntEnum
+from functools                import partial
+from itertools                import chain, islice
+from pathlib                  import Path
+from re                       import compile as re_compile, escape as re_escape
 
-from pyVHDLParser             import SourceCodePosition
+from pyVHDLParser             import SourceCodePosition, SourceCodeLineIndex
 from pyVHDLParser.Base        import ParserException
 from pyVHDLParser.Token import StartOfDocumentToken, EndOfDocumentToken, IndentationToken, FusedCharacterToken, CharacterLiteralToken, StringLiteralToken, \
 	ExtendedIdentifier, DirectiveToken, IntegerLiteralToken
 from pyVHDLParser.Token       import CharacterToken, SpaceToken, StringToken, SingleLineCommentToken, MultiLineCommentToken, LinebreakToken
 
 
+DEFAULT_CHUNK_SIZE =  1024 * 1024
+RELEX_CHUNK_SIZE =    4096
+
+
 class TokenizerException(ParserException):
 	def __init__(self, message, position):
 		super().__init__(message)
@@ -47,6 +55,12 @@ class TokenizerException(ParserException):
 		return "{0!s}: {1}".format(self.Position, self._message)
 
 
+def _IsTickPrefix(token):
+	"""An apostrophe behind an identifier or a closing parenthesis is an attribute tick, which is followed by an attribute name or by '(' of a qualified expression."""
+	return ((token.__class__ is StringToken) or (token.__class__ is ExtendedIdentifier) or
+		((token.__class__ is CharacterToken) and (token.Value == ")")))
+
+
 class Tokenizer:
 	class TokenKind(Enum):
 		SpaceChars =                      0
@@ -66,6 +80,12 @@ class Tokenizer:
 		OtherChars =                     14
 
 
+	@classmethod
+	def GetVHDLTokenizerFromFile(cls, path, chunkSize=DEFAULT_CHUNK_SIZE):
+		"""Read the file in chunks of 'chunkSize' characters, so the source text is never held in memory as a whole."""
+		with Path(path).open('r') as fileHandle:
+			yield from cls.GetVHDLTokenizer(chain.from_iterable(iter(partial(fileHandle.read, chunkSize), "")))
+
 	@classmethod
 	def GetVHDLTokenizer(cls, iterable):
 		previousToken = StartOfDocumentToken()
@@ -258,14 +278,26 @@ class Tokenizer:
 			elif (tokenKind is cls.TokenKind.PossibleCharacterLiteral):
 				buffer += char
 				if (len(buffer) == 2):
-					if (buffer[1] == "'"):
+					if _IsTickPrefix(previousToken):
+						previousToken =   CharacterToken(previousToken, "'", start)
+						yield previousToken
+
+						start =           SourceCodePosition(row, column, absolute)
+						if ((char in __ALPHA_CHARACTERS__) and (char not in __NUMBER_CHARACTERS__)):
+							buffer =        char
+							tokenKind =     cls.TokenKind.AlphaChars
+						elif (char == "("):
+							previousToken = CharacterToken(previousToken, char, start)
+							yield previousToken
+							tokenKind =     cls.TokenKind.OtherChars
+						else:
+							raise TokenizerException("Ambiguous syntax detected.", start)
+					elif (buffer[1] == "'"):
 						previousToken =   CharacterToken(previousToken, "'", start)
 						yield previousToken
 						previousToken =   CharacterToken(previousToken, "'", SourceCodePosition(row, column, absolute))
 						yield previousToken
 						tokenKind =       cls.TokenKind.OtherChars
-					else:
-						continue
 				elif ((len(buffer) == 3) and (buffer[2] == "'")):
 					previousToken =   CharacterLiteralToken(previousToken, buffer, start, SourceCodePosition(row, column, absolute))
 					yield previousToken
@@ -407,3 +439,525 @@ class Tokenizer:
 
 		# End of document
 		yield EndOfDocumentToken(previousToken, SourceCodePosition(row, column, absolute))
+
+
+def _IndexChunks(lineIndex, chunks):
+	for chunk in chunks:
+		lineIndex.Append(chunk)
+		yield chunk
+
+
+class _CharacterClassTranslation(dict):
+	def __init__(self, characterClasses, otherClass):
+		super().__init__((code, chr(charClass)) for code, charClass in enumerate(characterClasses))
+		self._otherClass = chr(otherClass)
+
+	def __missing__(self, key):
+		return self._otherClass
+
+
+class BoundedInternTable(dict):
+	"""Intern table, which is emptied when it exceeds 'maxSize' entries, so streaming a document with ever new identifiers (e.g. a netlist) uses bounded memory."""
+	__slots__ = ("_maxSize",)
+
+	def __init__(self, maxSize=65536):
+		super().__init__()
+		self._maxSize = maxSize
+
+	def __setitem__(self, key, value):
+		if (len(self) >= self._maxSize):
+			self.clear()
+		super().__setitem__(key, value)
+
+
+class TableDrivenTokenizer(Tokenizer):
+	"""Classify characters by a precomputed table and look up transitions by (state, character class).
+
+	Tokens store absolute offsets; rows and columns are resolved on access by the document's :class:`SourceCodeLineIndex`.
+	"""
+
+	class CharacterClass(IntEnum):
+		Space =                            0
+		Digit =                            1
+		Letter =                           2
+		Underscore =                       3
+		Apostrophe =                       4
+		Quote =                            5
+		Dash =                             6
+		CarriageReturn =                   7
+		LineFeed =                         8
+		Slash =                            9
+		Asterisk =                        10
+		FuseableCharacter =               11
+		Backslash =                       12
+		Backtick =                        13
+		Other =                           14
+
+	class Action(IntEnum):
+		EmitLinebreak =                   15
+		EmitCharacter =                   16
+		PossibleDirective =               17
+		EmitLexeme =                      18
+		PossibleMultiLineCommentEnd =     19
+		CharacterLiteral =                20
+		FuseCharacter =                   21
+
+	__CHARACTER_CLASSES__ =   None
+	__CLASS_TRANSLATION__ =   None
+	__TRANSITIONS__ =         None
+	__RUN_PATTERNS__ =        None
+
+	@classmethod
+	def __cls_init__(cls):
+		Class =   cls.CharacterClass
+		Kind =    cls.TokenKind
+		Action =  cls.Action
+
+		classes = [Class.Other] * 256
+		for char in " \t":                                                 classes[ord(char)] = Class.Space
+		for char in "0123456789":                                          classes[ord(char)] = Class.Digit
+		for char in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ":  classes[ord(char)] = Class.Letter
+		for char in "=<:>?":                                               classes[ord(char)] = Class.FuseableCharacter
+		classes[ord("_")] =   Class.Underscore
+		classes[ord("'")] =   Class.Apostrophe
+		classes[ord("\"")] =  Class.Quote
+		classes[ord("-")] =   Class.Dash
+		classes[ord("\r")] =  Class.CarriageReturn
+		classes[ord("\n")] =  Class.LineFeed
+		classes[ord("/")] =   Class.Slash
+		classes[ord("*")] =   Class.Asterisk
+		classes[ord("\\")] = Class.Backslash
+		classes[ord("`")] =   Class.Backtick
+
+		# Transitions taken by the first character of a new lexeme
+		dispatch = {
+			Class.Space:              Kind.SpaceChars,
+			Class.Digit:              Kind.NumberChars,
+			Class.Letter:             Kind.AlphaChars,
+			Class.Underscore:         Action.EmitCharacter,
+			Class.Apostrophe:         Kind.PossibleCharacterLiteral,
+			Class.Quote:              Kind.PossibleStringLiteralStart,
+			Class.Dash:               Kind.PossibleSingleLineCommentStart,
+			Class.CarriageReturn:     Kind.PossibleLinebreak,
+			Class.LineFeed:           Action.EmitLinebreak,
+			Class.Slash:              Kind.FuseableCharacter,
+			Class.Asterisk:           Kind.FuseableCharacter,
+			Class.FuseableCharacter:  Kind.FuseableCharacter,
+			Class.Backslash:          Kind.PossibleExtendedIdentifierStart,
+			Class.Backtick:           Action.PossibleDirective,
+			Class.Other:              Action.EmitCharacter
+		}
+		# The states PossibleSingleLineCommentStart and PossibleLinebreak don't recognize linebreaks in a new lexeme
+		dispatchWithoutLinebreak = dict(dispatch)
+		dispatchWithoutLinebreak[Class.CarriageReturn] =  Action.EmitCharacter
+		dispatchWithoutLinebreak[Class.LineFeed] =        Action.EmitCharacter
+
+		def row(default=None, base=dispatch, **transitions):
+			result = [(base[charClass] if (default is None) else default) for charClass in Class]
+			for className, transition in transitions.items():
+				result[Class[className]] = transition
+			return [transition.value for transition in result]
+
+		transitions = [None] * len(Kind)
+		transitions[Kind.OtherChars.value] =                      row()
+		transitions[Kind.SpaceChars.value] =                      row(Space=Kind.SpaceChars)
+		transitions[Kind.NumberChars.value] =                     row(Digit=Kind.NumberChars, Underscore=Kind.NumberChars)
+		transitions[Kind.AlphaChars.value] =                      row(Digit=Kind.AlphaChars, Letter=Kind.AlphaChars, Underscore=Kind.AlphaChars)
+		transitions[Kind.PossibleSingleLineCommentStart.value] =  row(base=dispatchWithoutLinebreak, Dash=Kind.SingleLineComment)
+		transitions[Kind.PossibleLinebreak.value] =               row(base=dispatchWithoutLinebreak, LineFeed=Action.EmitLexeme)
+		transitions[Kind.PossibleCharacterLiteral.value] =        row(Action.CharacterLiteral)
+		transitions[Kind.PossibleStringLiteralStart.value] =      row(Kind.PossibleStringLiteralStart, Quote=Action.EmitLexeme)
+		transitions[Kind.PossibleExtendedIdentifierStart.value] = row(Kind.PossibleExtendedIdentifierStart, Backslash=Action.EmitLexeme)
+		transitions[Kind.Directive.value] =                       row(Kind.Directive, CarriageReturn=Kind.PossibleLinebreak, LineFeed=Action.EmitLexeme)
+		transitions[Kind.SingleLineComment.value] =               row(Kind.SingleLineComment, CarriageReturn=Kind.PossibleLinebreak, LineFeed=Action.EmitLexeme)
+		transitions[Kind.MultiLineComment.value] =                row(Kind.MultiLineComment, Slash=Action.PossibleMultiLineCommentEnd)
+		transitions[Kind.FuseableCharacter.value] =               row(Action.FuseCharacter)
+
+		cls.__CHARACTER_CLASSES__ = tuple(charClass.value for charClass in classes)
+		cls.__CLASS_TRANSLATION__ = _CharacterClassTranslation(cls.__CHARACTER_CLASSES__, Class.Other.value)
+		cls.__TRANSITIONS__ =       tuple(tuple(transition) if (transition is not None) else None for transition in transitions)
+
+	@classmethod
+	def GetVHDLTokenizer(cls, iterable, internTable=None):
+		"""Identifiers are interned in 'internTable', which maps a lexeme to its shared value and lower-cased value; pass the same dictionary to share it across files."""
+		content = iterable if isinstance(iterable, str) else "".join(iterable)
+		return cls.GetVHDLTokenizerFromChunks((content,), internTable)
+
+	@classmethod
+	def GetVHDLTokenizerFromFile(cls, path, chunkSize=DEFAULT_CHUNK_SIZE, internTable=None):
+		"""Read the file in chunks of 'chunkSize' characters, so the source text is never held in memory as a whole."""
+		with Path(path).open('r') as fileHandle:
+			yield from cls.GetVHDLTokenizerFromChunks(iter(partial(fileHandle.read, chunkSize), ""), internTable)
+
+	@classmethod
+	def GetVHDLTokenizerFromChunks(cls, chunks, internTable=None):
+		"""Tokenize a document given as an iterable of strings."""
+		lineIndex =     SourceCodeLineIndex()
+		previousToken = StartOfDocumentToken(lineIndex)
+		yield previousToken
+		yield from cls._TokenizeChunks(_IndexChunks(lineIndex, chunks), previousToken, 0, internTable)
+
+	@classmethod
+	def ReTokenize(cls, startToken, content, offset, removedLength, insertedText, internTable=None):
+		"""Update the token chain beginning with 'startToken' for an edit and return the first and last unchanged token around the new tokens.
+
+		The edit replaced 'removedLength' characters at (0-based) offset 'offset' by 'insertedText'; 'content' is the
+		document after the edit. Lexing restarts after the last linebreak before the edit and stops as soon as a new
+		linebreak token after the edit matches an old one. The new tokens are spliced into the chain and all tokens
+		behind it are shifted.
+		"""
+		lineIndex =     startToken._lineIndex
+		delta =         len(insertedText) - removedLength
+		editEnd =       offset + removedLength
+		newEditEnd =    offset + len(insertedText)
+		lineIndex.Replace(offset, removedLength, insertedText)
+
+		# find the last linebreak, which ends at least one character before the edit; a CR directly before the edit could be continued by an inserted LF
+		anchor =        startToken
+		position =      0
+		token =         startToken.NextToken
+		while (not isinstance(token, EndOfDocumentToken)) and (token._start <= offset):
+			if isinstance(token, LinebreakToken):
+				nextToken = token.NextToken
+				if ((not isinstance(nextToken, EndOfDocumentToken)) and (nextToken._start <= offset)):
+					anchor =    token
+					position =  nextToken._start - 1
+			token =       token.NextToken
+
+		oldToken =      anchor.NextToken
+		tokenizer =     cls.GetVHDLTokenizerFromPosition(anchor, content, position, internTable)
+
+		for newToken in tokenizer:
+			if (not isinstance(newToken, LinebreakToken)) or (newToken._start <= newEditEnd):
+				continue
+
+			# advance in the old chain to the first token behind the edit, which is not left of the new linebreak
+			while (not isinstance(oldToken, EndOfDocumentToken)) and ((oldToken._start <= editEnd) or (oldToken._start + delta < newToken._start)):
+				oldToken = oldToken.NextToken
+
+			if (isinstance(oldToken, LinebreakToken) and (oldToken._start + delta == newToken._start) and (oldToken._end + delta == newToken._end) and (oldToken.Value == newToken.Value)):
+				tokenizer.close()
+
+				# replace the new linebreak by the old one and shift the old tail
+				lastNewToken =                newToken._previousToken
+				lastNewToken.NextToken =      oldToken
+				oldToken._previousToken =     lastNewToken
+				cls.ShiftTokens(oldToken, delta)
+
+				return anchor, oldToken
+
+		# no resynchronization; the new tokens end with a new EndOfDocumentToken
+		return anchor, newToken
+
+	@classmethod
+	def GetVHDLTokenizerFromPosition(cls, previousToken, content, position, internTable=None):
+		"""Tokenize 'content' from (0-based) offset 'position' on and append the tokens to 'previousToken'.
+
+		The position must be the start of a line, so the tokenizer can start in its initial state.
+		"""
+		chunks = (content[chunkStart:chunkStart + RELEX_CHUNK_SIZE] for chunkStart in range(position, len(content), RELEX_CHUNK_SIZE))
+		return cls._TokenizeChunks(chunks, previousToken, position, internTable)
+
+	@staticmethod
+	def ShiftTokens(token, delta):
+		"""Move all tokens from 'token' up to the end of the document by 'delta' characters and return the EndOfDocumentToken."""
+		if (delta != 0):
+			while (not isinstance(token, EndOfDocumentToken)):
+				token._start +=   delta
+				if (token._end.__class__ is int):
+					token._end +=   delta
+				token = token.NextToken
+		else:
+			while (not isinstance(token, EndOfDocumentToken)):
+				token = token.NextToken
+
+		token._end = token._lineIndex.GetEndPosition()
+		return token
+
+	@classmethod
+	def _TokenizeChunks(cls, chunks, previousToken, position, internTable):
+		"""Tokenize the chunks of a document starting at offset 'position' and append the tokens to 'previousToken'.
+
+		Only a window of the current chunk and the unfinished lexeme from the previous chunk is kept. Indices into the
+		window are absolute offsets, so 'offset' is subtracted when the window is sliced.
+		"""
+		transitions =   cls.__TRANSITIONS__
+		translation =   cls.__CLASS_TRANSLATION__
+		runPatterns =   cls.__RUN_PATTERNS__
+		internTable =   {} if (internTable is None) else internTable
+
+		# local copies of all states, character classes and actions
+		OTHER_CHARS =           cls.TokenKind.OtherChars.value
+		SPACE_CHARS =           cls.TokenKind.SpaceChars.value
+		NUMBER_CHARS =          cls.TokenKind.NumberChars.value
+		ALPHA_CHARS =           cls.TokenKind.AlphaChars.value
+		POSSIBLE_COMMENT =      cls.TokenKind.PossibleSingleLineCommentStart.value
+		POSSIBLE_LINEBREAK =    cls.TokenKind.PossibleLinebreak.value
+		SINGLE_LINE_COMMENT =   cls.TokenKind.SingleLineComment.value
+		MULTI_LINE_COMMENT =    cls.TokenKind.MultiLineComment.value
+		DIRECTIVE =             cls.TokenKind.Directive.value
+		FUSEABLE_CHARACTER =    cls.TokenKind.FuseableCharacter.value
+		APOSTROPHE =            cls.CharacterClass.Apostrophe.value
+		LETTER =                cls.CharacterClass.Letter.value
+		FIRST_ACTION =          cls.Action.EmitLinebreak.value
+		EMIT_LINEBREAK =        cls.Action.EmitLinebreak.value
+		EMIT_CHARACTER =        cls.Action.EmitCharacter.value
+		EMIT_LEXEME =           cls.Action.EmitLexeme.value
+		COMMENT_END =           cls.Action.PossibleMultiLineCommentEnd.value
+		CHARACTER_LITERAL =     cls.Action.CharacterLiteral.value
+		FUSE_CHARACTER =        cls.Action.FuseCharacter.value
+
+		lexemeTokens = {
+			cls.TokenKind.PossibleStringLiteralStart.value:       StringLiteralToken,
+			cls.TokenKind.PossibleExtendedIdentifierStart.value:  ExtendedIdentifier,
+			cls.TokenKind.Directive.value:                        DirectiveToken,
+			SINGLE_LINE_COMMENT:                                  SingleLineCommentToken,
+			MULTI_LINE_COMMENT:                                   MultiLineCommentToken
+		}
+
+		lineIndex =         previousToken._lineIndex
+		state =             OTHER_CHARS
+		start =             position + 1
+		bufferStart =       position
+		content =           ""
+		offset =            position
+
+		for chunk in chunks:
+			# keep the unfinished lexeme starting at 'bufferStart' and append the next chunk
+			resume =            offset + len(content)
+			content =           content[bufferStart - offset:] + chunk
+			offset =            bufferStart
+
+			# classify all characters of a chunk at once; each character class is encoded as a single byte
+			characterClasses =  chunk.translate(translation).encode("ascii")
+
+			iterator =          enumerate(characterClasses, resume)
+			for index, charClass in iterator:
+				transition =  transitions[state][charClass]
+
+				# the current lexeme continues
+				if (transition == state):
+					# consume the remaining run of the lexeme in one step
+					if (runPatterns is not None):
+						length = runPatterns[state].match(content, index + 1 - offset).end() + offset - index - 1
+						if (length > 0):
+							next(islice(iterator, length - 1, length), None)
+					continue
+
+				dispatch =        False
+				resetStart =      True
+				characterState =  OTHER_CHARS
+
+				# States: SpaceChars, NumberChars, AlphaChars
+				if (state == ALPHA_CHARS):
+					value =         content[bufferStart - offset:index - offset]
+					interned =      internTable.get(value)
+					if (interned is None):
+						interned =    internTable[value] = (value, value.lower())
+					previousToken = StringToken(previousToken, interned[0], start, index + 1, interned[1])
+					yield previousToken
+					dispatch =      True
+				elif (state == SPACE_CHARS):
+					end = index
+					if isinstance(previousToken, (LinebreakToken, SingleLineCommentToken)):
+						previousToken = IndentationToken(previousToken, content[bufferStart - offset:index - offset], start, end)
+					else:
+						previousToken = SpaceToken(previousToken, content[bufferStart - offset:index - offset], start, end)
+					yield previousToken
+					dispatch =      True
+				elif (state == NUMBER_CHARS):
+					previousToken = IntegerLiteralToken(previousToken, content[bufferStart - offset:index - offset], start, index + 1)
+					yield previousToken
+					dispatch =      True
+
+				# State: OtherChars
+				elif (state == OTHER_CHARS):
+					dispatch =      True
+
+				# State: FuseableCharacter
+				elif (transition == FUSE_CHARACTER):
+					fused = content[bufferStart - offset:index + 1 - offset]
+					if (fused in ("=>", "**", ":=", "/=", "<=", ">=", "<>", "??", "?=", "<<", ">>", "?/=", "?<=", "?>=")):
+						previousToken = FusedCharacterToken(previousToken, fused, start, index + 1)
+						yield previousToken
+						state =         OTHER_CHARS
+					elif (fused in ("?/", "?<", "?>")):
+						pass
+					elif (fused == "/*"):
+						state =         MULTI_LINE_COMMENT
+					else:
+						previousToken = CharacterToken(previousToken, fused[0], start)
+						yield previousToken
+						if (len(fused) == 3):
+							previousToken = CharacterToken(previousToken, fused[1], start)
+							yield previousToken
+
+						# a single character is emitted, but the state machine stays in FuseableCharacter
+						transition =    transitions[OTHER_CHARS][charClass]
+						dispatch =      True
+						resetStart =    False
+						characterState = FUSEABLE_CHARACTER
+
+				# State: PossibleCharacterLiteral
+				elif (transition == CHARACTER_LITERAL):
+					length = index + 1 - bufferStart
+					if (length == 2):
+						if _IsTickPrefix(previousToken):
+							previousToken = CharacterToken(previousToken, "'", start)
+							yield previousToken
+							if not ((charClass == LETTER) or (content[index - offset] == "(")):
+								raise TokenizerException("Ambiguous syntax detected.", lineIndex.GetPosition(start + 1))
+
+							# the attribute name or the parenthesis of a qualified expression starts a new lexeme
+							transition =    transitions[OTHER_CHARS][charClass]
+							dispatch =      True
+						elif (charClass == APOSTROPHE):
+							previousToken = CharacterToken(previousToken, "'", start)
+							yield previousToken
+							previousToken = CharacterToken(previousToken, "'", index + 1)
+							yield previousToken
+							state =         OTHER_CHARS
+						else:
+							continue
+					elif (charClass == APOSTROPHE):
+						previousToken = CharacterLiteralToken(previousToken, content[bufferStart - offset:index + 1 - offset], start, index + 1)
+						yield previousToken
+						state =         OTHER_CHARS
+					else:
+						previousToken = CharacterToken(previousToken, "'", start)
+						yield previousToken
+
+						raise TokenizerException("Ambiguous syntax detected.", lineIndex.GetPosition(start + 1))
+
+				# States: PossibleStringLiteralStart, PossibleExtendedIdentifierStart, Directive, SingleLineComment, MultiLineComment
+				elif (transition == EMIT_LEXEME):
+					end = index + 1
+					if (state != POSSIBLE_LINEBREAK):
+						previousToken = lexemeTokens[state](previousToken, content[bufferStart - offset:index + 1 - offset], start, end)
+					# State: PossibleLinebreak
+					elif (content[bufferStart - offset:bufferStart + 2 - offset] == "--"):
+						previousToken = SingleLineCommentToken(previousToken, content[bufferStart - offset:index + 1 - offset], start, end)
+					else:
+						previousToken = LinebreakToken(previousToken, "\r\n", start, end)
+					yield previousToken
+					state =           OTHER_CHARS
+				elif (transition == COMMENT_END):
+					if (content[index - 1 - offset] == "*"):
+						previousToken = MultiLineCommentToken(previousToken, content[bufferStart - offset:index + 1 - offset], start, index + 1)
+						yield previousToken
+						state =         OTHER_CHARS
+
+				# State: PossibleSingleLineCommentStart
+				elif (state == POSSIBLE_COMMENT):
+					if (transition == SINGLE_LINE_COMMENT):
+						state =         SINGLE_LINE_COMMENT
+					else:
+						previousToken = CharacterToken(previousToken, "-", start)
+						yield previousToken
+						dispatch =      True
+						resetStart =    False
+
+				# State: PossibleLinebreak
+				elif (state == POSSIBLE_LINEBREAK):
+					end =             index + 1
+					previousToken =   LinebreakToken(previousToken, "\r", start, end)
+					yield previousToken
+					start =           end
+					dispatch =        True
+					resetStart =      False
+
+				# States: Directive, SingleLineComment
+				else:
+					state =           transition
+
+				if dispatch:
+					if resetStart:
+						start =       index + 1
+					bufferStart =   index
+
+					if (transition < FIRST_ACTION):
+						state =         transition
+
+						# consume a whole space, number or identifier lexeme in one step
+						if ((runPatterns is not None) and (state <= ALPHA_CHARS)):
+							length =      runPatterns[state].match(content, index + 1 - offset).end() + offset - index - 1
+							lexemeEnd =   index + length + 1
+
+							# a lexeme is only emitted, if it's terminated by another character
+							if (lexemeEnd < offset + len(content)):
+								if (state == ALPHA_CHARS):
+									value =         content[index - offset:lexemeEnd - offset]
+									interned =      internTable.get(value)
+									if (interned is None):
+										interned =    internTable[value] = (value, value.lower())
+									previousToken = StringToken(previousToken, interned[0], start, lexemeEnd + 1, interned[1])
+								elif (state == NUMBER_CHARS):
+									previousToken = IntegerLiteralToken(previousToken, content[index - offset:lexemeEnd - offset], start, lexemeEnd + 1)
+								elif isinstance(previousToken, (LinebreakToken, SingleLineCommentToken)):
+									previousToken = IndentationToken(previousToken, content[index - offset:lexemeEnd - offset], start, lexemeEnd)
+								else:
+									previousToken = SpaceToken(previousToken, content[index - offset:lexemeEnd - offset], start, lexemeEnd)
+								yield previousToken
+								state =     OTHER_CHARS
+
+							if (length > 0):
+								next(islice(iterator, length - 1, length), None)
+							continue
+					else:
+						state =         OTHER_CHARS
+						if (transition == EMIT_LINEBREAK):
+							previousToken = LinebreakToken(previousToken, "\n", start, start)
+							yield previousToken
+						elif ((transition == EMIT_CHARACTER) or not isinstance(previousToken, (SpaceToken, LinebreakToken))):
+							previousToken = CharacterToken(previousToken, content[index - offset], start)
+							yield previousToken
+							state =         characterState
+						else:
+							state =         DIRECTIVE
+			# end for
+
+		if (state == MULTI_LINE_COMMENT):
+			raise TokenizerException("End of document before end of multi line comment.", lineIndex.GetEndPosition())
+
+		# End of document
+		yield EndOfDocumentToken(previousToken, lineIndex.GetEndPosition())
+
+
+TableDrivenTokenizer.__cls_init__()
+
+
+class ScanningTokenizer(TableDrivenTokenizer):
+	"""Consume the remaining characters of identifiers, numbers, spaces, strings and comments by anchored regular expressions.
+
+	The regular expressions only pay off for long runs like comments. On typical VHDL sources with short identifiers
+	this engine is not faster than :class:`TableDrivenTokenizer`, which therefore stays the default engine.
+	"""
+
+	@classmethod
+	def __cls_init__(cls):
+		super().__cls_init__()
+
+		classes =     cls.__CHARACTER_CLASSES__
+		otherClass =  cls.CharacterClass.Other.value
+
+		# For each state, build a character set of all characters, which continue the current lexeme.
+		runPatterns = []
+		for state, transitions in enumerate(cls.__TRANSITIONS__):
+			if (transitions is None):
+				runPatterns.append(None)
+				continue
+
+			continuing = {charClass for charClass, transition in enumerate(transitions) if (transition == state)}
+			if (otherClass in continuing):
+				characters = "".join(chr(code) for code, charClass in enumerate(classes) if (charClass not in continuing))
+				runPatterns.append(re_compile("[^" + re_escape(characters) + "]*"))
+			elif continuing:
+				characters = "".join(chr(code) for code, charClass in enumerate(classes) if (charClass in continuing))
+				runPatterns.append(re_compile("[" + re_escape(characters) + "]*"))
+			else:
+				runPatterns.append(None)
+
+		cls.__RUN_PATTERNS__ = tuple(runPatterns)
+
+
+ScanningTokenizer.__cls_init__()
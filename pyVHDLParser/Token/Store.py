@@ -0,0 +1,333 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+#
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   An array-backed token store with flyweight tokens.
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# load dependencies
+from array    import array
+from weakref  import WeakValueDictionary
+
+from pyVHDLParser.Token       import EndOfToken
+from pyVHDLParser.Token.Parser  import TokenizerException
+
+
+class TokenColumns:
+	"""Keep a token stream in parallel arrays: token kinds, start/end offsets and indices into an interned value table.
+
+	The columns are shared by :class:`TokenStore` and the stream writer and reader in
+	:mod:`~pyVHDLParser.Serialization`. :class:`TokenView` reads a token from any of them.
+	"""
+
+	def __init__(self, lineIndex=None, kindTypes=None, valueTable=None, kinds=None, starts=None, ends=None, values=None):
+		self._lineIndex =   lineIndex
+		self.KindTypes =    [] if (kindTypes is None) else kindTypes
+		self.ValueTable =   [] if (valueTable is None) else valueTable
+		self.TokenKinds =   array("H") if (kinds is None) else kinds
+		self.TokenStarts =  array("i") if (starts is None) else starts    # absolute position or -1
+		self.TokenEnds =    array("i") if (ends is None) else ends        # absolute position or -1, also for end tokens
+		self.TokenValues =  array("i") if (values is None) else values    # index into the value table or -1
+
+		self._kindIndexes =   {cls: kind for kind, cls in enumerate(self.KindTypes)}
+		self._valueIndexes =  {value: valueIndex for valueIndex, value in enumerate(self.ValueTable)}
+
+	def Extend(self, tokens):
+		"""Append tokens of a table-driven tokenizer."""
+		kindIndexes =   self._kindIndexes
+		valueIndexes =  self._valueIndexes
+		kindTypes =     self.KindTypes
+		valueTable =    self.ValueTable
+		kinds =         self.TokenKinds
+		starts =        self.TokenStarts
+		ends =          self.TokenEnds
+		values =        self.TokenValues
+
+		for token in tokens:
+			if (self._lineIndex is None):
+				self._lineIndex = token._lineIndex
+				if (self._lineIndex is None):
+					raise TokenizerException("Tokens without line index can't be stored.", token.Start)
+
+			cls =   token.__class__
+			kind =  kindIndexes.get(cls)
+			if (kind is None):
+				kind = kindIndexes[cls] = len(kindTypes)
+				kindTypes.append(cls)
+
+			value = getattr(token, "Value", None)
+			if (value is None):
+				valueIndex = -1
+			else:
+				valueIndex = valueIndexes.get(value)
+				if (valueIndex is None):
+					valueIndex = valueIndexes[value] = len(valueTable)
+					valueTable.append(value)
+
+			start = token._start
+			end =   token._end
+			kinds.append(kind)
+			starts.append(-1 if (start is None) else start if (start.__class__ is int) else start.Absolute)
+			ends.append(-1 if ((end is None) or isinstance(token, EndOfToken)) else end if (end.__class__ is int) else end.Absolute)
+			values.append(valueIndex)
+
+	@property
+	def LineIndex(self):
+		return self._lineIndex
+
+	@property
+	def TokenCount(self):
+		return len(self.TokenKinds)
+
+	def GetKind(self, index):
+		return self.KindTypes[self.TokenKinds[index]]
+
+	def GetValue(self, index):
+		valueIndex = self.TokenValues[index]
+		return None if (valueIndex == -1) else self.ValueTable[valueIndex]
+
+	def GetStart(self, index):
+		start = self.TokenStarts[index]
+		return None if (start == -1) else self._lineIndex.GetPosition(start)
+
+	def GetEnd(self, index):
+		if issubclass(self.GetKind(index), EndOfToken):
+			return self._lineIndex.GetEndPosition()
+		end = self.TokenEnds[index]
+		return None if (end == -1) else self._lineIndex.GetPosition(end)
+
+
+class TokenView:
+	"""Lightweight read-only view on a token in :class:`TokenColumns`."""
+	__slots__ = ("_columns", "_index")
+
+	def __init__(self, columns, index):
+		self._columns = columns
+		self._index =   index
+
+	def __eq__(self, other):
+		return isinstance(other, TokenView) and (self._columns is other._columns) and (self._index == other._index)
+
+	def __hash__(self):
+		return hash((id(self._columns), self._index))
+
+	def __str__(self):
+		return "<{name} {value!r} at {pos!s}>".format(name=self.Kind.__name__, value=self.Value, pos=self.Start)
+
+	@property
+	def Index(self):
+		return self._index
+
+	@property
+	def Kind(self):
+		return self._columns.GetKind(self._index)
+
+	@property
+	def Value(self):
+		return self._columns.GetValue(self._index)
+
+	@property
+	def Start(self):
+		return self._columns.GetStart(self._index)
+
+	@property
+	def End(self):
+		return self._columns.GetEnd(self._index)
+
+	@property
+	def PreviousToken(self):
+		return None if (self._index == 0) else TokenView(self._columns, self._index - 1)
+
+	@property
+	def NextToken(self):
+		return None if (self._index + 1 == len(self._columns.TokenKinds)) else TokenView(self._columns, self._index + 1)
+
+
+class TokenStore(TokenColumns):
+	"""Keep a token stream in :class:`TokenColumns` and access it by flyweight tokens.
+
+	Tokens are accessed as flyweight :class:`StoredToken` objects. They are created on demand and are instances of a
+	view type derived from the stored token class, so a store can be passed to :meth:`TokenToBlockParser.Transform`
+	instead of a token generator. Links replaced by the block parser are kept in two small dictionaries.
+	"""
+
+	def __init__(self, lineIndex=None, kindTypes=None, valueTable=None, kinds=None, starts=None, ends=None, values=None):
+		super().__init__(lineIndex, kindTypes, valueTable, kinds, starts, ends, values)
+		self.LowerValueTable =  [None] * len(self.ValueTable)
+		self._viewTypes =       []
+		self._nextTokens =      {}
+		self._previousTokens =  {}
+		self._views =           WeakValueDictionary()
+
+	@classmethod
+	def FromTokens(cls, tokens):
+		"""Create a store from a token generator of a table-driven tokenizer (see :meth:`Extend`)."""
+		store = cls()
+		store.Extend(tokens)
+		return store
+
+	def Extend(self, tokens):
+		"""Append tokens of a table-driven tokenizer.
+
+		Each token is unlinked from its predecessor after it's stored, so the tokens of a generator are freed right
+		away. A token chain, which is still needed, must be passed as copies.
+		"""
+		def Unlink(tokens):
+			for token in tokens:
+				yield token
+				token._previousToken = None
+
+		super().Extend(Unlink(tokens))
+		self.LowerValueTable.extend([None] * (len(self.ValueTable) - len(self.LowerValueTable)))
+
+	def __reduce__(self):
+		# The columns are restored first, so stored tokens in the link dictionaries can be recreated as views.
+		columns = (self._lineIndex, self.KindTypes, self.ValueTable, self.TokenKinds, self.TokenStarts, self.TokenEnds, self.TokenValues)
+		return (self.__class__, columns, {"_nextTokens": self._nextTokens, "_previousTokens": self._previousTokens})
+
+	def __len__(self):
+		return len(self.TokenKinds)
+
+	def __getitem__(self, index):
+		if (index < 0):
+			index += len(self.TokenKinds)
+		if not (0 <= index < len(self.TokenKinds)):
+			raise IndexError("Token index out of range.")
+		return self._View(index)
+
+	def __iter__(self):
+		for index in range(len(self.TokenKinds)):
+			yield self._View(index)
+
+	def _View(self, index):
+		# Views are cached weakly, so a token referenced e.g. by a block keeps its identity for ``is`` comparisons.
+		view = self._views.get(index)
+		if (view is None):
+			kind =      self.TokenKinds[index]
+			viewTypes = self._viewTypes
+			if (kind >= len(viewTypes)):
+				viewTypes.extend(StoredToken.GetViewType(cls) for cls in self.KindTypes[len(viewTypes):])
+			view = self._views[index] = viewTypes[kind].__new__(viewTypes[kind])
+			view._store = self
+			view._index = index
+		return view
+
+
+class StoredToken:
+	"""Flyweight token in a :class:`TokenStore`.
+
+	This class is mixed into a view type per stored token class (see :meth:`GetViewType`), which has the name of the
+	token class and derives from it, so ``isinstance`` checks, dispatch maps and the token's methods work unchanged.
+	The token's data is read from the store instead of its slots. Pickling a stored token pickles its store.
+	"""
+	__slots__ =     ()
+	__VIEW_TYPES__ = {}
+
+	@classmethod
+	def GetViewType(cls, tokenClass):
+		"""Return the view type of stored tokens of class 'tokenClass'."""
+		viewType = cls.__VIEW_TYPES__.get(tokenClass)
+		if (viewType is None):
+			viewType = cls.__VIEW_TYPES__[tokenClass] = type(tokenClass)(tokenClass.__name__, (cls, tokenClass), {
+				"__slots__":    ("_store", "_index", "__weakref__"),
+				"__module__":   tokenClass.__module__,
+				"__qualname__": tokenClass.__qualname__
+			})
+		return viewType
+
+	def __reduce__(self):
+		return (self._store.__class__._View, (self._store, self._index))
+
+	@property
+	def Index(self):
+		return self._index
+
+	@property
+	def Value(self):
+		valueIndex = self._store.TokenValues[self._index]
+		if (valueIndex == -1):
+			raise AttributeError("Token '{0}' has no value.".format(self.__class__.__name__))
+		return self._store.ValueTable[valueIndex]
+
+	@property
+	def LowerValue(self):
+		store =       self._store
+		valueIndex =  store.TokenValues[self._index]
+		if (valueIndex == -1):
+			raise AttributeError("Token '{0}' has no value.".format(self.__class__.__name__))
+		lowerValue =  store.LowerValueTable[valueIndex]
+		if (lowerValue is None):
+			lowerValue = store.LowerValueTable[valueIndex] = store.ValueTable[valueIndex].lower()
+		return lowerValue
+
+	@property
+	def _lineIndex(self):
+		return self._store._lineIndex
+
+	@property
+	def _start(self):
+		start = self._store.TokenStarts[self._index]
+		return None if (start == -1) else start
+
+	@property
+	def _end(self):
+		end = self._store.TokenEnds[self._index]
+		if (end != -1):
+			return end
+		elif isinstance(self, EndOfToken):
+			return self._store._lineIndex.GetEndPosition()
+		return None
+
+	@property
+	def Start(self):
+		return self._store.GetStart(self._index)
+
+	@property
+	def End(self):
+		return self._store.GetEnd(self._index)
+
+	@property
+	def PreviousToken(self):
+		previousTokens = self._store._previousTokens
+		if (self._index in previousTokens):
+			return previousTokens[self._index]
+		return None if (self._index == 0) else self._store._View(self._index - 1)
+	@PreviousToken.setter
+	def PreviousToken(self, value):
+		self._store._previousTokens[self._index] = value
+		value.NextToken =                           self
+
+	_previousToken = PreviousToken
+
+	@property
+	def NextToken(self):
+		nextTokens = self._store._nextTokens
+		if (self._index in nextTokens):
+			return nextTokens[self._index]
+		index = self._index + 1
+		return None if (index == len(self._store.TokenKinds)) else self._store._View(index)
+	@NextToken.setter
+	def NextToken(self, value):
+		self._store._nextTokens[self._index] = value
@@ -27,19 +27,57 @@
 # limitations under the License.
 # ==============================================================================
 #
-from pyVHDLParser import SourceCodePosition, StartOfDocument, EndOfDocument, StartOfSnippet, EndOfSnippet
+from pyVHDLParser import SourceCodePosition, SourceCodeLineIndex, StartOfDocument, EndOfDocument, StartOfSnippet, EndOfSnippet
 
 
-class Token:
+class MetaToken(type):
+	"""Add an empty ``__slots__`` declaration to every token class, which doesn't declare its own slots."""
+	__DISPATCH_MAPS__ = []
+
+	def __new__(mcs, className, baseClasses, members):
+		members.setdefault("__slots__", ())
+		token = super().__new__(mcs, className, baseClasses, members)
+		for dispatchMap in mcs.__DISPATCH_MAPS__:
+			dispatchMap.AddClass(token)
+		return token
+
+
+class Token(metaclass=MetaToken):
+	__slots__ = ("_previousToken", "_lineIndex", "NextToken", "_start", "_end")
+
+	# Start and end are either SourceCodePosition objects or absolute offsets, which are resolved by the document's line index.
 	def __init__(self, previousToken, start, end=None):
 		previousToken.NextToken = self
 		self._previousToken : Token =               previousToken
+		self._lineIndex     : SourceCodeLineIndex = previousToken._lineIndex
 		self.NextToken      : Token =               None
-		self.Start          : SourceCodePosition =  start
-		self.End            : SourceCodePosition =  end
+		self._start =                               start
+		self._end =                                 end
 
 	def __len__(self):
-		return self.End.Absolute - self.Start.Absolute + 1
+		start = self._start
+		end =   self._end
+		if (start.__class__ is int):
+			return (end if (end.__class__ is int) else end.Absolute) - start + 1
+		return self.End.Absolute - start.Absolute + 1
+
+	@property
+	def Start(self):
+		if (self._start.__class__ is int):
+			return self._lineIndex.GetPosition(self._start)
+		return self._start
+	@Start.setter
+	def Start(self, value):
+		self._start = value
+
+	@property
+	def End(self):
+		if (self._end.__class__ is int):
+			return self._lineIndex.GetPosition(self._end)
+		return self._end
+	@End.setter
+	def End(self, value):
+		self._end = value
 
 	@property
 	def PreviousToken(self):
@@ -58,6 +96,8 @@ class Token:
 
 
 class ValuedToken(Token):
+	__slots__ = ("Value",)
+
 	def __init__(self, previousToken, value, start, end=None):
 		super().__init__(previousToken, start, end)
 		self.Value : str =  value
@@ -75,6 +115,8 @@ class ValuedToken(Token):
 
 
 class SuperToken(Token):
+	__slots__ = ("StartToken", "EndToken")
+
 	def __init__(self, startToken, endToken=None):
 		super().__init__(startToken.PreviousToken, startToken.Start, endToken.End if endToken else None)
 		self.StartToken = startToken
@@ -89,9 +131,10 @@ class SuperToken(Token):
 
 
 class StartOfToken(Token):
-	def __init__(self):
+	def __init__(self, lineIndex=None):
 		self._previousToken =     None
-		self._nextToken =         None
+		self._lineIndex =         lineIndex
+		self.NextToken =          None
 		self.Start =              SourceCodePosition(1, 1, 1)
 		self.End =                None
 
@@ -107,7 +150,8 @@ class EndOfToken(Token):
 	def __init__(self, previousToken, end):
 		previousToken.NextToken =     self
 		self._previousToken : Token = previousToken
-		self._nextToken =             None
+		self._lineIndex =             previousToken._lineIndex
+		self.NextToken =              None
 		self.Start =                  None
 		self.End =                    end
 
@@ -183,9 +227,23 @@ class SpaceToken(ValuedToken):
 
 
 class StringToken(ValuedToken):
+	__slots__ = ("LowerValue",)
+
+	def __init__(self, previousToken, value, start, end=None, lowerValue=None):
+		super().__init__(previousToken, value, start, end)
+		# tokenizers without an intern table leave the lower-cased value to be computed on first access
+		if (lowerValue is not None):
+			self.LowerValue : str = lowerValue
+
+	def __getattr__(self, name):
+		if (name != "LowerValue"):
+			raise AttributeError("'{0}' object has no attribute '{1}'".format(self.__class__.__name__, name))
+		self.LowerValue = lowerValue = self.Value.lower()
+		return lowerValue
+
 	def __eq__(self, other):  return self.Value == other
 	def __ne__(self, other):  return self.Value != other
-	def __le__(self, other):  return self.Value.lower() == other
+	def __le__(self, other):  return self.LowerValue == other
 	def __ge__(self, other):  return self.Value.upper() == other
 	def __hash__(self):       return super().__hash__()
 
@@ -301,3 +359,17 @@ class IndentationToken(SpaceToken):
 				value="'" + value + "'  ",
 				pos=self.Start
 			)
+
+
+# A run of whitespace, linebreak and comment tokens fused into a single whitespace token.
+class TriviaToken(SpaceToken):
+	def __str__(self):
+		value = self.Value
+		value = value.replace("\n", "\\n")
+		value = value.replace("\r", "\\r")
+		value = value.replace("\t", "\\t")
+		return "<{name: <50}  {value:.<59} at {pos!r}>".format(
+				name=self.__class__.__name__,
+				value="'" + value + "'  ",
+				pos=self.Start
+			)
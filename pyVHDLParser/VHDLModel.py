@@ -73,12 +73,15 @@ class Model(ModelEntity):
 		return self._documents
 
 
-class Library(ModelEntity):
+class Library(ModelEntity, NamedEntity):
 	def __init__(self):
 		super().__init__()
+		NamedEntity.__init__(self)
 		self._configurations =  []
 		self._entities =        []
+		self._architectures =   []
 		self._packages =        []
+		self._packageBodies =   []
 
 	@property
 	def Configurations(self):
@@ -88,10 +91,18 @@ class Library(ModelEntity):
 	def Entities(self):
 		return self._entities
 
+	@property
+	def Architectures(self):
+		return self._architectures
+
 	@property
 	def Packages(self):
 		return self._packages
 
+	@property
+	def PackageBodies(self):
+		return self._packageBodies
+
 
 class Document(ModelEntity):
 	def __init__(self):
@@ -182,6 +193,26 @@ class PortSignalInterfaceItem(PortInterfaceItem):
 		return self._defaultExpression
 
 
+class ParameterConstantInterfaceItem(ParameterInterfaceItem):
+	def __init__(self):
+		super().__init__()
+		self._subType =           None
+		self._mode =              None
+		self._defaultExpression = None
+
+	@property
+	def SubType(self):
+		return self._subType
+
+	@property
+	def Mode(self):
+		return self._mode
+
+	@property
+	def DefaultExpression(self):
+		return self._defaultExpression
+
+
 class ParameterVariableInterfaceItem(ParameterInterfaceItem):
 	def __init__(self):
 		super().__init__()
@@ -202,6 +233,26 @@ class ParameterVariableInterfaceItem(ParameterInterfaceItem):
 		return self._defaultExpression
 
 
+class ParameterSignalInterfaceItem(ParameterInterfaceItem):
+	def __init__(self):
+		super().__init__()
+		self._subType =           None
+		self._mode =              None
+		self._defaultExpression = None
+
+	@property
+	def SubType(self):
+		return self._subType
+
+	@property
+	def Mode(self):
+		return self._mode
+
+	@property
+	def DefaultExpression(self):
+		return self._defaultExpression
+
+
 # class GenericItem(ModelEntity):
 # 	def __init__(self):
 # 		super().__init__()
@@ -265,6 +316,10 @@ class Entity(PrimaryUnit):
 	def GenericItems(self):
 		return self._genericItems
 
+	@property
+	def PortItems(self):
+		return self._portItems
+
 	@property
 	def DeclaredItems(self):
 		return self._declaredItems
@@ -642,10 +697,15 @@ class SequentialStatement(Statement):	pass
 class ProcessStatement(ConcurrentStatement):
 	def __init__(self):
 		super().__init__()
+		self._sensitivityList = []
 		self._parameterItems =  []
 		self._declaredItems =   []
 		self._bodyItems =       []
 
+	@property
+	def SensitivityList(self):
+		return self._sensitivityList
+
 	@property
 	def ParameterItems(self):
 		return self._parameterItems
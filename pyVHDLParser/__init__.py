@@ -27,6 +27,30 @@
 # limitations under the License.
 # ==============================================================================
 #
+# load dependencies
+from array      import array
+from bisect     import bisect_left, bisect_right
+from importlib  import import_module
+from re         import compile as re_compile
+
+
+def ImportSubmodule(packageName, name):
+	"""Import submodule 'name' of package 'packageName' on first access; used by the packages' ``__getattr__``."""
+	if (name[:1] != "_"):
+		moduleName = packageName + "." + name
+		try:
+			return import_module(moduleName)
+		except ModuleNotFoundError as ex:
+			if (ex.name != moduleName):
+				raise
+
+	raise AttributeError("module '{package}' has no attribute '{name}'".format(package=packageName, name=name))
+
+
+def __getattr__(name):
+	return ImportSubmodule(__name__, name)
+
+
 class SourceCodePosition:
 	def __init__(self, row, column, absolute):
 		self.Row =       row
@@ -40,10 +64,88 @@ class SourceCodePosition:
 		return "(line: {0: >3}, col: {1: >2})".format(self.Row, self.Column)
 
 
-class StartOf:                  pass
-class StartOfDocument(StartOf): pass
-class StartOfSnippet(StartOf):  pass
+class SourceCodeLineIndex:
+	"""Map absolute offsets of a document to :class:`SourceCodePosition` objects by a sorted array of line start offsets."""
+
+	__LINEBREAK__ = re_compile("\n")
+
+	def __init__(self, content=""):
+		self._length =      0
+		self._lineStarts =  array("L", [1])
+		self.Append(content)
+
+	def Append(self, content):
+		"""Index the next chunk of a document, which is read in pieces."""
+		offset =        self._length
+		self._lineStarts.extend(offset + match.end() + 1 for match in self.__LINEBREAK__.finditer(content))
+		self._length += len(content)
+
+	def Replace(self, offset, removedLength, insertedText):
+		"""Update the index for an edit, which replaced 'removedLength' characters at offset 'offset' by 'insertedText'."""
+		lineStarts =  self._lineStarts
+		delta =       len(insertedText) - removedLength
+		# a line starts 2 positions after its preceding linebreak at (0-based) offset
+		first =       bisect_left(lineStarts, offset + 2)
+		last =        bisect_left(lineStarts, offset + removedLength + 2)
+
+		inserted =    array("L", (offset + match.end() + 1 for match in self.__LINEBREAK__.finditer(insertedText)))
+		if (delta != 0):
+			inserted.extend(lineStart + delta for lineStart in lineStarts[last:])
+		else:
+			inserted.extend(lineStarts[last:])
+
+		del lineStarts[first:]
+		lineStarts.extend(inserted)
+		self._length += delta
+
+	def __len__(self):
+		return len(self._lineStarts)
+
+	def GetPosition(self, absolute):
+		row = bisect_right(self._lineStarts, absolute)
+		return SourceCodePosition(row, absolute - self._lineStarts[row - 1] + 1, absolute)
+
+	def GetEndPosition(self):
+		# after a final linebreak, the end of document is located in column 0 of a new line
+		if (self._lineStarts[-1] > self._length):
+			return SourceCodePosition(len(self._lineStarts), 0, self._length)
+		return self.GetPosition(self._length)
+
+
+class TypeDispatchMap(dict):
+	"""Map exact classes to the value registered for their nearest base class.
+
+	The method resolution order is walked once per class, so the parsers can replace chains of ``isinstance``
+	checks with a single lookup of ``obj.__class__``. Classes created later are added by their metaclass, which
+	lists all maps in ``__DISPATCH_MAPS__``.
+	"""
+	__slots__ = ("_baseMapping",)
+
+	def __init__(self, baseMapping):
+		super().__init__()
+		self._baseMapping = baseMapping
+
+		for metaClass in {type(baseClass) for baseClass in baseMapping}:
+			metaClass.__DISPATCH_MAPS__.append(self)
+
+		self.update(baseMapping)
+		classes = list(baseMapping)
+		while classes:
+			cls = classes.pop()
+			self.AddClass(cls)
+			classes.extend(cls.__subclasses__())
+
+	def AddClass(self, cls):
+		for baseClass in cls.__mro__:
+			if (baseClass in self._baseMapping):
+				self[cls] = self._baseMapping[baseClass]
+				return
+
+
+class StartOf:                  __slots__ = ()
+class StartOfDocument(StartOf): __slots__ = ()
+class StartOfSnippet(StartOf):  __slots__ = ()
 
-class EndOf:                    pass
-class EndOfDocument(EndOf):     pass
-class EndOfSnippet(EndOf):      pass
+class EndOf:                    __slots__ = ()
+class EndOfDocument(EndOf):     __slots__ = ()
+class EndOfSnippet(EndOf):      __slots__ = ()
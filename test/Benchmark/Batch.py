@@ -0,0 +1,67 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# load dependencies
+from sys                          import argv
+from time                         import perf_counter
+
+from pyVHDLParser.Batch           import ParseFiles
+from test.Benchmark               import GetVHDLFiles
+
+
+WORKERS = (1, 2, 4, 8, 16)
+
+
+def MeasureBatch(paths, workers):
+	"""Return the results and the wall clock time to parse 'paths' with 'workers' processes."""
+	start =   perf_counter()
+	results = ParseFiles(paths, workers=workers)
+	elapsed = perf_counter() - start
+	return results, elapsed
+
+
+def Main(repeat=50):
+	paths = GetVHDLFiles() * repeat
+	print("Parsing {count} files ({files} example files x{repeat}) into DocumentModels:".format(count=len(paths), files=len(paths) // repeat, repeat=repeat))
+
+	baseline = None
+	for workers in WORKERS:
+		results, elapsed = MeasureBatch(paths, workers)
+		if (baseline is None):
+			baseline = elapsed
+		print("  {workers: >2} workers  {time: >8.3f} s  {rate: >8,.1f} files/s  speedup {speedup: >5.2f}  failed: {failed}".format(
+			workers=workers,
+			time=elapsed,
+			rate=len(paths) / elapsed,
+			speedup=baseline / elapsed,
+			failed=sum(1 for result in results if result.Failed)
+		))
+
+
+if (__name__ == "__main__"):
+	Main(*[int(arg) for arg in argv[1:2]])
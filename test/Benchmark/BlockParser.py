@@ -0,0 +1,73 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from sys                          import argv
+from time                         import perf_counter
+
+from pyVHDLParser.Blocks          import MetaBlock, TokenToBlockParser
+from pyVHDLParser.Token.Parser    import TableDrivenTokenizer
+from test.Benchmark               import vhdlDirectory
+
+
+def MeasureBlocks(content, trivia=True, rounds=5):
+	"""Return the number of blocks and the best time to transform a pre-tokenized 'content' into blocks."""
+	best = None
+	for _ in range(rounds):
+		tokens =      list(TableDrivenTokenizer.GetVHDLTokenizer(content))
+		start =       perf_counter()
+		blockCount =  sum(1 for _ in TokenToBlockParser.Transform(tokens, trivia=trivia))
+		elapsed =     perf_counter() - start
+		if ((best is None) or (elapsed < best)):
+			best = elapsed
+	return blockCount, best
+
+
+def Main(fileName="Package.vhdl", repeat=100):
+	start =   perf_counter()
+	MetaBlock.Initialize()
+	elapsed = perf_counter() - start
+	print("Initializing {count} block classes: {time:.1f} ms".format(count=len(MetaBlock.BLOCKS), time=elapsed * 1000))
+
+	with (vhdlDirectory / fileName).open('r') as fileHandle:
+		content = fileHandle.read() * repeat
+
+	print("Transforming '{file}' x{repeat} into blocks:".format(file=fileName, repeat=repeat))
+	for trivia in (True, False):
+		blockCount, elapsed = MeasureBlocks(content, trivia)
+		print("  trivia={trivia!s: <6} {blocks: >8,} blocks  {time: >8.3f} s  {rate: >10,.0f} blocks/s".format(
+			trivia=trivia,
+			blocks=blockCount,
+			time=elapsed,
+			rate=blockCount / elapsed
+		))
+
+
+if (__name__ == "__main__"):
+	Main(*argv[1:2])
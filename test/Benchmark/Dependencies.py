@@ -0,0 +1,63 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from sys                          import argv
+
+from pyVHDLParser.Blocks          import TokenToBlockParser
+from pyVHDLParser.Dependencies    import DependencyScanner
+from pyVHDLParser.Token.Parser    import TableDrivenTokenizer
+from test.Benchmark               import vhdlDirectory, Measure
+
+
+def ParseBlocks(content):
+	for _ in TokenToBlockParser.Transform(TableDrivenTokenizer.GetVHDLTokenizer(content)):
+		pass
+
+
+def Main(fileName="Architecture.vhdl", repeat=100):
+	with (vhdlDirectory / fileName).open('r') as fileHandle:
+		content = fileHandle.read() * repeat
+
+	print("Extracting dependencies of '{file}' x{repeat} ({chars:,} characters):".format(file=fileName, repeat=repeat, chars=len(content)))
+	baseline = None
+	for name, function in (("tokens and blocks", ParseBlocks), ("dependency scan", DependencyScanner.Scan)):
+		elapsed = Measure(function, content)
+		if (baseline is None):
+			baseline = elapsed
+		print("  {name: <24} {time: >8.3f} s  {rate: >12,.0f} chars/s  x{speedup:.2f}".format(
+			name=name,
+			time=elapsed,
+			rate=len(content) / elapsed,
+			speedup=baseline / elapsed
+		))
+
+
+if (__name__ == "__main__"):
+	Main(*argv[1:2])
@@ -0,0 +1,106 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+# load dependencies
+from sys                          import argv
+from time                         import perf_counter
+
+from pyVHDLParser.Blocks          import MetaBlock
+from pyVHDLParser.DocumentModel   import Document
+
+
+def GenerateUnits(index, itemCount):
+	"""Return an entity, architecture and package with 'itemCount' generics, ports, signals, constants and functions each."""
+	lines = ["library ieee;", "use ieee.std_logic_1164.all;", ""]
+	lines.append("entity e{0} is".format(index))
+	lines.append("\tgeneric (")
+	lines.append(";\n".join("\t\tG{0} : integer := {0}".format(i) for i in range(itemCount)))
+	lines.append("\t);")
+	lines.append("\tport (")
+	lines.append(";\n".join("\t\tp{0} : in std_logic".format(i) for i in range(itemCount)))
+	lines.append("\t);")
+	lines.append("end entity;")
+	lines.append("")
+	lines.append("architecture rtl of e{0} is".format(index))
+	for i in range(itemCount):
+		lines.append("\tsignal s{0} : std_logic;".format(i))
+		lines.append("\tconstant C{0} : integer := {0};".format(i))
+	lines.append("begin")
+	for i in range(itemCount):
+		lines.append("\tprocess(p{0})".format(i))
+		lines.append("\tbegin")
+		lines.append("\tend process;")
+	lines.append("end architecture;")
+	lines.append("")
+	lines.append("package pkg{0} is".format(index))
+	for i in range(itemCount):
+		lines.append("\tconstant K{0} : integer := {0};".format(i))
+		lines.append("\tfunction f{0}(a : integer) return integer;".format(i))
+	lines.append("end package;")
+	lines.append("")
+	return "\n".join(lines)
+
+
+def MeasureExtraction(sources):
+	"""Return the number of design units and model items and the wall clock time to extract DocumentModels from 'sources'."""
+	units = items = 0
+	start = perf_counter()
+	for i, source in enumerate(sources):
+		document = Document("generated{0}.vhdl".format(i))
+		document.Parse(source)
+		for entity in document.Entities:
+			items += len(entity.GenericItems) + len(entity.PortItems) + len(entity.DeclaredItems) + len(entity.BodyItems)
+		for architecture in document.Architectures:
+			items += len(architecture.DeclaredItems) + len(architecture.BodyItems)
+		for package in document.Packages:
+			items += len(package.GenericItems) + len(package.DeclaredItems)
+		units += len(document.Entities) + len(document.Architectures) + len(document.Packages)
+	elapsed = perf_counter() - start
+	return units, items, elapsed
+
+
+def Main(fileCount=100):
+	MetaBlock.Initialize()
+
+	print("End-to-end DocumentModel extraction of {count} generated files:".format(count=fileCount))
+	for itemCount in (4, 16, 64):
+		sources =                 [GenerateUnits(i, itemCount) for i in range(fileCount)]
+		size =                    sum(len(source) for source in sources)
+		units, items, elapsed =   MeasureExtraction(sources)
+		print("  {itemCount: >3} items/unit  {time: >8.3f} s  {files: >8,.1f} files/s  {mb: >6.2f} MB/s  {units: >8,.1f} units/s  {items: >10,.1f} items/s".format(
+			itemCount=itemCount,
+			time=elapsed,
+			files=fileCount / elapsed,
+			mb=size / elapsed / 1e6,
+			units=units / elapsed,
+			items=items / elapsed
+		))
+
+
+if (__name__ == "__main__"):
+	Main(*[int(arg) for arg in argv[1:2]])
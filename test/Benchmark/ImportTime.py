@@ -0,0 +1,85 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# load dependencies
+from subprocess                   import run, PIPE
+from sys                          import argv, executable
+
+from test.Benchmark               import rootDirectory
+
+
+MODULES = [
+	"pyVHDLParser.Token.Parser",
+	"pyVHDLParser.Blocks",
+	"pyVHDLParser.Groups",
+	"pyVHDLParser.DocumentModel"
+]
+
+
+def MeasureImport(moduleName):
+	"""Import 'moduleName' in a fresh interpreter with '-X importtime' and return the parsed report lines.
+
+	Each line is a tuple of the module name, its own and its cumulative import time in microseconds.
+	"""
+	process = run(
+		[executable, "-X", "importtime", "-c", "import " + moduleName],
+		cwd=str(rootDirectory), stdout=PIPE, stderr=PIPE, universal_newlines=True, check=True
+	)
+
+	report = []
+	for line in process.stderr.splitlines():
+		if (not line.startswith("import time:")):
+			continue
+		selfTime, cumulativeTime, name = line[12:].split("|")
+		if (not selfTime.strip().isdigit()):
+			continue
+		report.append((name.strip(), int(selfTime), int(cumulativeTime)))
+	return report
+
+
+def Main(rounds=5):
+	print("Import time of the parser layers (best of {0} fresh interpreters):".format(rounds))
+
+	for moduleName in MODULES:
+		best = None
+		for _ in range(rounds):
+			report = MeasureImport(moduleName)
+			if ((best is None) or (report[-1][2] < best[-1][2])):
+				best = report
+
+		modules = [name for name, _, _ in best]
+		print("  {name: <28} {time: >8.1f} ms  {count: >3} pyVHDLParser modules  colorama: {colorama}".format(
+			name=moduleName,
+			time=best[-1][2] / 1000,
+			count=sum(1 for name in modules if name.startswith("pyVHDLParser")),
+			colorama="loaded" if ("colorama" in modules) else "not loaded"
+		))
+
+
+if (__name__ == "__main__"):
+	Main(*[int(arg) for arg in argv[1:2]])
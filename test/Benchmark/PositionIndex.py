@@ -0,0 +1,78 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+# load dependencies
+from random                       import Random
+from time                         import perf_counter
+
+from pyVHDLParser.Blocks          import TokenToBlockParser
+from pyVHDLParser.PositionIndex   import PositionIndex
+from pyVHDLParser.Token.Parser    import TableDrivenTokenizer
+from test.Benchmark               import vhdlDirectory
+
+
+def WalkToBlock(startBlock, offset):
+	"""Find the block at 'offset' by walking the block chain, as done without an index."""
+	block = startBlock.NextBlock
+	while (block is not None):
+		if (block.StartToken.Start.Absolute <= offset <= block.EndToken.End.Absolute):
+			return block
+		block = block.NextBlock
+	return None
+
+
+def Main(fileName="Package.vhdl", repeat=100, lookups=200):
+	with (vhdlDirectory / fileName).open('r') as fileHandle:
+		content = fileHandle.read() * repeat
+
+	blocks =      list(TokenToBlockParser.Transform(TableDrivenTokenizer.GetVHDLTokenizer(content)))
+	startBlock = blocks[0]
+
+	start =       perf_counter()
+	index =       PositionIndex(startBlock.StartToken, startBlock)
+	buildTime =   perf_counter() - start
+
+	random =    Random(0)
+	offsets =   [random.randrange(len(content)) for _ in range(lookups)]
+	print("Finding blocks at {lookups} random offsets in '{file}' x{repeat} ({blocks:,} blocks, index built in {time:.1f} ms):".format(
+		lookups=lookups,
+		file=fileName,
+		repeat=repeat,
+		blocks=len(blocks),
+		time=buildTime * 1000
+	))
+	for name, find in (("chain walk", lambda offset: WalkToBlock(startBlock, offset)), ("PositionIndex", index.FindBlockAt)):
+		start =   perf_counter()
+		for offset in offsets:
+			find(offset)
+		elapsed = perf_counter() - start
+		print("  {name: <14} {time: >10.3f} ms  {perLookup: >10.2f} us/lookup".format(name=name, time=elapsed * 1000, perLookup=elapsed / lookups * 1e6))
+
+
+if (__name__ == "__main__"):
+	Main()
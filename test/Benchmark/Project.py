@@ -0,0 +1,90 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from sys                                import argv
+from time                               import perf_counter
+
+from pyVHDLParser.Blocks                import MetaBlock
+from pyVHDLParser.DocumentModel         import Document
+from pyVHDLParser.DocumentModel.Project import Project
+from test.Benchmark.DocumentModel       import GenerateUnits
+
+
+def ScanPackage(documents, packageName):
+	"""Find a package by scanning all documents, as done without a project."""
+	for document in documents:
+		for package in document.Packages:
+			if (package.Name.lower() == packageName):
+				return package
+	return None
+
+
+def Main(fileCount=200):
+	MetaBlock.Initialize()
+
+	documents = []
+	for i in range(fileCount):
+		document = Document("generated{0}.vhdl".format(i))
+		document.Parse(GenerateUnits(i, 4))
+		documents.append(document)
+
+	start = perf_counter()
+	project = Project()
+	for document in documents:
+		project.AddDocument(document)
+	elapsed = perf_counter() - start
+	print("Added {count} documents to a project in {time:.3f} ms.".format(count=fileCount, time=elapsed * 1e3))
+
+	names = ["pkg{0}".format(i) for i in range(fileCount)]
+	start = perf_counter()
+	for name in names:
+		ScanPackage(documents, name)
+	scanned = perf_counter() - start
+	start = perf_counter()
+	for name in names:
+		project.GetPackage("work", name)
+	indexed = perf_counter() - start
+	print("Resolving {count} packages:  scan {scan: >10.3f} ms  index {index: >8.3f} ms  speedup {speedup: >8.1f}".format(
+		count=len(names),
+		scan=scanned * 1e3,
+		index=indexed * 1e3,
+		speedup=scanned / indexed
+	))
+
+	replacement = Document(documents[0].FilePath)
+	replacement.Parse(GenerateUnits(0, 4))
+	start = perf_counter()
+	project.AddDocument(replacement)
+	elapsed = perf_counter() - start
+	print("Replaced one re-parsed document in {time:.3f} ms.".format(time=elapsed * 1e3))
+
+
+if (__name__ == "__main__"):
+	Main(*[int(arg) for arg in argv[1:2]])
@@ -0,0 +1,95 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+# load dependencies
+from sys                          import argv
+from tempfile                     import TemporaryDirectory
+from pathlib                      import Path
+from tracemalloc                  import start as tracemalloc_start, stop as tracemalloc_stop, get_traced_memory
+
+from pyVHDLParser.Blocks          import MetaBlock, TokenToBlockParser
+from pyVHDLParser.Groups          import BlockToGroupParser
+from pyVHDLParser.Token.Parser    import TableDrivenTokenizer, BoundedInternTable
+
+
+def WriteNetlist(path, signalCount):
+	"""Write a generated netlist like architecture with 'signalCount' signal declarations to 'path'."""
+	with path.open('w') as fileHandle:
+		fileHandle.write("library ieee;\nuse ieee.std_logic_1164.all;\n\narchitecture net of top is\n")
+		for i in range(signalCount):
+			fileHandle.write("\tsignal n{0} : std_logic;\n".format(i))
+		fileHandle.write("begin\nend architecture;\n")
+
+
+def WriteReferences(path, libraryCount):
+	"""Write 'libraryCount' library and use clauses to 'path', as the group parser doesn't support architecture bodies yet."""
+	with path.open('w') as fileHandle:
+		for i in range(libraryCount):
+			fileHandle.write("library lib{0};\nuse lib{0}.pkg.all;\n".format(i))
+
+
+def MeasurePeak(path, streaming, groups):
+	"""Return the number of blocks or groups and the peak memory used while a consumer scans and drops them."""
+	tracemalloc_start()
+	internTable = BoundedInternTable(4096) if streaming else None
+	tokenStream = TableDrivenTokenizer.GetVHDLTokenizerFromFile(path, chunkSize=65536, internTable=internTable)
+	stream =      TokenToBlockParser.Transform(tokenStream, streaming=streaming)
+	if groups:
+		stream =    BlockToGroupParser.Transform(stream, streaming=streaming)
+	count =       sum(1 for _ in stream)
+	_, peak =     get_traced_memory()
+	tracemalloc_stop()
+	return count, peak
+
+
+def Main(groups="blocks"):
+	MetaBlock.Initialize()
+	groups = (groups == "groups")
+
+	with TemporaryDirectory() as directory:
+		path = Path(directory) / "generated.vhdl"
+		print("Peak memory of a linear scan over generated {kind}:".format(kind="context clauses (groups)" if groups else "netlists (blocks)"))
+		for count in (5000, 10000, 20000):
+			if groups:
+				WriteReferences(path, count)
+			else:
+				WriteNetlist(path, count)
+			size = path.stat().st_size
+			for streaming in (False, True):
+				count, peak = MeasurePeak(path, streaming, groups)
+				print("  {size: >12,} bytes  streaming={streaming!s: <6} {count: >8,} {unit}  peak {peak: >14,} bytes".format(
+					size=size,
+					streaming=streaming,
+					count=count,
+					unit="groups" if groups else "blocks",
+					peak=peak
+				))
+
+
+if (__name__ == "__main__"):
+	Main(*argv[1:2])
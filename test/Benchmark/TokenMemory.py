@@ -0,0 +1,95 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from tracemalloc                  import start as tracemalloc_start, stop as tracemalloc_stop, get_traced_memory
+
+from pyVHDLParser.Token.Parser    import TableDrivenTokenizer, ScanningTokenizer
+from pyVHDLParser.Token.Store     import TokenStore
+from test.Benchmark               import GetVHDLFiles
+from test.Benchmark.Tokenizer     import TOKENIZERS
+
+
+STORE_TOKENIZERS = [
+	("TokenStore (table)",    TableDrivenTokenizer),
+	("TokenStore (scanning)", ScanningTokenizer)
+]
+
+
+def MeasureTokens(tokenizer, content):
+	"""Return the number of tokens and the bytes retained by the token chain of 'content'."""
+	tracemalloc_start()
+	tokenStream =   tokenizer.GetVHDLTokenizer(content)
+	firstToken =    next(tokenStream)
+	tokenCount =    1 + sum(1 for _ in tokenStream)
+	retained, _ =   get_traced_memory()
+	tracemalloc_stop()
+
+	del firstToken
+	return tokenCount, retained
+
+
+def MeasureStore(tokenizer, content):
+	"""Return the number of tokens and the bytes retained by a token store of 'content'."""
+	tracemalloc_start()
+	store =         TokenStore.FromTokens(tokenizer.GetVHDLTokenizer(content))
+	tokenCount =    len(store)
+	retained, _ =   get_traced_memory()
+	tracemalloc_stop()
+
+	del store
+	return tokenCount, retained
+
+
+def Main():
+	files = GetVHDLFiles()
+	print("Retained memory of token chains and token stores over {0} files in 'vhdl/':".format(len(files)))
+
+	measurements =  [(name, MeasureTokens, tokenizer) for name, tokenizer in TOKENIZERS]
+	measurements += [(name, MeasureStore, tokenizer) for name, tokenizer in STORE_TOKENIZERS]
+	for name, measure, tokenizer in measurements:
+		totalTokens = 0
+		totalBytes =  0
+		for file in files:
+			with file.open('r') as fileHandle:
+				content = fileHandle.read()
+			tokenCount, retained = measure(tokenizer, content)
+			totalTokens +=  tokenCount
+			totalBytes +=   retained
+
+		print("  {name: <24} {tokens: >8,} tokens  {size: >12,} bytes  {perToken: >7.1f} bytes/token".format(
+			name=name,
+			tokens=totalTokens,
+			size=totalBytes,
+			perToken=totalBytes / totalTokens
+		))
+
+
+if (__name__ == "__main__"):
+	Main()
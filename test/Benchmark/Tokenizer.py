@@ -0,0 +1,65 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from pyVHDLParser.Token.Parser  import Tokenizer, TableDrivenTokenizer, ScanningTokenizer
+from test.Benchmark             import GetContent, Measure
+
+
+TOKENIZERS = [
+	("Tokenizer",             Tokenizer),
+	("TableDrivenTokenizer",  TableDrivenTokenizer),
+	("ScanningTokenizer",     ScanningTokenizer)
+]
+
+
+def Tokenize(tokenizer, content):
+	for _ in tokenizer.GetVHDLTokenizer(content):
+		pass
+
+
+def Main(repeat=50):
+	content = GetContent(repeat)
+	print("Tokenizing {0} characters:".format(len(content)))
+
+	baseline = None
+	for name, tokenizer in TOKENIZERS:
+		elapsed = Measure(Tokenize, tokenizer, content)
+		if (baseline is None):
+			baseline = elapsed
+		print("  {name: <24} {time: >8.3f} s  {rate: >12,.0f} chars/s  x{speedup:.2f}".format(
+			name=name,
+			time=elapsed,
+			rate=len(content) / elapsed,
+			speedup=baseline / elapsed
+		))
+
+
+if (__name__ == "__main__"):
+	Main()
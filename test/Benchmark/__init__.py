@@ -0,0 +1,56 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from time     import perf_counter
+
+from test     import rootDirectory, vhdlDirectory, GetVHDLFiles
+
+
+def GetContent(repeat=1):
+	"""Concatenate all example files in 'vhdl/' and repeat them to get a measurable input."""
+	content = ""
+	for file in GetVHDLFiles():
+		with file.open('r') as fileHandle:
+			content += fileHandle.read()
+		if (content[-1:] != "\n"):
+			content += "\n"
+	return content * repeat
+
+
+def Measure(function, *args, rounds=5):
+	"""Return the best wall clock time of 'rounds' calls."""
+	best = None
+	for _ in range(rounds):
+		start =   perf_counter()
+		function(*args)
+		elapsed = perf_counter() - start
+		if ((best is None) or (elapsed < best)):
+			best = elapsed
+	return best
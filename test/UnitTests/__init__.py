@@ -0,0 +1,85 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from pyVHDLParser.Blocks      import MetaBlock
+
+from test                     import rootDirectory, vhdlDirectory, GetVHDLFiles
+
+
+MetaBlock.Initialize()
+
+
+def ReadFile(file):
+	with file.open('r') as fileHandle:
+		return fileHandle.read()
+
+
+def DumpToken(token):
+	"""Return type, value and resolved positions of 'token' for comparison."""
+	start =   token.Start
+	end =     token.End
+	return (
+		token.__class__.__name__,
+		getattr(token, "Value", None),
+		None if (start is None) else (start.Row, start.Column, start.Absolute),
+		None if (end is None) else (end.Row, end.Column, end.Absolute)
+	)
+
+
+def DumpTokens(startToken):
+	"""Return :func:`DumpToken` of all tokens behind 'startToken'."""
+	tokens =  []
+	token =   startToken.NextToken
+	while (token is not None):
+		tokens.append(DumpToken(token))
+		token = token.NextToken
+	return tokens
+
+
+def DumpBlock(block):
+	"""Return type and token range of 'block' for comparison."""
+	startToken =  block.StartToken
+	endToken =    block.EndToken
+	return (
+		block.__class__.__name__,
+		None if (startToken is None) else (startToken.__class__.__name__, startToken.Start.Absolute),
+		None if (endToken is None) else (endToken.__class__.__name__, endToken.End.Absolute),
+		block.MultiPart
+	)
+
+
+def DumpBlocks(startBlock):
+	"""Return :func:`DumpBlock` of all blocks in the chain beginning with 'startBlock'."""
+	blocks =  []
+	block =   startBlock
+	while (block is not None):
+		blocks.append(DumpBlock(block))
+		block = block.NextBlock
+	return blocks
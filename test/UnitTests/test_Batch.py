@@ -0,0 +1,113 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from os                               import stat, utime
+from pathlib                          import Path
+from tempfile                         import TemporaryDirectory
+from unittest                         import TestCase
+
+from pyVHDLParser.Batch               import FileResult, ParseFiles, ScanFiles
+from pyVHDLParser.Dependencies        import DependencySummary
+from pyVHDLParser.DocumentModel.Cache import ParseCache
+from test.UnitTests                   import vhdlDirectory, GetVHDLFiles
+
+
+def Results(results):
+	return [vars(result) for result in results]
+
+
+class ParseFilesTest(TestCase):
+	FAILING = ("Context.vhdl", "Current.vhdl", "Example_1.vhdl", "PackageBody.vhdl", "SensitivityList.vhdl", "Simple_1.vhdl", "_Current.vhdl")
+
+	def setUp(self):
+		# mix parsed and failing files and repeat them, so each worker gets several chunks
+		self._paths = (GetVHDLFiles() + [vhdlDirectory / "Missing.vhdl"]) * 2
+
+	def test_ResultOrder(self):
+		for workers in (1, 3):
+			with self.subTest(workers=workers):
+				results = ParseFiles(self._paths, workers=workers, chunkSize=2)
+				self.assertEqual([result.Path for result in results], self._paths)
+				self.assertTrue(all(result.__class__ is FileResult for result in results))
+
+	def test_ErrorsAreCapturedPerFile(self):
+		for result in ParseFiles(self._paths, workers=1):
+			with self.subTest(file=result.Path.name):
+				if (result.Path.name == "Missing.vhdl"):
+					self.assertEqual(result.Error, "GroupParserException: File '{0!s}' does not exist.".format(result.Path))
+				elif (result.Path.name in self.FAILING):
+					self.assertTrue(result.Failed)
+					self.assertEqual(result.Entities, ())
+				else:
+					self.assertFalse(result.Failed, result.Error)
+
+		architecture, = ParseFiles([vhdlDirectory / "Process.vhdl"], workers=1)
+		self.assertEqual(architecture.Architectures, (("rtl", "myEntity"),))
+
+	def test_PoolMatchesOneWorker(self):
+		expected = Results(ParseFiles(self._paths, workers=1))
+		for workers, chunkSize in ((2, None), (4, 1)):
+			with self.subTest(workers=workers, chunkSize=chunkSize):
+				self.assertEqual(Results(ParseFiles(self._paths, workers=workers, chunkSize=chunkSize)), expected)
+
+	def test_Cache(self):
+		with TemporaryDirectory() as directory:
+			cache =     ParseCache(directory)
+			expected =  Results(ParseFiles(self._paths, workers=1))
+
+			self.assertEqual(Results(ParseFiles(self._paths, workers=2, cache=cache)), expected)
+			entries = sorted(Path(directory).glob("*.pickle"))
+			self.assertEqual(len(entries), len(self._paths) // 2 - len(self.FAILING) - 1)
+
+			# a hit updates the entry's modification time
+			for entry in entries:
+				utime(str(entry), (0, 0))
+			self.assertEqual(Results(ParseFiles(self._paths, workers=2, cache=cache)), expected)
+			self.assertTrue(all(stat(str(entry)).st_mtime > 0 for entry in entries))
+			self.assertEqual(sorted(Path(directory).glob("*.pickle")), entries)
+
+
+class ScanFilesTest(TestCase):
+	def test_ResultOrder(self):
+		paths = GetVHDLFiles() * 2
+		for workers in (1, 3):
+			with self.subTest(workers=workers):
+				results = ScanFiles(paths, workers=workers, chunkSize=2)
+				self.assertEqual([result.Path for result in results], paths)
+				self.assertTrue(all(isinstance(result, DependencySummary) for result in results))
+				self.assertTrue(all(result.Diagnostics == () for result in results))
+
+	def test_ParsedFieldsMatch(self):
+		for scanned, parsed in zip(ScanFiles(GetVHDLFiles(), workers=1), ParseFiles(GetVHDLFiles(), workers=1)):
+			if parsed.Failed:
+				continue
+			with self.subTest(file=parsed.Path.name):
+				self.assertEqual(scanned.Entities, parsed.Entities)
+				self.assertEqual(scanned.Packages, parsed.Packages)
@@ -0,0 +1,64 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from unittest                     import TestCase
+
+from pyVHDLParser.Blocks          import TokenToBlockParser
+from pyVHDLParser.Blocks.Generic1 import CloseBlock
+from pyVHDLParser.Blocks.List     import GenericList, PortList
+from pyVHDLParser.Token.Parser    import TableDrivenTokenizer
+from test.UnitTests               import vhdlDirectory, ReadFile
+
+
+def CloseBlockTypes(content):
+	"""Return the types of all close blocks of a parenthesized list."""
+	return [block.__class__ for block in TokenToBlockParser.Transform(TableDrivenTokenizer.GetVHDLTokenizer(content)) if isinstance(block, CloseBlock)]
+
+
+class CloseBlockTest(TestCase):
+	"""Generic and port lists are closed by their own close block type, which the group parser relies on."""
+
+	SNIPPETS = (
+		"entity e is\n\tgeneric ( G : integer );\n\tport ( p : in bit );\nend entity;\n",
+		"entity e is\n\tgeneric ( G : integer ) ;\n\tport ( p : in bit ) ;\nend entity;\n",
+		"entity e is\n\tgeneric (\n\t\tG : integer\n\t);\n\tport (\n\t\tp : in bit\n\t);\nend entity;\n"
+	)
+
+	def test_Snippets(self):
+		for content in self.SNIPPETS:
+			with self.subTest(content=content):
+				self.assertEqual(CloseBlockTypes(content), [GenericList.CloseBlock, PortList.CloseBlock])
+
+	def test_Files(self):
+		for fileName, closeBlockType in (("GenericList.vhdl", GenericList.CloseBlock), ("PortList.vhdl", PortList.CloseBlock)):
+			with self.subTest(file=fileName):
+				closeBlockTypes = CloseBlockTypes(ReadFile(vhdlDirectory / fileName))
+				self.assertGreater(len(closeBlockTypes), 0)
+				self.assertEqual(set(closeBlockTypes), {closeBlockType})
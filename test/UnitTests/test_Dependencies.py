@@ -0,0 +1,105 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from unittest                     import TestCase
+
+from pyVHDLParser.Dependencies    import DependencyScanner
+from pyVHDLParser.DocumentModel   import Document
+from test.UnitTests               import vhdlDirectory, ReadFile
+
+
+CONTENT = """\
+library ieee, work;
+use     ieee.std_logic_1164.all;
+use     work.Utilities.Log2;
+
+entity Counter is
+	generic (BITS : positive := 16#10#);
+	port (Clock : in std_logic; Value : out std_logic_vector(BITS - 1 downto 0));
+end entity;
+
+architecture rtl of Counter is
+	package Fifo is new work.GenericFifo generic map (DEPTH => 4);
+	function Log2(x : natural) return natural is
+	begin
+		return x'length;
+	end function;
+begin
+	process (Clock)
+	begin
+		if rising_edge(Clock) and Clock'event then
+			wait;
+		end if;
+	end process;
+
+	reg : entity work.Register(rtl) port map (Clock => Clock);
+	cmp : component Adder port map (Clock);
+	inst : Multiplier;
+	gen : for i in 0 to 1.5e3 generate
+		sub : configuration work.SubConfig;
+	end generate;
+end architecture;
+
+package body Utilities is
+end package body;
+"""
+
+
+class DependencyScannerTest(TestCase):
+	def test_KnownAnswer(self):
+		summary = DependencyScanner.Scan(CONTENT)
+
+		self.assertIsNone(summary.Error)
+		self.assertEqual(summary.Libraries, ("ieee", "work"))
+		self.assertEqual(summary.Uses, (("ieee", "std_logic_1164", "ALL"), ("work", "Utilities", "Log2")))
+		self.assertEqual(summary.Entities, ("Counter",))
+		self.assertEqual(summary.Architectures, (("rtl", "Counter"),))
+		self.assertEqual(summary.PackageBodies, ("Utilities",))
+		self.assertEqual(summary.PackageInstances, (("Fifo", "work", "GenericFifo"),))
+		self.assertEqual(summary.EntityReferences, (("work", "Register", "rtl"),))
+		self.assertEqual(summary.ComponentInstances, ("Adder", "Multiplier"))
+		self.assertEqual(summary.ConfigurationReferences, (("work", "SubConfig"),))
+
+	def test_ObjectDeclarationIsNoInstance(self):
+		summary = DependencyScanner.Scan("architecture a of e is\nsignal x : y;\nbegin\nz : y;\nend;")
+		self.assertEqual(summary.ComponentInstances, ("y",))
+
+	def test_TokenizerErrorIsReported(self):
+		summary = DependencyScanner.Scan("entity e is\n/* unterminated")
+		self.assertEqual(summary.Entities, ("e",))
+		self.assertIn("TokenizerException", summary.Error)
+
+	def test_UsesAgreeWithTheDocumentModel(self):
+		path =      vhdlDirectory / "Use.vhdl"
+		document =  Document(path)
+		document.Parse()
+
+		summary =   DependencyScanner.Scan(ReadFile(path))
+		self.assertEqual(summary.Uses, tuple((use.Library, use.Package, use.Item) for use in document.Uses))
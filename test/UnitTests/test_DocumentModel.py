@@ -0,0 +1,148 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from contextlib                   import redirect_stdout
+from io                           import StringIO
+from pathlib                      import Path
+from unittest                     import TestCase
+
+from pyVHDLParser.Dependencies    import DependencyScanner
+from pyVHDLParser.DocumentModel   import Document
+from test.UnitTests               import vhdlDirectory, ReadFile
+
+
+def ParseDocument(fileName):
+	document = Document(vhdlDirectory / fileName)
+	document.Parse()
+	return document
+
+
+def ParseContent(content):
+	document = Document(Path("inline.vhdl"))
+	document.Parse(content)
+	return document
+
+
+def Interface(items):
+	return [(item.Name, item.Mode.name if hasattr(item, "Mode") else None, item.SubType, item.DefaultExpression) for item in items]
+
+
+class ReferenceClauseTest(TestCase):
+	def test_Libraries(self):
+		document = ParseDocument("Library.vhdl")
+		self.assertEqual([library.Library for library in document.Libraries], [
+			"library0", "library1", "library2", "library3", "library4", "library5", "library6", "library7",
+			"library81", "library82", "library91", "library92", "library101", "library102"
+		])
+		self.assertEqual([library.Library for library in document.Libraries], list(DependencyScanner.Scan(ReadFile(vhdlDirectory / "Library.vhdl")).Libraries))
+
+	def test_Uses(self):
+		document = ParseDocument("Use.vhdl")
+		self.assertEqual([(use.Library, use.Package, use.Item) for use in document.Uses], [
+			("lib0", "pkg0", "ALL"), ("lib1", "pkg1", "ALL"), ("lib2", "pkg2", "ALL"), ("lib3", "pkg3", "ALL"),
+			("lib4", "pkg4", "const4"), ("lib5", "pkg5", "const5"), ("lib61", "pkg61", "const61"), ("lib62", "pkg62", "const62"),
+			("lib7", "pkg7", "const71"), ("lib7", "pkg7", "const72"), ("lib8", "pkg8", "const81"), ("lib8", "pkg8", "const82"),
+			("lib9", "pkg9", "const91"), ("lib9", "pkg9", "const92")
+		])
+
+
+class DefaultExpressionTest(TestCase):
+	CONTENT = (
+		"entity e is\n"
+		"\tgeneric ( G : integer := 5; H : boolean := f(x) );\n"
+		"\tport ( clk : in bit := '0'; q : out bit );\n"
+		"end entity;\n"
+		"architecture a of e is\n"
+		"\tconstant c : string := \"ab\";\n"
+		"\tsignal s : bit;\n"
+		"begin\n"
+		"end architecture;\n"
+		"package p is\n"
+		"\tconstant k : integer := 5 + x;\n"
+		"end package;\n"
+	)
+
+	def test_InterfaceItems(self):
+		entity, = ParseContent(self.CONTENT).Entities
+		self.assertEqual(Interface(entity.GenericItems), [("G", None, "integer", "5"), ("H", None, "boolean", "f(x)")])
+		self.assertEqual(Interface(entity.PortItems), [("clk", "In", "bit", "'0'"), ("q", "Out", "bit", None)])
+
+	def test_Objects(self):
+		document = ParseContent(self.CONTENT)
+		self.assertEqual(Interface(document.Architectures[0].DeclaredItems), [("c", None, "string", "\"ab\""), ("s", None, "bit", None)])
+		self.assertEqual(Interface(document.Packages[0].DeclaredItems), [("k", None, "integer", "5 + x")])
+
+	def test_Files(self):
+		for fileName, prefix in (("GenericList.vhdl", "GEN"), ("PortList.vhdl", "PORT")):
+			with self.subTest(file=fileName):
+				document =  ParseDocument(fileName)
+				items =     [item for entity in document.Entities for item in (entity.GenericItems + entity.PortItems)]
+				self.assertEqual([(item.Name, item.DefaultExpression) for item in items], [
+					(prefix + "0", None), (prefix + "1", None), (prefix + "2", None), (prefix + "3", "8"), (prefix + "4", "true"),
+					(prefix + "5", "true"), (prefix + "6", "true"), (prefix + "7a", None), (prefix + "7b", None), (prefix + "7c", None),
+					(prefix + "8a", "8"), (prefix + "8b", "8"), (prefix + "8c", "8")
+				])
+
+	def test_Print(self):
+		output = StringIO()
+		with redirect_stdout(output):
+			ParseContent(self.CONTENT).Print()
+		self.assertNotIn("xxx", output.getvalue())
+		self.assertIn(" := 5 + x;", output.getvalue())
+
+
+class FunctionTest(TestCase):
+	def test_ParameterLists(self):
+		package, = ParseDocument("Function.vhdl").Packages
+		self.assertEqual([(function.Name, [item.Name for item in function.ParameterItems]) for function in package.DeclaredItems], [
+			("func0", []), ("func1", ["param0"]), ("func2", ["param0"]), ("func3", ["param0", "param1"])
+		])
+
+	def test_ParameterClasses(self):
+		package, = ParseContent("package p is\n\tfunction f(a : integer; variable b : integer; signal c : in bit) return integer;\nend package;\n").Packages
+		function, = package.DeclaredItems
+		self.assertEqual([item.__class__.__name__ for item in function.ParameterItems], [
+			"ParameterConstantInterfaceItem", "ParameterVariableInterfaceItem", "ParameterSignalInterfaceItem"
+		])
+		self.assertEqual(Interface(function.ParameterItems), [("a", "Default", "integer", None), ("b", "Default", "integer", None), ("c", "In", "bit", None)])
+
+
+class ProcessTest(TestCase):
+	def test_SensitivityLists(self):
+		architecture, = ParseContent(
+			"architecture a of e is\n"
+			"begin\n"
+			"\tprocess\n\tbegin\n\tend process;\n"
+			"\tprocess(all)\n\tbegin\n\tend process;\n"
+			"\tprocess (clock, reset) is\n\t\tconstant k : integer := 1;\n\tbegin\n\tend process;\n"
+			"end architecture;\n"
+		).Architectures
+		self.assertEqual([process.SensitivityList for process in architecture.BodyItems], [[], ["all"], ["clock", "reset"]])
+		self.assertEqual(Interface(architecture.BodyItems[2].DeclaredItems), [("k", None, "integer", "1")])
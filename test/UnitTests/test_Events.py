@@ -0,0 +1,125 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from contextlib                          import redirect_stdout
+from io                                  import StringIO
+from logging                             import getLogger, DEBUG, INFO, WARNING
+from logging.handlers                    import BufferingHandler
+from pathlib                             import Path
+from unittest                            import TestCase
+
+from pyVHDLParser.DocumentModel          import Document
+from pyVHDLParser.DocumentModel.Events   import DesignUnitFound, ClauseFound, ParseWarning, CountingEventSink, LoggingEventSink
+from test.UnitTests                      import vhdlDirectory
+
+
+FILES = ("Architecture.vhdl", "Entity.vhdl", "Library.vhdl", "Package.vhdl", "Use.vhdl")
+
+# a concurrent statement with an error, which is skipped by the error recovery
+RECOVERED = "use work.p.all;\nentity e is\nend entity;\narchitecture a of e is\n  signal s : bit;\nbegin\n  s <= ;\nend architecture;\n"
+
+
+def Parse(fileName, eventSink, recover=False):
+	document = Document(vhdlDirectory / fileName, recover=recover, eventSink=eventSink)
+	document.Parse()
+	return document
+
+
+class CountingEventSinkTest(TestCase):
+	def test_DesignUnitFound(self):
+		for fileName, nodeName, count in (("Entity.vhdl", "Entity", 26), ("Architecture.vhdl", "Architecture", 27), ("Package.vhdl", "Package", 25)):
+			with self.subTest(file=fileName):
+				sink = CountingEventSink()
+				Parse(fileName, sink)
+				self.assertEqual(sink.Counters, {("DesignUnitFound", nodeName): count})
+				self.assertEqual(sink[DesignUnitFound], count)
+				self.assertEqual(sink[ClauseFound], 0)
+
+	def test_ClauseFound(self):
+		for fileName, nodeName in (("Library.vhdl", "Library"), ("Use.vhdl", "Use")):
+			with self.subTest(file=fileName):
+				sink = CountingEventSink()
+				Parse(fileName, sink)
+				self.assertEqual(sink.Counters, {("ClauseFound", nodeName): 14})
+
+	def test_ParseWarning(self):
+		sink =      CountingEventSink()
+		document =  Document(Path("inline.vhdl"), recover=True, eventSink=sink)
+		document.Parse(RECOVERED)
+		self.assertEqual(sink[ParseWarning], 1)
+		self.assertEqual(sink[DesignUnitFound], 2)
+		self.assertEqual(sink[ClauseFound], 1)
+
+
+class StdoutTest(TestCase):
+	def test_ParsingIsSilent(self):
+		for eventSink in (None, CountingEventSink(), LoggingEventSink(getLogger("test.UnitTests.Events.Silent"))):
+			for fileName in FILES:
+				with self.subTest(file=fileName, eventSink=eventSink.__class__.__name__):
+					output = StringIO()
+					with redirect_stdout(output):
+						Parse(fileName, eventSink)
+					self.assertEqual(output.getvalue(), "")
+
+
+class LoggingEventSinkTest(TestCase):
+	def test_WritesToTheGivenLogger(self):
+		logger = getLogger("test.UnitTests.Events")
+		with self.assertLogs(logger, level=DEBUG) as logs:
+			Parse("Entity.vhdl", LoggingEventSink(logger))
+
+		self.assertEqual(len(logs.records), 26)
+		self.assertTrue(all(record.name == logger.name for record in logs.records))
+		self.assertTrue(all(record.levelno == DEBUG for record in logs.records))
+		self.assertEqual(logs.records[0].getMessage(), "{0!s}: DesignUnitFound Entity 'myEntity0'".format(vhdlDirectory / "Entity.vhdl"))
+
+	def test_Levels(self):
+		logger =    getLogger("test.UnitTests.Events.Levels")
+		document =  Document(Path("inline.vhdl"), recover=True, eventSink=LoggingEventSink(logger, level=INFO))
+		with self.assertLogs(logger, level=DEBUG) as logs:
+			document.Parse(RECOVERED)
+
+		self.assertEqual([record.levelno for record in logs.records].count(WARNING), 1)
+		self.assertEqual([record.levelno for record in logs.records].count(INFO), 3)
+
+	def test_DisabledLevelsAreSkipped(self):
+		logger =  getLogger("test.UnitTests.Events.Disabled")
+		handler = BufferingHandler(1000)
+		logger.addHandler(handler)
+		logger.setLevel(WARNING)
+		logger.propagate = False
+		try:
+			Parse("Entity.vhdl", LoggingEventSink(logger))
+			document = Document(Path("inline.vhdl"), recover=True, eventSink=LoggingEventSink(logger))
+			document.Parse(RECOVERED)
+		finally:
+			logger.removeHandler(handler)
+
+		self.assertEqual([record.levelno for record in handler.buffer], [WARNING])
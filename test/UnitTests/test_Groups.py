@@ -0,0 +1,90 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from unittest                         import TestCase
+
+from pyVHDLParser.Blocks              import TokenToBlockParser
+from pyVHDLParser.Groups              import BlockToGroupParser
+from pyVHDLParser.Groups.Comment      import CommentGroup
+from pyVHDLParser.Groups.DesignUnit   import ArchitectureGroup
+from pyVHDLParser.Token.Parser        import ScanningTokenizer
+from test.UnitTests                   import vhdlDirectory, ReadFile
+
+
+def ParseGroups(fileName, streaming=False):
+	content = ReadFile(vhdlDirectory / fileName)
+	return list(BlockToGroupParser.Transform(TokenToBlockParser.Transform(ScanningTokenizer.GetVHDLTokenizer(content)), streaming=streaming))
+
+
+def Start(group):
+	return group.StartBlock.StartToken.Start.Absolute
+
+
+class SubGroupsTest(TestCase):
+	FILES = ["Architecture.vhdl", "Entity.vhdl", "Package.vhdl", "Process.vhdl", "Use.vhdl"]
+
+	def test_SubGroupsPartitionTheGroupStream(self):
+		for fileName in self.FILES:
+			with self.subTest(file=fileName):
+				groups =    ParseGroups(fileName)
+				found =     []
+
+				def Walk(parent):
+					subGroups = list(parent.GetSubGroups())
+					self.assertEqual([Start(group) for group in subGroups], sorted(Start(group) for group in subGroups))
+					for group in subGroups:
+						found.append(group)
+						Walk(group)
+
+				# every group but the document start and end is a direct sub-group of exactly one group
+				Walk(groups[0])
+				self.assertEqual(sorted(map(id, found)), sorted(map(id, groups[1:-1])))
+
+	def test_FilterByGroupTypes(self):
+		document =  ParseGroups("Architecture.vhdl")[0]
+		subGroups = list(document.GetSubGroups())
+
+		self.assertEqual(list(document.GetSubGroups(ArchitectureGroup)), [group for group in subGroups if isinstance(group, ArchitectureGroup)])
+		expected =  [group for group in subGroups if isinstance(group, (ArchitectureGroup, CommentGroup))]
+		for groupTypes in ((ArchitectureGroup, CommentGroup), [ArchitectureGroup, CommentGroup], [CommentGroup, ArchitectureGroup]):
+			with self.subTest(groupTypes=groupTypes):
+				self.assertEqual(list(document.GetSubGroups(groupTypes)), expected)
+
+	def test_GetSubGroupAt(self):
+		document =  ParseGroups("Entity.vhdl")[0]
+		for group in document.GetSubGroups():
+			self.assertIs(document.GetSubGroupAt(Start(group)), group)
+		self.assertIsNone(document.GetSubGroupAt(0))
+
+	def test_StreamingRegistersNoSubGroups(self):
+		groups =    ParseGroups("Entity.vhdl", streaming=True)
+		document =  groups[0]
+		self.assertEqual(list(document.GetSubGroups()), [])
+		self.assertIsNone(document.GetSubGroupAt(Start(groups[1])))
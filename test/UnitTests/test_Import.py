@@ -0,0 +1,89 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from json                         import loads
+from subprocess                   import run, PIPE
+from sys                          import executable
+from unittest                     import TestCase
+
+from test.UnitTests               import rootDirectory, vhdlDirectory
+
+
+SCRIPT = """
+import sys, json
+from contextlib import redirect_stdout
+from io         import StringIO
+from pathlib    import Path
+
+def Loaded():
+	return {
+		"blocks":   sorted(name for name in sys.modules if name.startswith("pyVHDLParser.Blocks.")),
+		"groups":   sorted(name for name in sys.modules if name.startswith("pyVHDLParser.Groups.")),
+		"colorama": sorted(name for name in sys.modules if name.split(".")[0] == "colorama")
+	}
+
+stages = {}
+import pyVHDLParser.DocumentModel
+stages["import"] = Loaded()
+document = pyVHDLParser.DocumentModel.Document(Path(sys.argv[1]))
+document.Parse()
+stages["parse"] = Loaded()
+with redirect_stdout(StringIO()):
+	document.Print()
+stages["print"] = Loaded()
+print(json.dumps(stages))
+"""
+
+
+class LazyImportTest(TestCase):
+	"""Importing :mod:`pyVHDLParser.DocumentModel` must not load block, group or colorama modules until they are used."""
+
+	@classmethod
+	def setUpClass(cls):
+		process = run(
+			[executable, "-c", SCRIPT, str(vhdlDirectory / "Entity.vhdl")],
+			cwd=str(rootDirectory), stdout=PIPE, stderr=PIPE, universal_newlines=True, check=True
+		)
+		cls.stages = loads(process.stdout)
+
+	def test_ImportLoadsNoSubmodules(self):
+		loaded = self.stages["import"]
+		self.assertEqual(loaded["blocks"], [])
+		self.assertEqual(loaded["groups"], [])
+		self.assertEqual(loaded["colorama"], [])
+
+	def test_ParseLoadsBlocksAndGroups(self):
+		loaded = self.stages["parse"]
+		self.assertIn("pyVHDLParser.Blocks.Structural.Entity", loaded["blocks"])
+		self.assertIn("pyVHDLParser.Groups.DesignUnit", loaded["groups"])
+		self.assertEqual(loaded["colorama"], [])
+
+	def test_PrintLoadsColorama(self):
+		self.assertIn("colorama", self.stages["print"]["colorama"])
@@ -0,0 +1,91 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from tempfile                         import TemporaryDirectory
+from unittest                         import TestCase
+
+from pyVHDLParser.DocumentModel       import Document
+from pyVHDLParser.DocumentModel.Cache import ParseCache
+from test.UnitTests                   import vhdlDirectory, ReadFile
+
+
+def Summarize(document):
+	return (
+		[library.Library for library in document.Libraries],
+		[(use.Library, use.Package, use.Item) for use in document.Uses],
+		[entity.Name for entity in document.Entities],
+		[(architecture.Name, architecture.Entity) for architecture in document.Architectures],
+		[package.Name for package in document.Packages],
+		[packageBody.Name for packageBody in document.PackageBodies]
+	)
+
+
+class ParseCacheTest(TestCase):
+	FILES = ["Architecture.vhdl", "Entity.vhdl", "Library.vhdl", "Package.vhdl", "Use.vhdl"]
+
+	def setUp(self):
+		self._directory = TemporaryDirectory()
+		self._cache =     ParseCache(self._directory.name)
+
+	def tearDown(self):
+		self._directory.cleanup()
+
+	def test_HitRestoresTheParsedModel(self):
+		for fileName in self.FILES:
+			with self.subTest(file=fileName):
+				path =      vhdlDirectory / fileName
+				reference = Document(path)
+				reference.Parse()
+
+				miss =      Document(path, cache=self._cache)
+				miss.Parse()
+				hit =       Document(path, cache=self._cache)
+				hit.Parse()
+
+				self.assertIsNotNone(self._cache.Load(self._cache.GetKey(ReadFile(path))))
+				self.assertEqual(Summarize(miss), Summarize(reference))
+				self.assertEqual(Summarize(hit), Summarize(reference))
+
+	def test_KeyDependsOnContent(self):
+		self.assertEqual(self._cache.GetKey("entity e is end;"), self._cache.GetKey("entity e is end;"))
+		self.assertNotEqual(self._cache.GetKey("entity e is end;"), self._cache.GetKey("entity f is end;"))
+
+	def test_CorruptEntryIsAMiss(self):
+		content = "entity e is\nend entity;\n"
+		key =     self._cache.GetKey(content)
+		for data in (b"", b"garbage", b"\x80\x04K\x01."):    # empty, not a pickle, a pickled integer
+			with self.subTest(data=data):
+				(self._cache.Directory / (key + ".pickle")).write_bytes(data)
+				self.assertIsNone(self._cache.Load(key))
+
+				document = Document("e.vhdl", cache=self._cache)
+				document.Parse(content)
+				self.assertEqual([entity.Name for entity in document.Entities], ["e"])
+				self.assertIsNotNone(self._cache.Load(key))
@@ -0,0 +1,261 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from random                       import Random
+from unittest                     import TestCase
+
+from pyVHDLParser                 import StartOf, EndOf
+from pyVHDLParser.Base            import ParserException
+from pyVHDLParser.Blocks          import TokenToBlockParser
+from pyVHDLParser.Groups          import BlockToGroupParser
+from pyVHDLParser.PositionIndex   import PositionIndex
+from pyVHDLParser.Token.Parser    import TableDrivenTokenizer
+from test.UnitTests               import vhdlDirectory, ReadFile
+
+
+# files, whose block chains are sorted by start offset (the block parser emits overlapping blocks for Library.vhdl)
+FILES = ["Architecture.vhdl", "AssertStatement.vhdl", "Entity.vhdl", "Function.vhdl", "GenericList.vhdl", "Package.vhdl", "PortList.vhdl", "Process.vhdl", "Use.vhdl"]
+EDITS = [" ", "\n", "-- note\n", "x", "_1", "\n\n", "\t", ";", "a", ""]
+
+
+def ParseGroups(content):
+	"""Return the StartOfDocumentGroup of a fully parsed document."""
+	return list(BlockToGroupParser.Transform(TokenToBlockParser.Transform(TableDrivenTokenizer.GetVHDLTokenizer(content))))[0]
+
+
+def Nodes(firstNode, nextNode):
+	"""Return all nodes of a chain except start and end nodes."""
+	nodes = []
+	node =  firstNode
+	while (node is not None):
+		if (not isinstance(node, (StartOf, EndOf))):
+			nodes.append(node)
+		node = nextNode(node)
+	return nodes
+
+
+def Tokens(startToken):
+	return Nodes(startToken, lambda token: token.NextToken)
+
+
+def Blocks(startBlock):
+	return Nodes(startBlock, lambda block: block.NextBlock)
+
+
+def TokenRange(token):
+	return token.Start.Absolute, token.End.Absolute
+
+
+def BlockRange(block):
+	return block.StartToken.Start.Absolute, block.EndToken.End.Absolute
+
+
+def Groups(parentGroup):
+	"""Return all nested groups in document order; enclosing groups precede their sub-groups."""
+	groups = []
+	for group in parentGroup.GetSubGroups():
+		groups.append(group)
+		groups.extend(Groups(group))
+	return groups
+
+
+def GroupRange(group):
+	return group.StartBlock.StartToken.Start.Absolute, group.EndBlock.EndToken.End.Absolute
+
+
+def FindAt(nodes, getRange, offset):
+	"""Return the last node covering 'offset' by a linear search."""
+	found = None
+	for node in nodes:
+		start, end = getRange(node)
+		if (start <= offset <= end):
+			found = node
+	return found
+
+
+def CoverTable(nodes, getRange, length):
+	"""Return the last node covering each offset from 0 to 'length' + 1, as :func:`FindAt` would find it."""
+	table = [None] * (length + 2)
+	for node in nodes:
+		start, end = getRange(node)
+		table[start:end + 1] = [node] * (end + 1 - start)
+	return table
+
+
+def FindGroupsAt(parentGroup, offset):
+	"""Return the groups covering 'offset' from the outermost to the innermost one by a linear search on each level."""
+	groups =  []
+	group =   FindAt(parentGroup.GetSubGroups(), GroupRange, offset)
+	while (group is not None):
+		groups.append(group)
+		group = FindAt(group.GetSubGroups(), GroupRange, offset)
+	return groups
+
+
+def FindInRange(nodes, getRange, start, end):
+	"""Return all nodes overlapping the range from 'start' to 'end' (inclusive) by a linear search."""
+	return [node for node in nodes if ((getRange(node)[0] <= end) and (getRange(node)[1] >= start))]
+
+
+class LookupTest(TestCase):
+	def test_FindAtEachOffset(self):
+		for fileName in FILES:
+			with self.subTest(file=fileName):
+				content =     ReadFile(vhdlDirectory / fileName)
+				startGroup =  ParseGroups(content)
+				index =       PositionIndex.FromGroup(startGroup)
+				tokenTable =  CoverTable(Tokens(startGroup.StartBlock.StartToken), TokenRange, len(content))
+				blockTable =  CoverTable(Blocks(startGroup.StartBlock), BlockRange, len(content))
+
+				# offset 0 lies in front of the document, len(content) is the last character
+				for offset in range(0, len(content) + 2):
+					nodes = index.FindAt(offset)
+					self.assertIs(nodes.Token, tokenTable[offset], offset)
+					self.assertIs(nodes.Block, blockTable[offset], offset)
+
+					# sibling groups may share their boundary offset, then the later one encloses the deeper groups
+					groups = FindGroupsAt(startGroup, offset)
+					self.assertEqual(nodes.Groups, groups, offset)
+					self.assertIs(nodes.Group, groups[-1] if groups else None)
+
+	def test_DocumentBoundaries(self):
+		content =     ReadFile(vhdlDirectory / "Entity.vhdl")
+		startGroup =  ParseGroups(content)
+		index =       PositionIndex.FromGroup(startGroup)
+		tokens =      Tokens(startGroup.StartBlock.StartToken)
+		blocks =      Blocks(startGroup.StartBlock)
+
+		self.assertIsNone(index.FindTokenAt(0))
+		self.assertIsNone(index.FindBlockAt(0))
+		self.assertEqual(index.FindGroupsAt(0), [])
+		self.assertIs(index.FindTokenAt(1), tokens[0])
+		self.assertIs(index.FindBlockAt(1), blocks[0])
+		self.assertIs(index.FindTokenAt(len(content)), tokens[-1])
+		self.assertIs(index.FindBlockAt(len(content)), blocks[-1])
+		self.assertIsNone(index.FindTokenAt(len(content) + 1))
+		self.assertIsNone(index.FindBlockAt(len(content) + 1))
+		self.assertEqual(index.FindTokensInRange(0, len(content) + 1), tokens)
+		self.assertEqual(index.FindBlocksInRange(0, len(content) + 1), blocks)
+
+	def test_OffsetsBetweenNodes(self):
+		# without trivia, the block chain has gaps at whitespace and comments
+		for fileName in FILES:
+			with self.subTest(file=fileName):
+				content =     ReadFile(vhdlDirectory / fileName)
+				startBlock =  list(TokenToBlockParser.Transform(TableDrivenTokenizer.GetVHDLTokenizer(content), trivia=False))[0]
+				index =       PositionIndex(startBlock=startBlock)
+				blocks =      Blocks(startBlock)
+				gaps =        0
+				for previousBlock, block in zip(blocks, blocks[1:]):
+					gapStart =  BlockRange(previousBlock)[1] + 1
+					gapEnd =    BlockRange(block)[0] - 1
+					if (gapStart <= gapEnd):
+						gaps += 1
+						for offset in range(gapStart, gapEnd + 1):
+							self.assertIsNone(index.FindBlockAt(offset), offset)
+						self.assertEqual(index.FindBlocksInRange(gapStart, gapEnd), [])
+						surrounding = index.FindBlocksInRange(gapStart - 1, gapEnd + 1)
+						self.assertEqual(surrounding, FindInRange(blocks, BlockRange, gapStart - 1, gapEnd + 1))
+						self.assertEqual(surrounding[-2:], [previousBlock, block])
+
+				self.assertGreater(gaps, 0)
+
+	def test_FindRangeOverlappingGroups(self):
+		random = Random(21)
+		for fileName in FILES:
+			with self.subTest(file=fileName):
+				content =     ReadFile(vhdlDirectory / fileName)
+				startGroup =  ParseGroups(content)
+				index =       PositionIndex.FromGroup(startGroup)
+				tokens =      Tokens(startGroup.StartBlock.StartToken)
+				blocks =      Blocks(startGroup.StartBlock)
+				groups =      Groups(startGroup)
+
+				for _ in range(50):
+					start = random.randint(0, len(content) + 1)
+					end =   random.randint(start, len(content) + 1)
+					foundTokens, foundBlocks, foundGroups = index.FindRange(start, end)
+					self.assertEqual(foundTokens, FindInRange(tokens, TokenRange, start, end), (start, end))
+					self.assertEqual(foundBlocks, FindInRange(blocks, BlockRange, start, end), (start, end))
+					self.assertEqual(foundGroups, FindInRange(groups, GroupRange, start, end), (start, end))
+
+
+class SpliceTest(TestCase):
+	def assertIndexEqual(self, index, reference, length):
+		for offset in range(0, length + 2):
+			self.assertIs(index.FindTokenAt(offset), reference.FindTokenAt(offset), offset)
+			self.assertIs(index.FindBlockAt(offset), reference.FindBlockAt(offset), offset)
+		self.assertEqual(index.FindTokensInRange(0, length + 1), reference.FindTokensInRange(0, length + 1))
+		self.assertEqual(index.FindBlocksInRange(0, length + 1), reference.FindBlocksInRange(0, length + 1))
+
+	def test_SpliceTokensAfterReTokenize(self):
+		random = Random(22)
+		for fileName in FILES:
+			with self.subTest(file=fileName):
+				content =     ReadFile(vhdlDirectory / fileName)
+				startToken =  list(TableDrivenTokenizer.GetVHDLTokenizer(content))[0]
+				index =       PositionIndex(startToken)
+				for _ in range(10):
+					offset =        random.randint(0, len(content))
+					removedLength = min(random.choice((0, 0, 1, 3)), len(content) - offset)
+					insertedText =  random.choice(EDITS)
+					content =       content[:offset] + insertedText + content[offset + removedLength:]
+
+					before, after = TableDrivenTokenizer.ReTokenize(startToken, content, offset, removedLength, insertedText)
+					index.SpliceTokens(before, after)
+					self.assertIndexEqual(index, PositionIndex(startToken), len(content))
+
+	def test_SpliceBlocksAfterReParse(self):
+		random = Random(23)
+		for fileName in FILES:
+			with self.subTest(file=fileName):
+				content =     ReadFile(vhdlDirectory / fileName)
+				startBlock =  list(TokenToBlockParser.Transform(TableDrivenTokenizer.GetVHDLTokenizer(content)))[0]
+				index =       PositionIndex(startBlock.StartToken, startBlock)
+				edits =       0
+				for _ in range(20):
+					offset =        random.randint(0, len(content))
+					removedLength = min(random.choice((0, 0, 1, 2)), len(content) - offset)
+					insertedText =  random.choice(EDITS)
+					newContent =    content[:offset] + insertedText + content[offset + removedLength:]
+
+					# only edits, which keep the document parsable, can be re-parsed
+					try:
+						list(TokenToBlockParser.Transform(TableDrivenTokenizer.GetVHDLTokenizer(newContent)))
+					except ParserException:
+						continue
+
+					newBlocks = list(TokenToBlockParser.ReParse(startBlock, newContent, offset, removedLength, insertedText))
+					index.SpliceBlocks(newBlocks[0].PreviousBlock, newBlocks[-1].NextBlock)
+					self.assertIndexEqual(index, PositionIndex(startBlock.StartToken, startBlock), len(newContent))
+					content = newContent
+					edits +=  1
+
+				self.assertGreater(edits, 0)
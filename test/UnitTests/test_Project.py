@@ -0,0 +1,116 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from unittest                           import TestCase
+
+from pyVHDLParser.DocumentModel         import Document
+from pyVHDLParser.DocumentModel.Project import Project
+
+
+UTILITIES = """\
+use work.Utils.all;
+use work.Utils.Log2;
+
+package Utils is
+	constant WIDTH : integer := 8;
+	function Log2(x : integer) return integer;
+	function Log2(x : natural) return natural;
+end package;
+
+package body Utils is
+end package body;
+"""
+
+COUNTER = """\
+entity Counter is
+end entity;
+
+architecture rtl of Counter is
+begin
+end architecture;
+"""
+
+
+def ParseDocument(filePath, content):
+	document = Document(filePath)
+	document.Parse(content)
+	return document
+
+
+class ProjectTest(TestCase):
+	def setUp(self):
+		self.project =    Project()
+		self.utilities =  ParseDocument("utilities.vhdl", UTILITIES)
+		self.counter =    ParseDocument("counter.vhdl", COUNTER)
+		self.lib =        self.project.AddDocument(self.utilities, "Lib")
+		self.work =       self.project.AddDocument(self.counter)
+
+	def test_Lookups(self):
+		self.assertIs(self.project.GetLibrary("LIB"), self.lib)
+		self.assertEqual(sorted(library.Name for library in self.project.Libraries), ["Lib", "work"])
+		self.assertIs(self.project.GetPackage("lib", "UTILS"), self.utilities.Packages[0])
+		self.assertIs(self.project.GetPackageBody("Lib", "utils"), self.utilities.PackageBodies[0])
+		self.assertIs(self.project.GetEntity("work", "counter"), self.counter.Entities[0])
+		self.assertIs(self.project.GetArchitecture("Work", "Counter", "RTL"), self.counter.Architectures[0])
+		self.assertIsNone(self.project.GetEntity("lib", "Counter"))
+		self.assertIsNone(self.project.GetPackage("unknown", "Utils"))
+		self.assertEqual([item.Name for item in self.project.GetDeclarations("lib", "utils", "width")], ["WIDTH"])
+		self.assertEqual(len(self.project.GetDeclarations("lib", "utils", "log2")), 2)
+
+	def test_WorkAliasAndResolveUse(self):
+		self.assertIsNone(self.project.GetPackage("work", "Utils"))
+		self.assertIs(self.project.GetPackage("work", "Utils", currentLibrary=self.lib), self.utilities.Packages[0])
+
+		useAll, useLog2 = self.utilities.Uses
+		self.assertIs(self.project.ResolveUse(useAll, self.lib), self.utilities.Packages[0])
+		self.assertEqual(self.project.ResolveUse(useLog2, self.lib), self.utilities.Packages[0].DeclaredItems[1:])
+		self.assertEqual(self.project.ResolveUse(useLog2), [])
+
+	def test_ReplaceAndRemoveDocument(self):
+		changed = ParseDocument("utilities.vhdl", UTILITIES.replace("constant WIDTH", "constant DEPTH"))
+		self.assertIs(self.project.AddDocument(changed, "lib"), self.lib)
+		self.assertEqual(self.project.Documents, [self.counter, changed])
+		self.assertIs(self.project.GetPackage("lib", "Utils"), changed.Packages[0])
+		self.assertEqual(self.project.GetDeclarations("lib", "Utils", "WIDTH"), [])
+		self.assertEqual(len(self.project.GetDeclarations("lib", "Utils", "DEPTH")), 1)
+		self.assertEqual(len(self.project.GetDeclarations("lib", "Utils", "Log2")), 2)
+
+		self.assertIs(self.project.RemoveDocument("utilities.vhdl"), changed)
+		self.assertIsNone(self.project.RemoveDocument("utilities.vhdl"))
+		self.assertIsNone(self.project.GetPackage("lib", "Utils"))
+		self.assertEqual(self.project.GetDeclarations("lib", "Utils", "Log2"), [])
+		self.assertIs(self.project.GetEntity("work", "Counter"), self.counter.Entities[0])
+
+	def test_UnitOfAnotherDocumentIsKeptOnRemoval(self):
+		# a unit replaced by another document isn't removed with its original document
+		copy = ParseDocument("copy.vhdl", COUNTER)
+		self.project.AddDocument(copy)
+		self.project.RemoveDocument("counter.vhdl")
+		self.assertIs(self.project.GetEntity("work", "Counter"), copy.Entities[0])
@@ -0,0 +1,77 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from random                     import Random
+from unittest                   import TestCase
+
+from pyVHDLParser.Base          import ParserException
+from pyVHDLParser.Blocks        import TokenToBlockParser
+from pyVHDLParser.Token.Parser  import TableDrivenTokenizer
+from test.UnitTests             import vhdlDirectory, ReadFile, DumpTokens, DumpBlocks
+
+
+FILES = ["Architecture.vhdl", "AssertStatement.vhdl", "Entity.vhdl", "Package.vhdl", "Process.vhdl", "Use.vhdl"]
+EDITS = [" ", "\n", "-- note\n", "x", "_1", "\n\n", "\t", ";", "a", ""]
+
+
+def Parse(content, checkpointInterval):
+	"""Return the StartOfDocumentBlock of a fully parsed block chain."""
+	blocks = list(TokenToBlockParser.Transform(TableDrivenTokenizer.GetVHDLTokenizer(content), checkpointInterval=checkpointInterval))
+	return blocks[0]
+
+
+class ReParse(TestCase):
+	def test_EditsMatchFreshParse(self):
+		random = Random(12)
+		for fileName in FILES:
+			for checkpointInterval in (1, 5, 64):
+				with self.subTest(file=fileName, checkpointInterval=checkpointInterval):
+					content =     ReadFile(vhdlDirectory / fileName)
+					startBlock =  Parse(content, checkpointInterval)
+					edits =       0
+					for _ in range(40):
+						offset =        random.randint(0, len(content))
+						removedLength = min(random.choice((0, 0, 1, 2)), len(content) - offset)
+						insertedText =  random.choice(EDITS)
+						newContent =    content[:offset] + insertedText + content[offset + removedLength:]
+
+						# only edits, which keep the document parsable, can be compared
+						try:
+							reference = Parse(newContent, checkpointInterval)
+						except ParserException:
+							continue
+
+						list(TokenToBlockParser.ReParse(startBlock, newContent, offset, removedLength, insertedText, checkpointInterval=checkpointInterval))
+						self.assertEqual(DumpBlocks(startBlock), DumpBlocks(reference), "edit at {0} (-{1}, +{2!r})".format(offset, removedLength, insertedText))
+						self.assertEqual(DumpTokens(startBlock.StartToken), DumpTokens(reference.StartToken))
+						content = newContent
+						edits +=  1
+
+					self.assertGreater(edits, 0)
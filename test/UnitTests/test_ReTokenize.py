@@ -0,0 +1,70 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from random                     import Random
+from unittest                   import TestCase
+
+from pyVHDLParser.Token.Parser  import TableDrivenTokenizer
+from test.UnitTests             import GetVHDLFiles, ReadFile, DumpTokens
+
+
+EDITS = [" ", "\n", "-- note\n", "x", "_1", "\n\n", "\t", ";", "(", "\r\n", ""]
+
+
+class ReTokenize(TestCase):
+	def _AssertEdit(self, startToken, content, offset, removedLength, insertedText):
+		newContent = content[:offset] + insertedText + content[offset + removedLength:]
+		TableDrivenTokenizer.ReTokenize(startToken, newContent, offset, removedLength, insertedText)
+		self.assertEqual(DumpTokens(startToken), DumpTokens(_Tokenize(newContent)), "edit at {0} (-{1}, +{2!r})".format(offset, removedLength, insertedText))
+		return newContent
+
+	def test_EditsMatchFreshTokenization(self):
+		random = Random(11)
+		for file in GetVHDLFiles():
+			with self.subTest(file=file.name):
+				content =     ReadFile(file)
+				startToken =  _Tokenize(content)
+				for _ in range(20):
+					offset =        random.randint(0, len(content))
+					removedLength = min(random.choice((0, 0, 1, 3)), len(content) - offset)
+					content =       self._AssertEdit(startToken, content, offset, removedLength, random.choice(EDITS))
+
+	def test_EditAtDocumentBoundaries(self):
+		content =     "entity e is\nend entity;\n"
+		startToken =  _Tokenize(content)
+		content =     self._AssertEdit(startToken, content, 0, 0, "library ieee;\n")
+		content =     self._AssertEdit(startToken, content, len(content), 0, "-- tail")
+		self._AssertEdit(startToken, content, 0, len(content), "")
+
+
+def _Tokenize(content):
+	"""Return the StartOfDocumentToken of a fully tokenized chain."""
+	tokens = list(TableDrivenTokenizer.GetVHDLTokenizer(content))
+	return tokens[0]
@@ -0,0 +1,90 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from unittest                     import TestCase
+
+from pyVHDLParser.Blocks          import TokenToBlockParser, SkipableBlock, ErrorBlock
+from pyVHDLParser.Token.Parser    import ScanningTokenizer
+from test.UnitTests               import vhdlDirectory, ReadFile, DumpBlock
+
+
+def Parse(content, recover):
+	return list(TokenToBlockParser.Transform(ScanningTokenizer.GetVHDLTokenizer(content), recover=recover))
+
+
+def Outline(blocks):
+	"""Return class name, start and end of all non-skipable blocks between the document start and end."""
+	return [(block.__class__.__name__, block.StartToken.Start.Absolute, block.EndToken.End.Absolute) for block in blocks[1:-1] if not isinstance(block, SkipableBlock)]
+
+
+class RecoveryTest(TestCase):
+	def test_ValidFilesAreUnchanged(self):
+		for fileName in ("Architecture.vhdl", "Entity.vhdl", "Package.vhdl", "Use.vhdl"):
+			with self.subTest(file=fileName):
+				content = ReadFile(vhdlDirectory / fileName)
+				self.assertEqual([DumpBlock(block) for block in Parse(content, True)], [DumpBlock(block) for block in Parse(content, False)])
+
+	def test_ResumeInRegion(self):
+		content = "entity e is\n  port (a : in bit;\n  foo bar baz;\nend entity;\n\nuse work.p.all;\narchitecture a of e is\n  signal s : bit;\nbegin\n  s <= ;\nend architecture;\n"
+		blocks =  Parse(content, True)
+		self.assertEqual(Outline(blocks), [
+			("NameBlock",                       1,  12),
+			("OpenBlock",                       15, 20),
+			("PortListInterfaceSignalBlock",    21, 31),
+			("ErrorBlock",                      35, 46),
+			("EndBlock",                        48, 58),
+			("StartBlock",                      61, 64),
+			("ReferenceNameBlock",              65, 75),
+			("EndBlock",                        75, 75),
+			("NameBlock",                       77, 99),
+			("SignalDeclarationBlock",          102, 116),
+			("SignalDeclarationEndMarkerBlock", 116, 116),
+			("BeginBlock",                      118, 123),
+			("ErrorBlock",                      126, 131),
+			("EndBlock",                        133, 149)
+		])
+		self.assertEqual([block.Message for block in blocks if isinstance(block, ErrorBlock)], [
+			"TokenParserException: Expected ':' after interface signal name.",
+			"TokenParserException: Expected one of these keywords: END, ASSERT, PROCESS. Found: 's'."
+		])
+
+	def test_ResyncAtUseClause(self):
+		blocks = Parse("entity e is\n  foo bar\nuse work.p.all;\nentity f is\nend entity;\n", True)
+		self.assertEqual([name for name, _, _ in Outline(blocks)], ["NameBlock", "ErrorBlock", "StartBlock", "ReferenceNameBlock", "EndBlock", "NameBlock", "EndBlock"])
+
+	def test_ConfigurationIsSkipped(self):
+		for content, errors in (
+			("entity e is\nend entity;\nconfiguration c of e is\nend configuration;\nentity f is\nend entity;\n", [(25, 66)]),
+			("entity e is\n  foo bar\nconfiguration c of e is\nend configuration;\nentity f is\nend entity;\n", [(15, 22), (23, 64)])
+		):
+			with self.subTest(content=content):
+				outline = Outline(Parse(content, True))
+				self.assertEqual([(start, end) for name, start, end in outline if (name == "ErrorBlock")], errors)
+				self.assertEqual(outline[-2:], [("NameBlock", errors[-1][1] + 2, errors[-1][1] + 13), ("EndBlock", errors[-1][1] + 14, errors[-1][1] + 24)])
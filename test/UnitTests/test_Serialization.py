@@ -0,0 +1,129 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from struct                       import calcsize
+from unittest                     import TestCase
+
+from pyVHDLParser.Blocks          import TokenToBlockParser
+from pyVHDLParser.Serialization   import StreamWriter, StreamReader, SerializationException, FORMAT_VERSION, _HEADER, _SECTION, _SECTIONS, _ALIGNMENT
+from pyVHDLParser.Token.Parser    import ScanningTokenizer
+from test.UnitTests               import vhdlDirectory, ReadFile, DumpTokens, DumpBlock
+
+
+class StreamRoundTrip(TestCase):
+	FILES = ["Architecture.vhdl", "Entity.vhdl", "Library.vhdl", "Package.vhdl", "Process.vhdl", "Use.vhdl"]
+
+	def _Write(self, content):
+		blocks = list(TokenToBlockParser.Transform(ScanningTokenizer.GetVHDLTokenizer(content)))
+		writer = StreamWriter()
+		writer.WriteChain(blocks[0].StartToken)
+		writer.WriteBlocks(blocks)
+		return blocks, writer.ToBytes()
+
+	def _RoundTrip(self, content):
+		blocks, data = self._Write(content)
+		return blocks, StreamReader(data)
+
+	def test_ReconstructedChainsMatchTheParse(self):
+		for fileName in self.FILES:
+			with self.subTest(file=fileName):
+				blocks, reader =  self._RoundTrip(ReadFile(vhdlDirectory / fileName))
+				tokens =          reader.GetTokens()
+				newBlocks =       reader.GetBlocks()
+
+				self.assertEqual(DumpTokens(tokens[0]), DumpTokens(blocks[0].StartToken))
+				self.assertEqual([DumpBlock(block) for block in newBlocks], [DumpBlock(block) for block in blocks])
+
+	def test_ViewsMatchTheParse(self):
+		blocks, reader =  self._RoundTrip(ReadFile(vhdlDirectory / "Entity.vhdl"))
+
+		token = blocks[0].StartToken
+		for view in reader.IterateTokenViews():
+			self.assertIs(view.Kind, token.__class__)
+			self.assertEqual(view.Value, getattr(token, "Value", None))
+			self.assertEqual(str(view.Start), str(token.Start))
+			token = token.NextToken
+		self.assertIsNone(token)
+
+		for view, block in zip(reader.IterateBlockViews(), blocks):
+			self.assertIs(view.Kind, block.__class__)
+			self.assertEqual(view.MultiPart, block.MultiPart)
+
+	def test_RejectsForeignData(self):
+		with self.assertRaises(SerializationException):
+			StreamReader(b"XXXX" + bytes(16))
+
+	def _Sections(self, data):
+		"""Return offset, format character, item size and item count of all sections."""
+		sections =  []
+		offset =    _HEADER.size
+		for _ in _SECTIONS:
+			formatCharacter, itemSize, count = _SECTION.unpack_from(data, offset)
+			sections.append((offset, formatCharacter.decode("ascii"), itemSize, count))
+			offset += _SECTION.size + count * itemSize
+			offset += -offset % _ALIGNMENT
+		self.assertEqual(offset, len(data))
+		return sections
+
+	def test_FixedWidthLittleEndianLayout(self):
+		content =   ReadFile(vhdlDirectory / "Entity.vhdl")
+		_, data =   self._Write(content)
+		self.assertEqual(_HEADER.unpack_from(data, 0), (b"PVHS", FORMAT_VERSION, len(_SECTIONS), b"<"))
+
+		sections =  self._Sections(data)
+		names =     [name for name, _ in _SECTIONS]
+		self.assertEqual([(formatCharacter, itemSize) for _, formatCharacter, itemSize, _ in sections], [(formatCharacter, calcsize("<" + formatCharacter)) for _, formatCharacter in _SECTIONS])
+
+		# the document length and the end of the end of document token, which is stored as -1
+		offset, _, _, _ = sections[names.index("_document")]
+		self.assertEqual(int.from_bytes(data[offset + _SECTION.size:offset + _SECTION.size + 8], "little"), len(content))
+		offset, _, _, count = sections[names.index("TokenEnds")]
+		start =     offset + _SECTION.size + (count - 1) * 4
+		self.assertEqual(int.from_bytes(data[start:start + 4], "little", signed=True), -1)
+
+	def test_RejectsMismatchedHeaders(self):
+		_, data =         self._Write(ReadFile(vhdlDirectory / "Entity.vhdl"))
+		offset, _, _, _ = self._Sections(data)[1]
+
+		for name, patch in (
+			("version",     (4, (FORMAT_VERSION - 1).to_bytes(2, "little"))),
+			("byte order",  (8, b">")),
+			("format",      (offset, b"Q")),
+			("item size",   (offset + 1, b"\x08")),
+			("truncated",   None)
+		):
+			with self.subTest(mismatch=name):
+				if (patch is None):
+					broken = data[:offset + _SECTION.size + 2]
+				else:
+					position, value = patch
+					broken = data[:position] + value + data[position + len(value):]
+				with self.assertRaises(SerializationException):
+					StreamReader(broken)
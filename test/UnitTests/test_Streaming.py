@@ -0,0 +1,128 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from gc                           import collect
+from unittest                     import TestCase
+from weakref                      import ref
+
+from pyVHDLParser.Blocks          import TokenToBlockParser, EndOfDocumentBlock
+from pyVHDLParser.Groups          import BlockToGroupParser
+from pyVHDLParser.Token.Parser    import TableDrivenTokenizer
+from test.UnitTests               import vhdlDirectory, GetVHDLFiles, ReadFile, DumpBlock
+
+
+def DumpGroup(group):
+	"""Return type and block range of 'group' for comparison."""
+	return (
+		group.__class__.__name__,
+		None if (group.StartBlock is None) else DumpBlock(group.StartBlock),
+		None if (group.EndBlock is None) else DumpBlock(group.EndBlock)
+	)
+
+
+def Collect(generator, dump):
+	"""Return 'dump' of each node at the time it's yielded, followed by the exception ending the stream, if any."""
+	nodes = []
+	try:
+		for node in generator:
+			nodes.append(dump(node))
+	except Exception as ex:
+		nodes.append((ex.__class__.__name__, str(ex)))
+	return nodes
+
+
+def Blocks(content, streaming):
+	return TokenToBlockParser.Transform(TableDrivenTokenizer.GetVHDLTokenizer(content), streaming=streaming)
+
+
+def Groups(content, streaming):
+	return BlockToGroupParser.Transform(Blocks(content, streaming), streaming=streaming)
+
+
+class StreamingTest(TestCase):
+	def test_SameBlocks(self):
+		for file in GetVHDLFiles():
+			with self.subTest(file=file.name):
+				content = ReadFile(file)
+				self.assertEqual(Collect(Blocks(content, True), DumpBlock), Collect(Blocks(content, False), DumpBlock))
+
+	def test_SameGroups(self):
+		for file in GetVHDLFiles():
+			with self.subTest(file=file.name):
+				content = ReadFile(file)
+				self.assertEqual(Collect(Groups(content, True), DumpGroup), Collect(Groups(content, False), DumpGroup))
+
+	def test_ReleasedBlocksAreUnlinked(self):
+		content =       ReadFile(vhdlDirectory / "Architecture.vhdl")
+		blocks =        []
+		for block in Blocks(content, True):
+			blocks.append(block)
+			if isinstance(block, EndOfDocumentBlock):
+				# the end of document block isn't linked, so the last block is released
+				self.assertIsNone(blocks[-2].PreviousBlock)
+				self.assertIsNone(blocks[-3].NextBlock)
+				break
+			elif (len(blocks) < 3):
+				continue
+
+			# the predecessor of the yielded block stays linked, all blocks and tokens in front of it are unlinked
+			previousBlock = block.PreviousBlock
+			self.assertIs(previousBlock.NextBlock, block)
+			self.assertIsNone(previousBlock.PreviousBlock)
+			self.assertIsNone(blocks[-3].NextBlock)
+			self.assertIsNone(previousBlock.StartToken.PreviousToken)
+			for token in (blocks[-3].StartToken, blocks[-3].EndToken):
+				if (token is None):
+					continue
+				self.assertIsNone(token.PreviousToken)
+				self.assertIsNone(token.NextToken)
+
+	def AliveInFront(self, generator):
+		"""Return the largest number of nodes in front of the last two yielded nodes, which are still reachable."""
+		references =  []
+		alive =       0
+		for node in generator:
+			references.append(ref(node))
+			del node
+
+			if ((len(references) % 10) == 0):
+				collect()
+				alive = max(alive, sum(1 for reference in references[:-2] if (reference() is not None)))
+		return alive
+
+	def test_ReleasedNodesAreUnreachable(self):
+		content = ReadFile(vhdlDirectory / "Architecture.vhdl")
+
+		self.assertEqual(self.AliveInFront(Blocks(content, True)), 0)
+		self.assertGreater(self.AliveInFront(Blocks(content, False)), 100)
+
+		# the enclosing groups of the current group are kept by the parser
+		self.assertLess(self.AliveInFront(Groups(content, True)), 5)
+		self.assertGreater(self.AliveInFront(Groups(content, False)), 100)
@@ -0,0 +1,100 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from pickle                       import dumps, loads
+from unittest                     import TestCase
+
+from pyVHDLParser.Blocks          import TokenToBlockParser
+from pyVHDLParser.Token           import StringToken
+from pyVHDLParser.Token.Parser    import ScanningTokenizer
+from pyVHDLParser.Token.Store     import TokenStore, StoredToken
+from test.UnitTests               import vhdlDirectory, GetVHDLFiles, ReadFile, DumpToken, DumpBlock
+
+
+class TokenStoreTest(TestCase):
+	def test_ViewsMatchTheTokenizer(self):
+		for file in GetVHDLFiles():
+			with self.subTest(file=file.name):
+				content = ReadFile(file)
+				store =   TokenStore.FromTokens(ScanningTokenizer.GetVHDLTokenizer(content))
+				tokens =  list(ScanningTokenizer.GetVHDLTokenizer(content))
+
+				self.assertEqual(len(store), len(tokens))
+				self.assertEqual([DumpToken(token) for token in store], [DumpToken(token) for token in tokens])
+				self.assertEqual(DumpToken(store[-1]), DumpToken(tokens[-1]))
+				self.assertIs(store[1].PreviousToken, store[0])
+				self.assertIs(store[0].NextToken, store[1])
+
+	def test_LowerValueMatchesTheTokenizer(self):
+		content = "ENTITY MyEntity IS\nEND ENTITY;\n"
+		store =   TokenStore.FromTokens(ScanningTokenizer.GetVHDLTokenizer(content))
+		tokens =  list(ScanningTokenizer.GetVHDLTokenizer(content))
+		for stored, token in zip(store, tokens):
+			if isinstance(token, StringToken):
+				self.assertEqual(stored.LowerValue, token.LowerValue)
+
+	def test_ViewsAreInstancesOfTheTokenClass(self):
+		content = ReadFile(vhdlDirectory / "Entity.vhdl")
+		store =   TokenStore.FromTokens(ScanningTokenizer.GetVHDLTokenizer(content))
+		tokens =  list(ScanningTokenizer.GetVHDLTokenizer(content))
+		for stored, token in zip(store, tokens):
+			viewType = type(stored)
+			self.assertIs(viewType, stored.__class__)
+			self.assertTrue(issubclass(viewType, token.__class__))
+			self.assertTrue(issubclass(viewType, StoredToken))
+			self.assertEqual(viewType.__name__, token.__class__.__name__)
+			self.assertIs(viewType, StoredToken.GetViewType(token.__class__))
+
+	def test_Pickle(self):
+		content = ReadFile(vhdlDirectory / "Entity.vhdl")
+		store =   TokenStore.FromTokens(ScanningTokenizer.GetVHDLTokenizer(content))
+
+		copy =    loads(dumps(store))
+		self.assertEqual([DumpToken(token) for token in copy], [DumpToken(token) for token in store])
+
+		token =   loads(dumps(store[3]))
+		self.assertIs(type(token), type(store[3]))
+		self.assertEqual(DumpToken(token), DumpToken(store[3]))
+
+	def test_ExtendUnlinksTokens(self):
+		tokens =  list(ScanningTokenizer.GetVHDLTokenizer("entity e is end entity;"))
+		store =   TokenStore.FromTokens(tokens)
+		self.assertEqual(len(store), len(tokens))
+		self.assertTrue(all(token.PreviousToken is None for token in tokens))
+
+	def test_BlocksMatchAParseOfTheTokenizer(self):
+		for fileName in ("Architecture.vhdl", "Entity.vhdl", "Package.vhdl", "Process.vhdl", "Use.vhdl"):
+			with self.subTest(file=fileName):
+				content =   ReadFile(vhdlDirectory / fileName)
+				store =     TokenStore.FromTokens(ScanningTokenizer.GetVHDLTokenizer(content))
+				stored =    list(TokenToBlockParser.Transform(iter(store)))
+				reference = list(TokenToBlockParser.Transform(ScanningTokenizer.GetVHDLTokenizer(content)))
+
+				self.assertEqual([DumpBlock(block) for block in stored], [DumpBlock(block) for block in reference])
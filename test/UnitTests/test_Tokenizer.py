@@ -0,0 +1,198 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from pathlib                      import Path
+from tempfile                     import TemporaryDirectory
+from unittest                     import TestCase
+
+from pyVHDLParser.Token.Parser    import Tokenizer, TableDrivenTokenizer, ScanningTokenizer, TokenizerException
+
+from test.UnitTests               import GetVHDLFiles, ReadFile, DumpToken
+
+
+ENGINES = (Tokenizer, TableDrivenTokenizer, ScanningTokenizer)
+
+
+def Tokenize(engine, content):
+	"""Return type name, value and start offset of all tokens between the document start and end."""
+	return [(token.__class__.__name__, getattr(token, "Value", None), token.Start.Absolute) for token in list(engine.GetVHDLTokenizer(content))[1:-1]]
+
+
+def DumpAll(engine, content):
+	"""Return :func:`DumpToken` of all tokens, or the exception type and message if tokenization fails."""
+	return DumpGenerator(engine.GetVHDLTokenizer(content))
+
+
+def DumpGenerator(tokenizer):
+	"""Return :func:`DumpToken` of all tokens yielded by 'tokenizer', or the exception type and message if it fails."""
+	tokens = []
+	try:
+		for token in tokenizer:
+			tokens.append(DumpToken(token))
+	except TokenizerException as ex:
+		tokens.append((ex.__class__.__name__, str(ex)))
+	return tokens
+
+
+class EquivalenceTest(TestCase):
+	"""The table-driven engines must produce exactly the tokens of the reference :class:`Tokenizer`."""
+	ENGINES = (TableDrivenTokenizer, ScanningTokenizer)
+
+	SNIPPETS = (
+		"a '\n' ;",                           # apostrophe behind a character literal holding a line break
+		"x :='\n'\n'a';\r\n",
+		"c'length; t'('0'); f(x)'('a'); s'event and s = '1';",
+		"x := 16#FF_A#; y := 2#1010#e3; z := 8#7.1#E-2; w := 1.5e-3;",
+		"\\ext id\\ <= \\a\\\\b\\'high;",
+		"a; /* block */",
+		"a; /* block\n comment */",
+		"a; /* unterminated",
+		"a; -- line comment at end of input",
+		"a\r\nb\rc\n",
+		"(z)''';"
+	)
+
+	def assertEquivalent(self, content):
+		expected = DumpAll(Tokenizer, content)
+		for engine in self.ENGINES:
+			with self.subTest(engine=engine.__name__):
+				self.assertEqual(DumpAll(engine, content), expected)
+
+	def test_Files(self):
+		for file in GetVHDLFiles():
+			with self.subTest(file=file.name):
+				self.assertEquivalent(ReadFile(file))
+
+	def test_Snippets(self):
+		for content in self.SNIPPETS:
+			with self.subTest(content=content):
+				self.assertEquivalent(content)
+
+
+class AttributeTickTest(TestCase):
+	KNOWN_ANSWERS = {
+		"c'length;": [
+			("StringToken", "c", 1), ("CharacterToken", "'", 2), ("StringToken", "length", 3), ("CharacterToken", ";", 9)
+		],
+		"\\e\\'high;": [
+			("ExtendedIdentifier", "\\e\\", 1), ("CharacterToken", "'", 4), ("StringToken", "high", 5), ("CharacterToken", ";", 9)
+		],
+		"t'('0');": [
+			("StringToken", "t", 1), ("CharacterToken", "'", 2), ("CharacterToken", "(", 3), ("CharacterLiteralToken", "0", 4),
+			("CharacterToken", ")", 7), ("CharacterToken", ";", 8)
+		],
+		"f(x)'('a');": [
+			("StringToken", "f", 1), ("CharacterToken", "(", 2), ("StringToken", "x", 3), ("CharacterToken", ")", 4),
+			("CharacterToken", "'", 5), ("CharacterToken", "(", 6), ("CharacterLiteralToken", "a", 7), ("CharacterToken", ")", 10),
+			("CharacterToken", ";", 11)
+		],
+		"x := 'a' & ' ';": [
+			("StringToken", "x", 1), ("SpaceToken", " ", 2), ("FusedCharacterToken", ":=", 3), ("SpaceToken", " ", 5),
+			("CharacterLiteralToken", "a", 6), ("SpaceToken", " ", 9), ("CharacterToken", "&", 10), ("SpaceToken", " ", 11),
+			("CharacterLiteralToken", " ", 12), ("CharacterToken", ";", 15)
+		],
+		"s'event and s = '1';": [
+			("StringToken", "s", 1), ("CharacterToken", "'", 2), ("StringToken", "event", 3), ("SpaceToken", " ", 8),
+			("StringToken", "and", 9), ("SpaceToken", " ", 12), ("StringToken", "s", 13), ("SpaceToken", " ", 14),
+			("CharacterToken", "=", 15), ("SpaceToken", " ", 15), ("CharacterLiteralToken", "1", 17), ("CharacterToken", ";", 20)
+		]
+	}
+
+	def test_KnownAnswers(self):
+		for content, expected in self.KNOWN_ANSWERS.items():
+			for engine in ENGINES:
+				with self.subTest(content=content, engine=engine.__name__):
+					self.assertEqual(Tokenize(engine, content), expected)
+
+	def test_InvalidTicksRaise(self):
+		for content in ("(z)''';", "x'1;", "x' length;", "x'';"):
+			for engine in ENGINES:
+				with self.subTest(content=content, engine=engine.__name__):
+					with self.assertRaises(TokenizerException):
+						Tokenize(engine, content)
+
+
+class ChunkTest(TestCase):
+	"""Tokenizing a document in chunks of any size must produce exactly the tokens of tokenizing it as a whole string."""
+	ENGINES =     (TableDrivenTokenizer, ScanningTokenizer)
+	CHUNK_SIZES = (1, 2, 3, 7)
+
+	SNIPPETS = (
+		"a; -- line comment\nb <= c;\n",
+		"a; -- comment at end of input",
+		"a; /* block */ b;",
+		"a; /* block\r\n comment **/ b;",
+		"a; /* unterminated",
+		"x := 'a' & ' ' & '\n';",
+		"s <= \"string\" & \"\"\"\";",
+		"\\ext id\\ <= \\a\\\\b\\'high;",
+		"x := 16#FF_A#; y := 2#1010#e3; w := 1.5e-3;",
+		"a <= b; c := d; e => f; g /= h; i >= j; k ?= l;",
+		"a\r\nb\rc\n\r\n"
+	)
+
+	@staticmethod
+	def Split(content, chunkSize):
+		return [content[start:start + chunkSize] for start in range(0, len(content), chunkSize)]
+
+	def assertChunksEquivalent(self, content):
+		for engine in self.ENGINES:
+			expected = DumpAll(engine, content)
+			for chunkSize in self.CHUNK_SIZES:
+				with self.subTest(engine=engine.__name__, chunkSize=chunkSize):
+					self.assertEqual(DumpGenerator(engine.GetVHDLTokenizerFromChunks(self.Split(content, chunkSize))), expected)
+
+	def test_Snippets(self):
+		for content in self.SNIPPETS:
+			with self.subTest(content=content):
+				self.assertChunksEquivalent(content)
+
+	def test_Files(self):
+		for file in GetVHDLFiles():
+			with self.subTest(file=file.name):
+				self.assertChunksEquivalent(ReadFile(file))
+
+	def test_FromFile(self):
+		with TemporaryDirectory() as directory:
+			for content in self.SNIPPETS:
+				path = Path(directory) / "snippet.vhdl"
+				path.write_bytes(content.encode())
+				for engine in self.ENGINES:
+					expected = DumpAll(engine, path.read_text())
+					for chunkSize in self.CHUNK_SIZES:
+						with self.subTest(content=content, engine=engine.__name__, chunkSize=chunkSize):
+							self.assertEqual(DumpGenerator(engine.GetVHDLTokenizerFromFile(path, chunkSize)), expected)
+
+		for file in GetVHDLFiles():
+			for engine in self.ENGINES:
+				expected = DumpAll(engine, ReadFile(file))
+				for chunkSize in self.CHUNK_SIZES:
+					with self.subTest(file=file.name, engine=engine.__name__, chunkSize=chunkSize):
+						self.assertEqual(DumpGenerator(engine.GetVHDLTokenizerFromFile(file, chunkSize)), expected)
@@ -0,0 +1,66 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2007-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from unittest                     import TestCase
+
+from pyVHDLParser.Blocks          import TokenToBlockParser, SkipableBlock
+from pyVHDLParser.Token.Parser    import ScanningTokenizer
+from test.UnitTests               import vhdlDirectory, ReadFile, DumpBlock
+
+
+def SignificantBlocks(blocks):
+	"""Return type and start of all non-skipable blocks; the parts of a multi-part block split by comments are merged."""
+	result =        []
+	previousBlock = None
+	for block in blocks:
+		if isinstance(block, SkipableBlock):
+			continue
+		if not ((previousBlock is not None) and previousBlock.MultiPart and (previousBlock.__class__ is block.__class__)):
+			result.append(DumpBlock(block)[:2])
+		previousBlock = block
+	return result
+
+
+class SkipTriviaTest(TestCase):
+	FILES = ["Architecture.vhdl", "Entity.vhdl", "Package.vhdl", "Process.vhdl", "Use.vhdl"]
+
+	def test_SignificantBlocksMatchAFullParse(self):
+		for fileName in self.FILES:
+			with self.subTest(file=fileName):
+				content =   ReadFile(vhdlDirectory / fileName)
+				blocks =    list(TokenToBlockParser.Transform(ScanningTokenizer.GetVHDLTokenizer(content), trivia=False))
+				reference = list(TokenToBlockParser.Transform(ScanningTokenizer.GetVHDLTokenizer(content)))
+
+				self.assertEqual([block for block in blocks if isinstance(block, SkipableBlock)], [])
+				self.assertEqual(SignificantBlocks(blocks), SignificantBlocks(reference))
+
+				# the emitted blocks are linked without gaps
+				for previousBlock, block in zip(blocks[1:-1], blocks[2:-1]):
+					self.assertIs(previousBlock.NextBlock, block)